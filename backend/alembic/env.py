@@ -30,12 +30,22 @@ if config.config_file_name is not None:
 target_metadata = SQLModel.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """전문 검색용 컬럼/인덱스/FTS 테이블은 모델 밖(app/search.py)에서 관리"""
+    if reflected and compare_to is None and name and (
+            name in ("search_vector", "ix_publication_search_vector")
+            or name.startswith("publication_fts")):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -54,7 +64,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
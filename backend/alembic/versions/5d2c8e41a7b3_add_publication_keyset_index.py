@@ -0,0 +1,30 @@
+"""Add publication keyset index
+
+Revision ID: 5d2c8e41a7b3
+Revises: 20cb0d74bd09
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2c8e41a7b3'
+down_revision: Union[str, Sequence[str], None] = '20cb0d74bd09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (number, id) 내림차순 정렬과 키셋 페이지네이션용 인덱스
+    op.create_index('ix_publication_number_id', 'publication',
+                    ['number', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_publication_number_id', table_name='publication')
@@ -0,0 +1,44 @@
+"""Add publication full text search
+
+Revision ID: 8c4f1e9b2d67
+Revises: 5d2c8e41a7b3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4f1e9b2d67'
+down_revision: Union[str, Sequence[str], None] = '5d2c8e41a7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL 전용 - SQLite 는 앱 시작 시 FTS5 테이블을 만듦 (app/search.py)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # 제목(A) > 저자(B) > 저널(C) 가중치의 검색 벡터 (행 변경 시 자동 갱신)
+    op.execute("""
+        ALTER TABLE publication ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(authors, '')), 'B') ||
+            setweight(to_tsvector('simple', coalesce(journal, '')), 'C')
+        ) STORED
+    """)
+    op.create_index('ix_publication_search_vector', 'publication',
+                    ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_publication_search_vector', table_name='publication')
+    op.drop_column('publication', 'search_vector')
@@ -0,0 +1,64 @@
+"""Add image metadata columns
+
+Revision ID: a3c8e1f64d27
+Revises: e4a7c3f19b02
+Create Date: 2026-10-18 18:00:00.000000
+
+기존 이미지의 값은 ``python scripts/backfill_image_metadata.py`` 로 채웁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c8e1f64d27'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c3f19b02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IMAGE_TABLES = ('representativework', 'galleryimage', 'researchhighlight',
+                'coverart')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('uploadedfile',
+                  sa.Column('width', sa.Integer(), nullable=True))
+    op.add_column('uploadedfile',
+                  sa.Column('height', sa.Integer(), nullable=True))
+    op.add_column('uploadedfile',
+                  sa.Column('dominant_color',
+                            sqlmodel.sql.sqltypes.AutoString(),
+                            nullable=True))
+    op.add_column('uploadedfile',
+                  sa.Column('placeholder', sqlmodel.sql.sqltypes.AutoString(),
+                            nullable=True))
+    for table in IMAGE_TABLES:
+        op.add_column(table,
+                      sa.Column('image_width', sa.Integer(), nullable=True))
+        op.add_column(table,
+                      sa.Column('image_height', sa.Integer(), nullable=True))
+        op.add_column(table,
+                      sa.Column('image_color',
+                                sqlmodel.sql.sqltypes.AutoString(),
+                                nullable=True))
+        op.add_column(table,
+                      sa.Column('image_placeholder',
+                                sqlmodel.sql.sqltypes.AutoString(),
+                                nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in IMAGE_TABLES:
+        op.drop_column(table, 'image_placeholder')
+        op.drop_column(table, 'image_color')
+        op.drop_column(table, 'image_height')
+        op.drop_column(table, 'image_width')
+    op.drop_column('uploadedfile', 'placeholder')
+    op.drop_column('uploadedfile', 'dominant_color')
+    op.drop_column('uploadedfile', 'height')
+    op.drop_column('uploadedfile', 'width')
@@ -0,0 +1,98 @@
+"""Add filter and sort indexes
+
+Revision ID: b7e2a9c4d815
+Revises: 8c4f1e9b2d67
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2a9c4d815'
+down_revision: Union[str, Sequence[str], None] = '8c4f1e9b2d67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _partial(condition: str, sqlite_condition: str) -> dict:
+    """PostgreSQL 과 SQLite 의 불리언 비교 형태에 맞춘 부분 인덱스 조건"""
+    return {'postgresql_where': sa.text(condition),
+            'sqlite_where': sa.text(sqlite_condition)}
+
+
+def _active() -> dict:
+    return _partial('is_active', 'is_active = 1')
+
+
+# (인덱스 이름, 테이블, 컬럼, 옵션) - app/models.py 의 __table_args__ 와 동일
+INDEXES = [
+    ('ix_publication_year_number', 'publication',
+     ['year', 'number', 'id'], {}),
+    ('ix_publication_status_number', 'publication',
+     ['status', 'number', 'id'], {}),
+    ('ix_publication_journal_number', 'publication',
+     ['journal', 'number', 'id'], {}),
+    ('ix_publication_first_author_number', 'publication', ['number', 'id'],
+     _partial('is_first_author', 'is_first_author = 1')),
+    ('ix_publication_corresponding_number', 'publication', ['number', 'id'],
+     _partial('is_corresponding_author', 'is_corresponding_author = 1')),
+    ('ix_publication_equal_contribution_number', 'publication',
+     ['number', 'id'],
+     _partial('is_equal_contribution', 'is_equal_contribution = 1')),
+    ('ix_publication_coauthor_number', 'publication', ['number', 'id'],
+     _partial('NOT is_first_author AND NOT is_corresponding_author '
+              'AND NOT is_equal_contribution',
+              'is_first_author = 0 AND is_corresponding_author = 0 '
+              'AND is_equal_contribution = 0')),
+    ('ix_publication_stats', 'publication',
+     ['status', 'is_first_author', 'is_corresponding_author', 'id'], {}),
+    ('ix_publication_updated_at', 'publication', ['updated_at'], {}),
+    ('ix_award_year', 'award', ['year'], {}),
+    ('ix_conference_date', 'conference', ['date'], {}),
+    ('ix_media_date', 'media', ['date'], {}),
+    ('ix_representativework_order', 'representativework',
+     ['order_index'], {}),
+    ('ix_representativework_active_order', 'representativework',
+     ['order_index'], _active()),
+    ('ix_representativework_updated_at', 'representativework',
+     ['updated_at'], {}),
+    ('ix_researcharea_order', 'researcharea', ['order_index'], {}),
+    ('ix_researcharea_active_order', 'researcharea', ['order_index'],
+     _active()),
+    ('ix_researcharea_updated_at', 'researcharea', ['updated_at'], {}),
+    ('ix_researchhighlight_order', 'researchhighlight',
+     ['order_index', sa.text('id DESC')], {}),
+    ('ix_researchhighlight_active_order', 'researchhighlight',
+     ['order_index', sa.text('id DESC')], _active()),
+    ('ix_researchhighlight_updated_at', 'researchhighlight',
+     ['updated_at'], {}),
+    ('ix_coverart_order', 'coverart',
+     ['order_index', sa.text('id DESC')], {}),
+    ('ix_coverart_active_order', 'coverart',
+     ['order_index', sa.text('id DESC')], _active()),
+    ('ix_coverart_updated_at', 'coverart', ['updated_at'], {}),
+    ('ix_markdowncv_active_version', 'markdowncv', ['version'], _active()),
+    ('ix_markdowncv_version', 'markdowncv', ['version'], {}),
+    ('ix_markdowncv_updated_at', 'markdowncv', ['updated_at'], {}),
+    ('ix_cvprofile_active', 'cvprofile', ['id'], _active()),
+    ('ix_contactinfo_profile_order', 'contactinfo',
+     ['profile_id', 'order_index'], {}),
+    ('ix_cvsection_profile_order', 'cvsection',
+     ['profile_id', 'order_index'], {}),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns, options in INDEXES:
+        op.create_index(name, table, columns, unique=False, **options)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,90 @@
+"""Add markdown CV version history and active pointer
+
+Revision ID: c5f2d8a91e34
+Revises: a3c8e1f64d27
+Create Date: 2026-10-18 21:00:00.000000
+
+기존 문서의 현재 본문은 다음 수정 때 스냅샷으로 기록됩니다 (app/cv_history.py).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f2d8a91e34'
+down_revision: Union[str, Sequence[str], None] = 'a3c8e1f64d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+markdowncv = sa.table('markdowncv', sa.column('id', sa.Integer()),
+                      sa.column('version', sa.Integer()),
+                      sa.column('is_active', sa.Boolean()))
+activemarkdowncv = sa.table('activemarkdowncv', sa.column('id', sa.Integer()),
+                            sa.column('document_id', sa.Integer()),
+                            sa.column('updated_at', sa.DateTime()))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('markdowncvrevision',
+                    sa.Column('id', sa.Integer(), nullable=False),
+                    sa.Column('document_id', sa.Integer(), nullable=False),
+                    sa.Column('version', sa.Integer(), nullable=False),
+                    sa.Column('base_version', sa.Integer(), nullable=False),
+                    sa.Column('data', sa.LargeBinary(), nullable=False),
+                    sa.Column('size', sa.Integer(), nullable=False),
+                    sa.Column('sha256', sqlmodel.sql.sqltypes.AutoString(),
+                              nullable=False),
+                    sa.Column('created_at', sa.DateTime(), nullable=False),
+                    sa.ForeignKeyConstraint(['document_id'],
+                                            ['markdowncv.id'],
+                                            ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('id'))
+    op.create_index('ix_markdowncvrevision_document_version',
+                    'markdowncvrevision', ['document_id', 'version'],
+                    unique=True)
+    op.create_table('activemarkdowncv',
+                    sa.Column('id', sa.Integer(), autoincrement=False,
+                              nullable=False),
+                    sa.Column('document_id', sa.Integer(), nullable=True),
+                    sa.Column('updated_at', sa.DateTime(), nullable=False),
+                    sa.ForeignKeyConstraint(['document_id'],
+                                            ['markdowncv.id'],
+                                            ondelete='SET NULL'),
+                    sa.PrimaryKeyConstraint('id'))
+
+    # 활성 문서(여러 개면 가장 높은 버전)를 포인터로 옮김
+    active = sa.select(markdowncv.c.id) \
+        .where(markdowncv.c.is_active == sa.true()) \
+        .order_by(markdowncv.c.version.desc(), markdowncv.c.id.desc()) \
+        .limit(1).scalar_subquery()
+    op.execute(activemarkdowncv.insert().from_select(
+        ['id', 'document_id', 'updated_at'],
+        sa.select(sa.literal(1), active, sa.func.current_timestamp())))
+
+    op.drop_index('ix_markdowncv_active_version', table_name='markdowncv')
+    op.drop_index('ix_markdowncv_version', table_name='markdowncv')
+    op.drop_column('markdowncv', 'is_active')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('markdowncv',
+                  sa.Column('is_active', sa.Boolean(), nullable=False,
+                            server_default=sa.false()))
+    op.execute(markdowncv.update()
+               .where(markdowncv.c.id.in_(
+                   sa.select(activemarkdowncv.c.document_id)))
+               .values(is_active=True))
+    op.create_index('ix_markdowncv_version', 'markdowncv', ['version'],
+                    unique=False)
+    op.create_index('ix_markdowncv_active_version', 'markdowncv', ['version'],
+                    unique=False, postgresql_where=sa.text('is_active'),
+                    sqlite_where=sa.text('is_active = 1'))
+    op.drop_table('activemarkdowncv')
+    op.drop_index('ix_markdowncvrevision_document_version',
+                  table_name='markdowncvrevision')
+    op.drop_table('markdowncvrevision')
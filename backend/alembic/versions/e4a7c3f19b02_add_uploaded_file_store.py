@@ -0,0 +1,47 @@
+"""Add uploaded file store
+
+Revision ID: e4a7c3f19b02
+Revises: b7e2a9c4d815
+Create Date: 2026-10-18 16:00:00.000000
+
+기존 파일 등록과 참조 수 계산은 ``python scripts/dedupe_uploads.py`` 로 합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c3f19b02'
+down_revision: Union[str, Sequence[str], None] = 'b7e2a9c4d815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('uploadedfile',
+                    sa.Column('id', sa.Integer(), nullable=False),
+                    sa.Column('path', sqlmodel.sql.sqltypes.AutoString(),
+                              nullable=False),
+                    sa.Column('sha256', sqlmodel.sql.sqltypes.AutoString(),
+                              nullable=False),
+                    sa.Column('size', sa.Integer(), nullable=False),
+                    sa.Column('content_type',
+                              sqlmodel.sql.sqltypes.AutoString(),
+                              nullable=True),
+                    sa.Column('ref_count', sa.Integer(), nullable=False),
+                    sa.Column('created_at', sa.DateTime(), nullable=False),
+                    sa.Column('updated_at', sa.DateTime(), nullable=False),
+                    sa.PrimaryKeyConstraint('id'),
+                    sa.UniqueConstraint('path'))
+    op.create_index('ix_uploadedfile_sha256', 'uploadedfile', ['sha256'],
+                    unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_uploadedfile_sha256', table_name='uploadedfile')
+    op.drop_table('uploadedfile')
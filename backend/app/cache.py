@@ -0,0 +1,375 @@
+"""공개 GET 응답 캐시
+
+공개 조회 API 의 응답 바이트를 프로세스 메모리에 LRU 로 보관합니다.
+ETag 검증자도 함께 보관하여 조건부 요청에 304 로 답하고,
+저장 시점에 한 번 압축해 둔 gzip/br 본문을 Accept-Encoding 에 맞춰 전송합니다.
+캐시 미스 응답은 빠른 압축으로 먼저 보내고(약한 ETag), 저장용 압축과 저장은
+응답 후 백그라운드 작업에서 합니다. 캐시 대상이 아닌 응답(200 이 아니거나
+no-store)은 응답 시작 메시지에서 판단해 버퍼링 없이 그대로 흘려보냅니다.
+키는 경로 + 정렬된 쿼리 파라미터이며, 각 항목은 자신이 의존하는 테이블
+태그를 가집니다. 관리자 생성/수정/삭제 핸들러가 커밋 후
+``invalidate_cache(Model)`` 을 호출하면 해당 테이블에 의존하는 항목만
+즉시 제거됩니다.
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.compression import compress_fast, compress_variants, negotiate
+from app.conditional import (is_not_modified, make_etag,
+                             supports_fingerprint, table_fingerprint,
+                             variant_etag)
+from app.metrics import CACHE_BYTES, CACHE_EVENTS
+
+load_dotenv()
+
+# (경로 prefix, 의존 테이블) - 먼저 매칭되는 규칙이 사용됨
+CACHE_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("/api/publications/", ("publication",)),
+    ("/api/awards/", ("award",)),
+    ("/api/conferences/", ("conference",)),
+    ("/api/media/", ("media",)),
+    ("/api/cover-arts/", ("coverart",)),
+    ("/api/research-highlights/", ("researchhighlight",)),
+    ("/api/representative-works/", ("representativework",)),
+    ("/api/research-areas/", ("researcharea",)),
+    ("/api/bootstrap", ("researcharea", "representativework", "publication",
+                        "conference", "media", "coverart")),
+    ("/api/search/sitemap", ("researcharea", "representativework", "coverart",
+                             "publication", "researchhighlight")),
+)
+
+# 응답에서 그대로 보관/재전송할 헤더
+_STORED_HEADERS = {b"content-type", b"content-language", b"x-next-cursor"}
+
+
+@dataclass
+class CacheEntry:
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    tags: Tuple[str, ...]
+    rule: str
+    etag: Optional[bytes] = None
+    # 인코딩별로 미리 압축해 둔 본문 (gzip, br)
+    variants: Dict[str, bytes] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.monotonic)
+    hits: int = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(map(len, self.variants.values()))
+
+
+@dataclass
+class RuleStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class ResponseCache:
+    """크기 제한이 있는 LRU 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # 여러 워커로 실행할 때 다른 프로세스의 쓰기를 놓치는 시간의 상한
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self._generations: Dict[str, int] = {}
+        self._rule_stats: Dict[str, RuleStats] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _count(self, rule: str, event: str) -> None:
+        stats = self._rule_stats.get(rule)
+        if stats is None:
+            stats = self._rule_stats[rule] = RuleStats()
+        setattr(stats, event, getattr(stats, event) + 1)
+        CACHE_EVENTS.labels(rule=rule, event=event).inc()
+
+    def generation(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """태그별 무효화 세대 - 요청 처리 중 무효화가 있었는지 판별용"""
+        return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def get(self, key: str, rule: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None \
+                and time.monotonic() - entry.created_at > self.ttl:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._count(rule, "misses")
+                return None
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self._count(rule, "hits")
+            return entry
+
+    def set(self, key: str, entry: CacheEntry,
+        generation: Optional[Tuple[int, ...]] = None) -> bool:
+        if entry.size > self.max_bytes:
+            return False
+        with self._lock:
+            # 응답 생성 중에 관련 테이블이 변경되었다면 오래된 응답을 저장하지 않음
+            if generation is not None \
+                and generation != self.generation(entry.tags):
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._count(evicted.rule, "evictions")
+            CACHE_BYTES.set(self._bytes)
+            return True
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        CACHE_BYTES.set(self._bytes)
+
+    def invalidate(self, *tags: str) -> int:
+        """주어진 테이블 태그에 의존하는 항목을 모두 제거"""
+        tag_set = set(tags)
+        with self._lock:
+            for tag in tag_set:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+            stale = [key for key, entry in self._entries.items()
+                     if tag_set.intersection(entry.tags)]
+            for key in stale:
+                self._count(self._entries[key].rule, "invalidations")
+                self._remove(key)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            CACHE_BYTES.set(0)
+            for tag in self._generations:
+                self._generations[tag] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "rules": {rule: vars(stats).copy()
+                          for rule, stats in self._rule_stats.items()},
+                "items": [
+                    {"key": key, "bytes": entry.size, "hits": entry.hits,
+                     "age": round(time.monotonic() - entry.created_at, 3)}
+                    for key, entry in reversed(self._entries.items())
+                ],
+            }
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+response_cache = ResponseCache(
+    max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512")),
+    max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+    ttl=_env_float("RESPONSE_CACHE_TTL"),
+)
+
+
+def invalidate_cache(*models) -> int:
+    """모델(또는 테이블명)에 의존하는 캐시 응답을 무효화"""
+    tags = [m if isinstance(m, str) else m.__tablename__ for m in models]
+    return response_cache.invalidate(*tags)
+
+
+def match_rule(path: str) -> Optional[Tuple[str, Tuple[str, ...]]]:
+    for prefix, tags in CACHE_RULES:
+        if path.startswith(prefix) or path == prefix.rstrip("/"):
+            return prefix, tags
+    return None
+
+
+def cache_key(path: str, query_string: bytes) -> str:
+    if not query_string:
+        return path
+    params = sorted(parse_qsl(query_string.decode("latin-1"),
+                              keep_blank_values=True))
+    return f"{path}?{urlencode(params)}"
+
+
+class ResponseCacheMiddleware:
+    """CACHE_RULES 에 해당하는 GET 요청을 response_cache 로 응답하고,
+    If-None-Match 조건부 요청에는 304 로 응답"""
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache = response_cache):
+        self.app = app
+        self.cache = cache
+        # 키 -> 진행 중인 저장 작업 (작업 참조 유지 겸 중복 압축 방지)
+        self._storing: Dict[str, "asyncio.Task[None]"] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        matched = match_rule(scope["path"])
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        rule, tags = matched
+        key = cache_key(scope["path"], scope.get("query_string", b""))
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        accept_encoding = request_headers.get("accept-encoding")
+
+        entry = self.cache.get(key, rule)
+        if entry is not None:
+            if is_not_modified(if_none_match, entry.etag):
+                await self._send_not_modified(
+                    self._entry_etag(entry, accept_encoding), send)
+            else:
+                await self._send_entry(entry, send, b"HIT", accept_encoding)
+            return
+
+        generation = self.cache.generation(tags)
+        etag = None
+        if supports_fingerprint(tags):
+            # 라우터를 실행하기 전에 테이블 지문만으로 304 여부를 판단
+            # ("*" 는 리소스가 있는지 라우터가 확인해야 하므로 제외)
+            etag = make_etag(key, await table_fingerprint(tags))
+            if if_none_match is not None and if_none_match.strip() != "*" \
+                    and is_not_modified(if_none_match, etag):
+                await self._send_not_modified(etag, send)
+                return
+
+        start: Optional[Message] = None
+        cacheable = False
+        chunks: List[bytes] = []
+
+        async def capture(message: Message):
+            nonlocal start, cacheable
+            if message["type"] == "http.response.start":
+                start = message
+                cacheable = message["status"] == 200 and not any(
+                    name.lower() == b"cache-control" and b"no-store" in value
+                    for name, value in message.get("headers", []))
+                if not cacheable:
+                    await send(message)
+            elif not cacheable:
+                await send(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        if not cacheable:
+            return
+
+        body = b"".join(chunks)
+        entry = CacheEntry(
+            status=start["status"],
+            headers=[(name, value) for name, value in start.get("headers", [])
+                     if name.lower() in _STORED_HEADERS],
+            body=body,
+            tags=tags,
+            rule=rule,
+            # 지문을 쓸 수 없는 테이블은 본문 해시로 ETag 생성
+            etag=etag or make_etag(key, body),
+        )
+        self._store_later(key, entry, generation)
+
+        encoding, payload = await run_in_threadpool(
+            compress_fast, body, accept_encoding)
+        etag = variant_etag(entry.etag, encoding)
+        if encoding is not None:
+            # 빠른 압축 본문은 저장될 최고 압축률 본문과 바이트가 달라 강한
+            # ETag 를 같이 쓸 수 없음 - 약한 ETag (비교 시 W/ 는 무시되므로
+            # 이후 HIT 응답의 조건부 요청에도 그대로 304)
+            etag = b"W/" + etag
+        if is_not_modified(if_none_match, etag):
+            await self._send_not_modified(etag, send)
+        else:
+            await self._send_body(entry, payload, encoding, etag, send,
+                                  b"MISS")
+
+    def _store_later(self, key: str, entry: CacheEntry,
+        generation: Tuple[int, ...]) -> None:
+        """저장용 압축(최고 압축률)과 캐시 저장을 응답과 분리해 실행"""
+        if key in self._storing:
+            return  # 같은 키의 저장이 이미 진행 중
+
+        async def store():
+            entry.variants = await run_in_threadpool(compress_variants,
+                                                     entry.body)
+            self.cache.set(key, entry, generation)
+
+        task = asyncio.ensure_future(store())
+        self._storing[key] = task
+        task.add_done_callback(lambda _: self._storing.pop(key, None))
+
+    @staticmethod
+    def _validator_headers(
+        etag: Optional[bytes]) -> List[Tuple[bytes, bytes]]:
+        headers = [(b"cache-control", b"no-cache"),
+                   (b"vary", b"Accept-Encoding")]
+        if etag is not None:
+            headers.append((b"etag", etag))
+        return headers
+
+    @staticmethod
+    def _entry_etag(entry: CacheEntry,
+        accept_encoding: Optional[str]) -> Optional[bytes]:
+        if entry.etag is None:
+            return None
+        return variant_etag(entry.etag,
+                            negotiate(accept_encoding, entry.variants))
+
+    async def _send_not_modified(self, etag, send: Send):
+        await send({"type": "http.response.start", "status": 304,
+                    "headers": self._validator_headers(etag)})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _send_entry(self, entry: CacheEntry, send: Send, marker: bytes,
+        accept_encoding: Optional[str]):
+        encoding = negotiate(accept_encoding, entry.variants)
+        body = entry.variants[encoding] if encoding else entry.body
+        await self._send_body(entry, body, encoding,
+                              self._entry_etag(entry, accept_encoding), send,
+                              marker)
+
+    async def _send_body(self, entry: CacheEntry, body: bytes,
+        encoding: Optional[str], etag: Optional[bytes], send: Send,
+        marker: bytes):
+        headers = list(entry.headers)
+        headers.extend(self._validator_headers(etag))
+        if encoding:
+            headers.append((b"content-encoding", encoding.encode()))
+        headers.append((b"content-length", str(len(body)).encode()))
+        headers.append((b"x-cache", marker))
+        await send({"type": "http.response.start", "status": entry.status,
+                    "headers": headers})
+        await send({"type": "http.response.body", "body": body})
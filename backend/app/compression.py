@@ -0,0 +1,90 @@
+"""응답 압축 (gzip / brotli)
+
+캐시되는 응답은 저장 시점에 인코딩별로 한 번만 압축해 두고, 이후 요청에는
+Accept-Encoding 협상 결과에 맞는 바이트를 그대로 전송합니다.
+캐시 미스 응답은 저장용 압축을 기다리지 않도록 빠른 설정으로 따로 압축합니다.
+brotli 패키지가 없으면 gzip 만 사용합니다.
+"""
+import gzip
+import os
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+# 이보다 작은 응답은 압축하지 않음 (헤더 오버헤드가 더 큼)
+MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "512"))
+# 한 번만 압축하므로 최고 압축률 사용
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+# 캐시 미스 응답용 (첫 바이트 지연 우선)
+FAST_GZIP_LEVEL = 1
+FAST_BROTLI_QUALITY = 4
+
+# 선호 순서
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compress(body: bytes, encoding: str, fast: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(
+            body, quality=FAST_BROTLI_QUALITY if fast else BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(
+            body, compresslevel=FAST_GZIP_LEVEL if fast else GZIP_LEVEL,
+            mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def compress_variants(body: bytes) -> Dict[str, bytes]:
+    """지원하는 모든 인코딩으로 압축 (압축 효과가 없으면 제외)"""
+    if len(body) < MINIMUM_SIZE:
+        return {}
+    variants = {}
+    for encoding in SUPPORTED_ENCODINGS:
+        compressed = compress(body, encoding)
+        if len(compressed) < len(body):
+            variants[encoding] = compressed
+    return variants
+
+
+def compress_fast(body: bytes, accept_encoding: Optional[str]
+                  ) -> Tuple[Optional[str], bytes]:
+    """협상된 인코딩 하나만 빠른 설정으로 압축 -> (인코딩, 본문)"""
+    if len(body) < MINIMUM_SIZE:
+        return None, body
+    encoding = negotiate(accept_encoding, SUPPORTED_ENCODINGS)
+    if encoding is None:
+        return None, body
+    compressed = compress(body, encoding, fast=True)
+    if len(compressed) >= len(body):
+        return None, body
+    return encoding, compressed
+
+
+def negotiate(accept_encoding: Optional[str], available) -> Optional[str]:
+    """Accept-Encoding(q 값 포함)에서 사용 가능한 가장 선호되는 인코딩 선택"""
+    if not accept_encoding or not available:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        if encoding not in available:
+            continue
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
@@ -0,0 +1,111 @@
+"""ETag 조건부 GET 지원
+
+테이블별 변경 지문(행 수 + max(updated_at))으로 강한 ETag 를 만들기 때문에
+ORM 객체를 읽거나 응답을 직렬화하지 않고도 304 여부를 판단할 수 있습니다.
+updated_at 이 없는 테이블은 응답 본문 해시로 ETag 를 계산합니다.
+
+Last-Modified 는 보내지 않습니다. max(updated_at) 은 행을 삭제해도 바뀌지
+않아 If-Modified-Since 만으로는 삭제를 알아챌 수 없기 때문입니다 (ETag 는
+행 수가 바뀌므로 삭제도 반영).
+"""
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, literal, select, union_all
+from sqlmodel import SQLModel
+
+from app.database import async_engine
+
+# 변경 시각을 추적하는 컬럼이 있는 테이블
+TIMESTAMP_COLUMNS = {
+    "publication": "updated_at",
+    "coverart": "updated_at",
+    "researchhighlight": "updated_at",
+    "representativework": "updated_at",
+    "researcharea": "updated_at",
+}
+
+
+def _source_digest() -> str:
+    """배포된 코드가 바뀌면 응답 형태도 바뀔 수 있으므로 ETag 에 포함"""
+    digest = hashlib.sha1()
+    for path in sorted(Path(__file__).parent.rglob("*.py")):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+ETAG_SALT = _source_digest()
+
+
+def supports_fingerprint(tables: Iterable[str]) -> bool:
+    return all(table in TIMESTAMP_COLUMNS for table in tables)
+
+
+async def table_states(
+    tables: Iterable[str]) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    """테이블별 (행 수, 최종 수정 시각)을 한 번의 왕복으로 조회"""
+    statements = []
+    for name in tables:
+        table = SQLModel.metadata.tables[name]
+        column = table.c[TIMESTAMP_COLUMNS[name]]
+        statements.append(
+            select(literal(name), func.count(), func.max(column))
+            .select_from(table)
+        )
+    statement = statements[0] if len(statements) == 1 \
+        else union_all(*statements)
+
+    async with async_engine.connect() as connection:
+        rows = (await connection.execute(statement)).all()
+    return {name: (count, modified) for name, count, modified in rows}
+
+
+async def table_fingerprint(tables: Tuple[str, ...]) -> str:
+    """ETag 시드 - 테이블별 행 수와 최종 수정 시각"""
+    parts: List[str] = []
+    states = await table_states(tables)
+    for name, (count, modified) in sorted(states.items()):
+        parts.append(f"{name}:{count}:{modified.isoformat() if modified else ''}")
+    return "|".join(parts)
+
+
+def make_etag(key: str, seed) -> bytes:
+    digest = hashlib.sha1(ETAG_SALT.encode())
+    digest.update(key.encode())
+    digest.update(seed if isinstance(seed, bytes) else seed.encode())
+    return f'"{digest.hexdigest()[:20]}"'.encode()
+
+
+def variant_etag(etag: bytes, encoding: Optional[str]) -> bytes:
+    """압축 인코딩별로 구분되는 강한 ETag ("abc" -> "abc-br")"""
+    if encoding is None:
+        return etag
+    return etag[:-1] + b"-" + encoding.encode() + b'"'
+
+
+def _strip_variant(opaque: str) -> str:
+    for encoding in ("br", "gzip"):
+        suffix = f'-{encoding}"'
+        if opaque.endswith(suffix):
+            return opaque[:-len(suffix)] + '"'
+    return opaque
+
+
+def _etag_matches(if_none_match: str, etag: bytes) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _strip_variant(etag.decode().removeprefix("W/"))
+    for candidate in if_none_match.split(","):
+        if _strip_variant(candidate.strip().removeprefix("W/")) == opaque:
+            return True
+    return False
+
+
+def is_not_modified(if_none_match: Optional[str],
+    etag: Optional[bytes]) -> bool:
+    """If-None-Match 가 etag 와 일치하면 True"""
+    if if_none_match is None or etag is None:
+        return False
+    return _etag_matches(if_none_match, etag)
@@ -0,0 +1,195 @@
+"""마크다운 CV 버전 기록 (주기적 스냅샷 + 델타, zlib 압축)
+
+``markdowncv.content`` 에는 최신 본문만 두고, 내용이 바뀔 때마다
+``markdowncvrevision`` 에 그 버전을 한 행씩 추가합니다. 기록 크기는 문서 크기가
+아니라 수정한 양에 비례합니다.
+
+- 델타는 직전 버전 대비 줄 단위 변경 (그대로인 구간은 직전 버전의 줄 범위만 기록)
+- SNAPSHOT_INTERVAL 버전마다, 또는 델타가 전체 본문보다 크면 스냅샷을 저장해
+  어떤 버전이든 스냅샷 하나 + 델타 SNAPSHOT_INTERVAL - 1 개 이내로 복원
+- 기록을 시작하기 전에 만든 문서는 첫 수정 때 직전 본문을 스냅샷으로 먼저 남김
+- 직전 버전 기록의 해시가 직전 본문과 다르면(ORM 밖에서 수정 등) 델타 대신
+  스냅샷 저장
+- 활성 문서는 ``activemarkdowncv`` 한 행이 가리키므로 활성화는 한 행 갱신
+"""
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import ActiveMarkdownCV, MarkdownCV, MarkdownCVRevision
+from app.upload_store import INSERTS
+
+SNAPSHOT_INTERVAL = int(os.getenv("CV_SNAPSHOT_INTERVAL", "20"))
+COMPRESSION_LEVEL = 9
+# activemarkdowncv 의 유일한 행
+ACTIVE_ROW = 1
+
+_active = ActiveMarkdownCV.__table__
+
+
+def _lines(text: str) -> List[str]:
+    return text.splitlines(keepends=True)
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def encode_snapshot(text: str) -> bytes:
+    return zlib.compress(text.encode(), COMPRESSION_LEVEL)
+
+
+def encode_delta(old: str, new: str) -> bytes:
+    """old -> new 델타
+
+    압축 전 형식은 JSON 배열이고, [시작, 끝] 은 old 의 줄 범위를 복사,
+    문자열은 그대로 삽입합니다.
+    """
+    old_lines, new_lines = _lines(old), _lines(new)
+    operations = []
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            operations.append([i1, i2])
+        elif j2 > j1:
+            operations.append("".join(new_lines[j1:j2]))
+    encoded = json.dumps(operations, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(encoded.encode(), COMPRESSION_LEVEL)
+
+
+def apply_delta(old: str, delta: bytes) -> str:
+    old_lines = _lines(old)
+    parts = []
+    for operation in json.loads(zlib.decompress(delta)):
+        if isinstance(operation, str):
+            parts.append(operation)
+        else:
+            parts.extend(old_lines[operation[0]:operation[1]])
+    return "".join(parts)
+
+
+def _revision(document_id: int, version: int, base_version: int,
+              data: bytes, text: str) -> MarkdownCVRevision:
+    return MarkdownCVRevision(document_id=document_id, version=version,
+                              base_version=base_version, data=data,
+                              size=len(text.encode()), sha256=_digest(text))
+
+
+async def record_version(session: AsyncSession, document: MarkdownCV,
+                         previous: Optional[str] = None
+                         ) -> MarkdownCVRevision:
+    """document 의 현재 버전(content, version)을 기록 (커밋은 호출 측)
+
+    previous: 직전 버전 본문 (있으면 델타 후보)
+    """
+    content = document.content
+    base_version, data = document.version, encode_snapshot(content)
+    if previous is not None and document.version > 1:
+        prior_version = document.version - 1
+        prior = (await session.exec(
+            select(MarkdownCVRevision.base_version, MarkdownCVRevision.sha256)
+            .where(MarkdownCVRevision.document_id == document.id,
+                   MarkdownCVRevision.version == prior_version)
+        )).first()
+        if prior is None:
+            session.add(_revision(document.id, prior_version, prior_version,
+                                  encode_snapshot(previous), previous))
+            prior_base, prior_sha256 = prior_version, _digest(previous)
+        else:
+            prior_base, prior_sha256 = prior
+        if prior_sha256 == _digest(previous) and \
+                document.version - prior_base < SNAPSHOT_INTERVAL:
+            delta = encode_delta(previous, content)
+            if len(delta) < len(data):
+                base_version, data = prior_base, delta
+
+    revision = _revision(document.id, document.version, base_version, data,
+                         content)
+    session.add(revision)
+    return revision
+
+
+async def list_revisions(session: AsyncSession, document_id: int) -> list:
+    """버전 목록 (본문 없이 크기 정보만, 최신 버전부터)"""
+    statement = select(
+        MarkdownCVRevision.version,
+        MarkdownCVRevision.base_version,
+        MarkdownCVRevision.size,
+        func.length(MarkdownCVRevision.data).label("stored_size"),
+        MarkdownCVRevision.created_at,
+    ).where(MarkdownCVRevision.document_id == document_id) \
+        .order_by(MarkdownCVRevision.version.desc())
+    return (await session.exec(statement)).all()
+
+
+async def load_version(session: AsyncSession, document: MarkdownCV,
+                       version: int) -> Optional[str]:
+    """document 의 version 본문 (기록에 없으면 None)"""
+    if version == document.version:
+        return document.content
+
+    base = select(MarkdownCVRevision.base_version).where(
+        MarkdownCVRevision.document_id == document.id,
+        MarkdownCVRevision.version == version).scalar_subquery()
+    rows = (await session.exec(
+        select(MarkdownCVRevision.version, MarkdownCVRevision.data,
+               MarkdownCVRevision.sha256)
+        .where(MarkdownCVRevision.document_id == document.id,
+               MarkdownCVRevision.version >= base,
+               MarkdownCVRevision.version <= version)
+        .order_by(MarkdownCVRevision.version)
+    )).all()
+    if not rows:
+        return None
+
+    text = zlib.decompress(rows[0].data).decode()
+    for row in rows[1:]:
+        text = apply_delta(text, row.data)
+    if [row.version for row in rows] != \
+            list(range(rows[0].version, version + 1)) or \
+            _digest(text) != rows[-1].sha256:
+        raise HTTPException(
+            status_code=500,
+            detail=f"CV history for version {version} is corrupted")
+    return text
+
+
+async def delete_history(session: AsyncSession, document_id: int) -> None:
+    """문서를 지우기 전에 버전 기록과 활성 포인터 정리"""
+    await session.exec(delete(MarkdownCVRevision).where(
+        MarkdownCVRevision.document_id == document_id))
+    await session.exec(update(ActiveMarkdownCV).where(
+        ActiveMarkdownCV.document_id == document_id).values(
+        document_id=None, updated_at=datetime.utcnow()))
+
+
+async def active_document_id(session: AsyncSession) -> Optional[int]:
+    return (await session.exec(
+        select(ActiveMarkdownCV.document_id)
+        .where(ActiveMarkdownCV.id == ACTIVE_ROW))).first()
+
+
+async def get_active_document(session: AsyncSession) -> Optional[MarkdownCV]:
+    statement = select(MarkdownCV).join(
+        ActiveMarkdownCV, ActiveMarkdownCV.document_id == MarkdownCV.id) \
+        .where(ActiveMarkdownCV.id == ACTIVE_ROW)
+    return (await session.exec(statement)).first()
+
+
+async def set_active_document(session: AsyncSession,
+                              document_id: Optional[int]) -> None:
+    """활성 포인터 한 행만 갱신 (커밋은 호출 측)"""
+    values = {"document_id": document_id, "updated_at": datetime.utcnow()}
+    statement = INSERTS[session.bind.dialect.name](_active).values(
+        id=ACTIVE_ROW, **values)
+    await session.exec(statement.on_conflict_do_update(
+        index_elements=["id"], set_=values))
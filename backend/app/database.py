@@ -1,20 +1,51 @@
 import os
 
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import create_engine, SQLModel, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app import sql_logging
+from app.metrics import MeteredAsyncQueuePool, instrument_pool
+from app.search import install_search
+from app.upload_store import track_image_metadata, track_references
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL 환경 변수가 설정되지 않았습니다.")
 
-# SQLModel/SQLAlchemy 엔진 생성
+# 비동기 드라이버 매핑 (API 서버용)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    """동기 드라이버 URL 을 같은 DB 의 비동기 드라이버 URL 로 변환"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"비동기 드라이버를 지원하지 않는 데이터베이스: {backend}")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]) \
+        .render_as_string(hide_password=False)
+
+
+# SQLModel/SQLAlchemy 동기 엔진 (스크립트, 마이그레이션, 테이블 생성용)
 engine = create_engine(
     DATABASE_URL,
-    echo=True,  # SQL 쿼리 로깅 (개발 환경에서 유용)
     pool_pre_ping=True  # 연결 상태 확인
 )
+# SQL 로깅은 echo 대신 샘플링/느린 쿼리 기록으로 처리 (app/sql_logging.py)
+sql_logging.install(engine)
+
+# 콘텐츠 행이 업로드 파일을 가리키는 수를 flush 마다 갱신 (동기/비동기 세션 공통)
+track_references(Session)
+# 이미지 경로가 바뀐 행에 업로드 때 계산한 크기/대표 색/미리보기 복사
+track_image_metadata(Session)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(
@@ -25,20 +56,42 @@ SessionLocal = sessionmaker(
 )
 
 
+# API 서버용 비동기 엔진 - 동시 처리량은 스레드 수가 아니라 커넥션 풀 크기로 제한
+async_engine_options = {"pool_pre_ping": True,
+                        "poolclass": MeteredAsyncQueuePool}
+if make_url(DATABASE_URL).get_backend_name() != "sqlite":
+    async_engine_options.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    )
+async_engine = create_async_engine(async_database_url(DATABASE_URL),
+                                   **async_engine_options)
+sql_logging.install(async_engine.sync_engine)
+instrument_pool(async_engine.sync_engine)
+
+# 비동기 세션 팩토리 (커밋 후 속성 접근 시 암묵적 I/O 가 없도록 만료하지 않음)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
 # 테이블 생성 함수
 def create_db_and_tables():
     """데이터베이스 테이블을 생성합니다."""
     SQLModel.metadata.create_all(engine)
+    # 전문 검색 색인 (PostgreSQL tsvector 컬럼 / SQLite FTS5 테이블)
+    with engine.begin() as connection:
+        install_search(connection)
 
 
 # 데이터베이스 세션 의존성
-def get_db():
-    """FastAPI 의존성으로 사용할 데이터베이스 세션을 제공합니다."""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """FastAPI 의존성으로 사용할 비동기 데이터베이스 세션을 제공합니다."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # 데이터베이스 연결 테스트 함수
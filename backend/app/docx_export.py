@@ -0,0 +1,192 @@
+"""마크다운 -> DOCX 변환 (워커 프로세스에서 실행)
+
+Python-Markdown 으로 만든 HTML 을 lxml 로 읽어 python-docx 문서로 옮깁니다.
+워커가 가볍게 뜨도록 이 모듈은 app 의 다른 모듈을 import 하지 않습니다.
+
+- 제목(h1~h6), 문단, 목록(중첩 3단계까지), 인용, 코드 블록, 표
+- 굵게/기울임/취소선/인라인 코드/링크/줄바꿈
+- 이미지는 호출 측이 넘긴 로컬 파일(src -> 경로)만 넣고, 나머지는 대체 텍스트
+"""
+import io
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import markdown
+from docx import Document
+from docx.image.exceptions import UnrecognizedImageError
+from docx.opc.constants import RELATIONSHIP_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt, RGBColor
+from lxml import html as lxml_html
+
+MAX_IMAGE_WIDTH = Inches(6)
+CODE_FONT = "Consolas"
+LINK_COLOR = RGBColor(0x05, 0x63, 0xC1)
+
+_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_LISTS = {"ul": "List Bullet", "ol": "List Number"}
+
+
+class _Converter:
+    def __init__(self, document, images: Dict[str, str]):
+        self.document = document
+        self.images = images
+
+    # 인라인 ---------------------------------------------------------------
+
+    def run(self, paragraph, text: Optional[str], style: dict):
+        # 블록 사이의 개행은 버리고, 본문의 개행은 공백 (명시적 줄바꿈은 <br>)
+        if not text or (not text.strip() and "\n" in text):
+            return
+        run = paragraph.add_run(text.replace("\n", " "))
+        run.bold = style.get("bold") or None
+        run.italic = style.get("italic") or None
+        if style.get("strike"):
+            run.font.strike = True
+        if style.get("code"):
+            run.font.name = CODE_FONT
+        if style.get("link"):
+            run.font.color.rgb = LINK_COLOR
+            run.font.underline = True
+            self._wrap_hyperlink(paragraph, run, style["link"])
+
+    @staticmethod
+    def _wrap_hyperlink(paragraph, run, url: str):
+        """run 을 외부 링크(w:hyperlink)로 감쌈"""
+        r_id = paragraph.part.relate_to(url, RELATIONSHIP_TYPE.HYPERLINK,
+                                        is_external=True)
+        hyperlink = OxmlElement("w:hyperlink")
+        hyperlink.set(qn("r:id"), r_id)
+        run._r.addprevious(hyperlink)
+        hyperlink.append(run._r)
+
+    def picture(self, paragraph, element) -> bool:
+        src = (element.get("src") or "").strip()
+        path = self.images.get(src) or self.images.get(urlsplit(src).path)
+        if not path:
+            return False
+        try:
+            shape = paragraph.add_run().add_picture(path)
+        except (UnrecognizedImageError, OSError, ValueError):
+            return False
+        if shape.width > MAX_IMAGE_WIDTH:
+            shape.height = int(shape.height * MAX_IMAGE_WIDTH / shape.width)
+            shape.width = MAX_IMAGE_WIDTH
+        return True
+
+    def inline(self, paragraph, element, style: Optional[dict] = None):
+        """element 의 텍스트와 인라인 자식을 paragraph 에 추가"""
+        style = style or {}
+        self.run(paragraph, element.text, style)
+        for child in element:
+            if not isinstance(child.tag, str):  # 주석 등
+                self.run(paragraph, child.tail, style)
+                continue
+            tag = child.tag
+            if tag == "br":
+                paragraph.add_run().add_break()
+            elif tag == "img":
+                if not self.picture(paragraph, child):
+                    self.run(paragraph, child.get("alt"), style)
+            elif tag in _LISTS:
+                pass  # 목록 항목의 하위 목록은 list() 에서 처리
+            else:
+                if tag == "p" and paragraph.text:
+                    paragraph.add_run().add_break()  # 느슨한 목록의 문단
+                child_style = dict(style)
+                if tag in ("strong", "b"):
+                    child_style["bold"] = True
+                elif tag in ("em", "i"):
+                    child_style["italic"] = True
+                elif tag in ("del", "s", "strike"):
+                    child_style["strike"] = True
+                elif tag == "code":
+                    child_style["code"] = True
+                elif tag == "a":
+                    href = child.get("href") or ""
+                    if urlsplit(href).scheme in ("http", "https", "mailto"):
+                        child_style["link"] = href
+                self.inline(paragraph, child, child_style)
+            self.run(paragraph, child.tail, style)
+
+    # 블록 -----------------------------------------------------------------
+
+    def paragraph(self, style: Optional[str] = None):
+        return self.document.add_paragraph(style=style)
+
+    def list(self, element, depth: int = 0):
+        style = _LISTS[element.tag]
+        if depth:
+            style = f"{style} {min(depth + 1, 3)}"
+        for item in element.iterchildren("li"):
+            self.inline(self.paragraph(style), item)
+            for child in item.iterchildren(*_LISTS):
+                self.list(child, depth + 1)
+
+    def table(self, element):
+        rows = list(element.iter("tr"))
+        columns = max((len(row.findall("th")) + len(row.findall("td"))
+                       for row in rows), default=0)
+        if not rows or not columns:
+            return
+        table = self.document.add_table(rows=len(rows), cols=columns)
+        table.style = "Table Grid"
+        for row, tr in zip(table.rows, rows):
+            cells = [cell for cell in tr if cell.tag in ("th", "td")]
+            for cell, source in zip(row.cells, cells):
+                self.inline(cell.paragraphs[0], source,
+                            {"bold": source.tag == "th"})
+        self.paragraph()
+
+    def block(self, element, style: Optional[str] = None):
+        tag = element.tag
+        if not isinstance(tag, str):
+            return
+        if tag in _HEADINGS:
+            self.inline(self.document.add_heading(level=_HEADINGS[tag]),
+                        element)
+        elif tag in _LISTS:
+            self.list(element)
+        elif tag == "pre":
+            paragraph = self.paragraph(style)
+            run = paragraph.add_run(element.text_content().rstrip("\n"))
+            run.font.name = CODE_FONT
+            run.font.size = Pt(9)
+        elif tag == "blockquote":
+            self.children(element, "Quote")
+        elif tag == "table":
+            self.table(element)
+        elif tag == "hr":
+            self.paragraph()
+        elif tag in ("div", "section", "article"):
+            self.children(element, style)
+        else:
+            self.inline(self.paragraph(style), element)
+
+    def children(self, element, style: Optional[str] = None):
+        if (element.text or "").strip():
+            self.run(self.paragraph(style), element.text.strip(), {})
+        for child in element:
+            self.block(child, style)
+            if (child.tail or "").strip():
+                self.run(self.paragraph(style), child.tail.strip(), {})
+
+
+def build_docx(title: str, text: str,
+               images: Optional[Dict[str, str]] = None) -> bytes:
+    """마크다운 본문을 DOCX 바이트로 변환
+
+    images: 본문 이미지 src -> 로컬 파일 경로 (없는 이미지는 대체 텍스트)
+    """
+    body = markdown.markdown(
+        text or "", extensions=["tables", "fenced_code", "sane_lists"])
+    document = Document()
+    document.core_properties.title = title
+    converter = _Converter(document, images or {})
+    if body.strip():
+        converter.children(
+            lxml_html.fragment_fromstring(body, create_parent="div"))
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
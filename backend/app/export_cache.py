@@ -0,0 +1,112 @@
+"""CV 내보내기(DOCX) 디스크 캐시
+
+문서 생성은 워커 프로세스(app/workers.py)에서 한 번만 하고, 결과 파일을
+``<종류>-<id>-<버전>-<내용 해시>.docx`` 로 저장해 이후 요청은 디스크에서 바로
+스트리밍합니다.
+
+- 키에 버전(MarkdownCV.version 등)과 제목/본문 해시를 함께 넣어, 버전이 그대로인
+  채 제목만 바뀌거나 ORM 밖에서 본문이 바뀌어도 이전 파일을 내주지 않음
+- 같은 키를 동시에 요청하면 진행 중인 생성 작업 하나를 함께 기다림
+  (요청이 끊겨도 생성은 끝까지 진행)
+- 응답은 파일을 먼저 연 뒤 그 핸들로 보내므로(``open_docx``), 새 버전을 저장하며
+  이전 버전 파일을 지워도 이미 시작한 다운로드는 끝까지 전송됨
+- 새 파일을 저장하면 같은 문서의 이전 버전 파일은 삭제하고, 문서를 지우거나
+  프로필이 교체되면 ``remove_exports`` 로 모두 삭제
+- 정적 파일 볼륨의 숨김 디렉토리에 두어 재시작/여러 워커 사이에서 공유
+"""
+import asyncio
+import hashlib
+import os
+from pathlib import Path
+from typing import BinaryIO, Dict
+
+from starlette.concurrency import run_in_threadpool
+
+from app.docx_export import build_docx
+from app.upload_store import markdown_urls, store_path
+from app.uploads import UPLOAD_ROOT, replace_atomically
+from app.workers import run_in_process
+
+EXPORT_ROOT = Path(os.getenv("CV_EXPORT_DIR",
+                             str(UPLOAD_ROOT.parent / ".cv-exports")))
+DOCX_MEDIA_TYPE = ("application/vnd.openxmlformats-officedocument"
+                   ".wordprocessingml.document")
+# 변환 규칙(app/docx_export.py)이 바뀌면 올려서 기존 파일을 다시 생성
+DOCX_FORMAT_VERSION = 1
+# 열기 직전에 파일이 지워졌을 때 다시 생성하는 횟수
+OPEN_ATTEMPTS = 3
+
+_pending: Dict[Path, "asyncio.Task[Path]"] = {}
+
+
+def docx_path(kind: str, row_id: int, version, title: str,
+              text: str) -> Path:
+    """내보내기 파일 경로 (종류, id, 버전, 제목/본문 해시로 결정)"""
+    digest = hashlib.sha256(
+        f"{DOCX_FORMAT_VERSION}\0{title}\0{text}".encode()).hexdigest()
+    return EXPORT_ROOT / f"{kind}-{row_id}-{version}-{digest[:16]}.docx"
+
+
+def _image_files(text: str) -> Dict[str, str]:
+    """본문 이미지 URL -> 업로드 저장소의 실제 파일 경로"""
+    files = {}
+    for url in markdown_urls(text):
+        path = store_path(url)
+        if path and (UPLOAD_ROOT / path).is_file():
+            files[url] = str((UPLOAD_ROOT / path).resolve())
+    return files
+
+
+def _document_files(kind: str, row_id) -> list:
+    return list(EXPORT_ROOT.glob(f"{kind}-{row_id}-*.docx"))
+
+
+def _save(target: Path, content: bytes) -> None:
+    replace_atomically(target, lambda tmp_path: Path(tmp_path).write_bytes(
+        content))
+    # 같은 문서(종류-id)의 이전 버전 정리 - 진행 중인 다운로드는 열린 핸들로 읽음
+    kind, row_id = target.name.split("-", 2)[:2]
+    for stale in _document_files(kind, row_id):
+        if stale != target:
+            stale.unlink(missing_ok=True)
+
+
+def _remove(kind: str, row_id: int) -> None:
+    for path in _document_files(kind, row_id):
+        path.unlink(missing_ok=True)
+
+
+async def remove_exports(kind: str, row_id: int) -> None:
+    """문서(종류-id)의 내보내기 파일을 모두 삭제"""
+    await run_in_threadpool(_remove, kind, row_id)
+
+
+async def _generate(target: Path, title: str, text: str) -> Path:
+    images = await run_in_threadpool(_image_files, text)
+    content = await run_in_process(build_docx, title, text, images)
+    await run_in_threadpool(_save, target, content)
+    return target
+
+
+async def ensure_docx(target: Path, title: str, text: str) -> Path:
+    """target 이 없으면 워커 프로세스에서 생성 (같은 키의 생성은 한 번만)"""
+    if target.is_file():
+        return target
+    task = _pending.get(target)
+    if task is None:
+        task = asyncio.ensure_future(_generate(target, title, text))
+        _pending[target] = task
+        task.add_done_callback(lambda _: _pending.pop(target, None))
+    return await asyncio.shield(task)
+
+
+async def open_docx(target: Path, title: str, text: str) -> BinaryIO:
+    """ensure_docx 후 파일을 열어 반환 (열기 전에 다른 버전 저장으로 지워졌으면
+    다시 생성)"""
+    for attempt in range(OPEN_ATTEMPTS):
+        path = await ensure_docx(target, title, text)
+        try:
+            return await run_in_threadpool(open, path, "rb")
+        except FileNotFoundError:
+            if attempt == OPEN_ATTEMPTS - 1:
+                raise
@@ -0,0 +1,177 @@
+"""출판물 비트맵 필터 인덱스
+
+출판물 행을 (number, id) 내림차순으로 메모리에 올려 두고, 연도/상태/저널/기여
+유형마다 해당 행 위치의 비트를 켠 비트셋(파이썬 int)을 만듭니다.
+
+- 필터 조합은 비트셋 AND 로, 목록은 켜진 비트 순서대로 행을 꺼내서 응답
+- 연도/상태/기여 유형별 개수는 popcount (int.bit_count) 로 계산
+
+출판물 테이블의 변경 지문(행 수 + max(updated_at))이 바뀌면 다음 조회 때 다시
+만듭니다. 지문은 DB 에서 읽으므로 여러 워커로 실행해도 쓰기가 반영됩니다.
+"""
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import Publication
+from app.schemas import publication_serializer
+
+CONTRIBUTIONS = ("first-author", "corresponding", "equal-contribution",
+                 "co-author")
+
+_FIELDS = publication_serializer.fields
+_NUMBER = _FIELDS.index("number")
+_ID = _FIELDS.index("id")
+_YEAR = _FIELDS.index("year")
+_STATUS = _FIELDS.index("status")
+_JOURNAL = _FIELDS.index("journal")
+_FLAGS = {
+    "first-author": _FIELDS.index("is_first_author"),
+    "corresponding": _FIELDS.index("is_corresponding_author"),
+    "equal-contribution": _FIELDS.index("is_equal_contribution"),
+}
+
+
+def _bitset(positions: Iterable[int], size: int) -> int:
+    """위치 목록 -> 비트셋 (큰 int 를 반복해서 OR 하지 않도록 바이트로 조립)"""
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _group(rows: Sequence[tuple], column: int) -> Dict[str, int]:
+    positions: Dict[str, List[int]] = {}
+    for position, row in enumerate(rows):
+        positions.setdefault(row[column], []).append(position)
+    return {value: _bitset(items, len(rows))
+            for value, items in positions.items()}
+
+
+def _union(bitsets: Iterable[int]) -> int:
+    mask = 0
+    for bitset in bitsets:
+        mask |= bitset
+    return mask
+
+
+class PublicationIndex:
+    """출판물 행과 값별 비트셋"""
+
+    def __init__(self, state, rows: Sequence[Sequence]):
+        self.state = state
+        self.rows = [tuple(row) for row in rows]
+        size = len(self.rows)
+        self.all = (1 << size) - 1
+        # 커서 위치 탐색용 정렬 키 (내림차순을 오름차순으로 뒤집어서 보관)
+        self._keys = [(-row[_NUMBER], -row[_ID]) for row in self.rows]
+
+        self.years = _group(self.rows, _YEAR)
+        self.statuses = _group(self.rows, _STATUS)
+        self.journals = _group(self.rows, _JOURNAL)
+        self.contributions = {
+            name: _bitset((position for position, row in enumerate(self.rows)
+                           if row[column]), size)
+            for name, column in _FLAGS.items()
+        }
+        self.contributions["co-author"] = self.all & ~_union(
+            self.contributions.values())
+
+    def _year_mask(self, year: Optional[str], year_from: Optional[int],
+                   year_to: Optional[int]) -> int:
+        mask = self.all
+        if year:
+            mask &= self.years.get(year, 0)
+        # year 는 4자리 문자열이므로 SQL 과 같은 문자열 비교로 범위 필터
+        if year_from is not None or year_to is not None:
+            low = str(year_from) if year_from is not None else ""
+            high = str(year_to) if year_to is not None else None
+            mask &= _union(bitset for value, bitset in self.years.items()
+                           if value >= low and (high is None or value <= high))
+        return mask
+
+    def _contribution_mask(self, contribution: Optional[str]) -> int:
+        if not contribution:
+            return self.all
+        # 알 수 없는 값은 기존 SQL 필터처럼 co-author 로 취급
+        return self.contributions.get(contribution,
+                                      self.contributions["co-author"])
+
+    def _values_mask(self, groups: Dict[str, int],
+                     values: Optional[List[str]]) -> int:
+        if not values:
+            return self.all
+        return _union(groups.get(value, 0) for value in values)
+
+    def match(self, year: Optional[str] = None,
+              year_from: Optional[int] = None, year_to: Optional[int] = None,
+              contribution: Optional[str] = None,
+              status: Optional[List[str]] = None,
+              journal: Optional[List[str]] = None) -> int:
+        """필터 조합에 해당하는 행의 비트셋"""
+        return (self._year_mask(year, year_from, year_to)
+                & self._contribution_mask(contribution)
+                & self._values_mask(self.statuses, status)
+                & self._values_mask(self.journals, journal))
+
+    def after(self, mask: int, number: int, publication_id: int) -> int:
+        """(number, id) 가 커서보다 작은(다음 페이지) 행만 남김"""
+        start = bisect_right(self._keys, (-number, -publication_id))
+        return mask >> start << start
+
+    def iter_rows(self, mask: int) -> Iterator[tuple]:
+        """켜진 비트 순서 = (number, id) 내림차순"""
+        rows = self.rows
+        # 최하위 비트부터 읽도록 뒤집은 2진 문자열에서 "1" 위치를 찾음
+        # (비트를 하나씩 지우면 매번 큰 int 를 복사하므로 O(n^2))
+        bits = bin(mask)[:1:-1]
+        position = bits.find("1")
+        while position != -1:
+            yield rows[position]
+            position = bits.find("1", position + 1)
+
+    def facets(self, year: Optional[str] = None,
+               contribution: Optional[str] = None,
+               status: Optional[List[str]] = None) -> dict:
+        """연도/상태/기여 유형별 개수
+
+        각 항목의 개수는 그 항목 자신을 제외한 나머지 필터를 적용한 결과이므로,
+        선택을 바꿨을 때의 결과 수를 그대로 보여줄 수 있습니다.
+        """
+        by_year = self.years.get(year, 0) if year else self.all
+        by_contribution = self._contribution_mask(contribution)
+        by_status = self._values_mask(self.statuses, status)
+
+        def counts(groups: Dict[str, int], mask: int) -> Dict[str, int]:
+            return {value: (bitset & mask).bit_count()
+                    for value, bitset in groups.items()}
+
+        return {
+            "total": (by_year & by_contribution & by_status).bit_count(),
+            "years": dict(sorted(
+                counts(self.years, by_contribution & by_status).items(),
+                reverse=True)),
+            "statuses": counts(self.statuses, by_year & by_contribution),
+            "contributions": {
+                name: (self.contributions[name] & by_year & by_status)
+                .bit_count() for name in CONTRIBUTIONS},
+        }
+
+
+_index: Optional[PublicationIndex] = None
+
+
+async def publication_index(db: AsyncSession) -> PublicationIndex:
+    """최신 인덱스 (출판물이 바뀌었으면 다시 생성)"""
+    global _index
+    # 응답 캐시의 변경 지문과 같은 기준 (행 수 + max(updated_at))
+    state = tuple((await db.exec(select(
+        func.count(), func.max(Publication.updated_at)))).one())
+    if _index is None or _index.state != state:
+        rows = (await db.exec(publication_serializer.select().order_by(
+            Publication.number.desc(), Publication.id.desc()))).all()
+        # 동시 요청이 함께 다시 만들어도 결과가 같으므로 잠금 없이 교체
+        _index = PublicationIndex(state, rows)
+    return _index
@@ -0,0 +1,91 @@
+"""업로드 이미지의 크기/대표 색/저화질 미리보기(LQIP) 계산
+
+업로드 시점에 한 번 계산해 ``uploadedfile`` 과 이미지를 가리키는 콘텐츠 행에
+저장합니다. 프런트엔드는 목록 응답만으로 이미지 자리를 잡고, 원본이 오기 전까지
+대표 색과 미리보기를 배경으로 보여줍니다.
+
+- 디코딩은 CPU 를 쓰므로 워커 프로세스에서 실행 (app/workers.py)
+- JPEG 는 draft 모드로 미리보기 크기에 가깝게 축소 디코딩
+- Pillow 가 없거나 읽을 수 없는 형식(SVG 등)이면 None
+"""
+import asyncio
+import base64
+import io
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # pragma: no cover - 선택 의존성
+    Image = None
+
+from app.workers import run_in_process
+
+# 미리보기의 긴 변 픽셀 수 (data URI 로 200~400 바이트)
+PLACEHOLDER_SIZE = 16
+PLACEHOLDER_QUALITY = 40
+# 대표 색을 고를 때 줄일 색 수
+PALETTE_COLORS = 4
+
+# uploadedfile 과 콘텐츠 행에 저장하는 값
+METADATA_FIELDS = ("width", "height", "dominant_color", "placeholder")
+
+# EXIF 방향 값 중 가로/세로가 바뀌는 것
+_TRANSPOSED = {5, 6, 7, 8}
+
+
+def _placeholder(image) -> str:
+    """작은 이미지를 data URI 로 인코딩 (WebP 를 지원하지 않으면 PNG)"""
+    buffer = io.BytesIO()
+    if features.check("webp"):
+        image.save(buffer, "WEBP", quality=PLACEHOLDER_QUALITY, method=6)
+        media_type = "image/webp"
+    else:
+        image.save(buffer, "PNG", optimize=True)
+        media_type = "image/png"
+    encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return f"data:{media_type};base64,{encoded}"
+
+
+def _dominant_color(image) -> str:
+    """투명 영역은 흰 배경에 합성한 뒤 가장 많은 색 (#rrggbb)"""
+    background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+    flat = Image.alpha_composite(background, image).convert("RGB")
+    palette = flat.quantize(colors=PALETTE_COLORS,
+                            method=Image.Quantize.MEDIANCUT)
+    _, index = max(palette.getcolors())
+    red, green, blue = palette.getpalette()[index * 3:index * 3 + 3]
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def analyze_image(path: str) -> Optional[Dict[str, Any]]:
+    """이미지 파일의 가로/세로(EXIF 방향 반영), 대표 색, 미리보기"""
+    if Image is None:
+        return None
+    try:
+        with Image.open(path) as image:
+            width, height = image.size
+            if image.getexif().get(0x0112) in _TRANSPOSED:
+                width, height = height, width
+            # JPEG 는 1/2~1/8 배율로 디코딩 (다른 형식은 영향 없음)
+            image.draft("RGB", (PLACEHOLDER_SIZE * 4, PLACEHOLDER_SIZE * 4))
+            small = ImageOps.exif_transpose(image).convert("RGBA")
+        small.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE),
+                        Image.Resampling.LANCZOS)
+        return {
+            "width": width,
+            "height": height,
+            "dominant_color": _dominant_color(small),
+            "placeholder": _placeholder(small),
+        }
+    except (OSError, ValueError, SyntaxError, Image.DecompressionBombError):
+        return None
+
+
+async def analyze_images(paths: Iterable[str]
+                         ) -> List[Optional[Dict[str, Any]]]:
+    """여러 이미지를 워커 프로세스에서 병렬로 분석 (입력 순서대로 반환)"""
+    paths = list(paths)
+    if not paths or Image is None:
+        return [None] * len(paths)
+    return list(await asyncio.gather(*(
+        run_in_process(analyze_image, path) for path in paths)))
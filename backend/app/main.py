@@ -2,15 +2,25 @@ import os
 from contextlib import asynccontextmanager
 
 from app import models  # 모든 모델을 import하여 테이블이 생성되도록 함
+from app.cache import ResponseCacheMiddleware
+from app.compression import MINIMUM_SIZE
 # 데이터베이스 및 모델 import
-from app.database import create_db_and_tables, test_db_connection
+from app.database import async_engine, create_db_and_tables, \
+    test_db_connection
+from app.metrics import MetricsMiddleware, mark_process_dead, \
+    metrics_response
+from app.responses import ORJSONResponse
+from app.sql_logging import QueryContextMiddleware
+from app.uploads import UploadLimitMiddleware
+from app.workers import shutdown_process_pool
 # 라우터 import
 from app.routers import publications, education, experience, awards, \
     conferences, media, representative_works, research_areas, cv_markdown, cv, \
-    research_highlights, cover_arts, auth, sitemap
+    research_highlights, cover_arts, auth, sitemap, admin, bootstrap
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
@@ -35,6 +45,9 @@ async def lifespan(app: FastAPI):
 
     # 종료 시 실행 (필요한 경우)
     print("🛑 애플리케이션 종료 중...")
+    await async_engine.dispose()
+    shutdown_process_pool()
+    mark_process_dead()
 
 
 # FastAPI 앱 생성
@@ -42,9 +55,23 @@ app = FastAPI(
     title="JoohoonKim Portfolio API",
     description="Portfolio API for JoohoonKim's academic website",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# 업로드 라우트의 본문 크기 제한 (라우팅 후 본문을 읽을 때 정책 적용)
+app.add_middleware(UploadLimitMiddleware)
+
+# 공개 GET 응답 캐시 (가장 안쪽에서 라우터 응답을 그대로 보관)
+app.add_middleware(ResponseCacheMiddleware)
+
+# 요청별 쿼리 수/DB 시간 집계와 쿼리 로그의 요청 경로 기록
+# (캐시 미들웨어의 지문 조회도 포함하도록 캐시 바깥에 배치)
+app.add_middleware(QueryContextMiddleware)
+
+# 캐시되지 않는 응답 압축 (이미 인코딩된 캐시 응답은 그대로 통과)
+app.add_middleware(GZipMiddleware, minimum_size=MINIMUM_SIZE)
+
 # 쿠키 세션
 app.add_middleware(
     SessionMiddleware,
@@ -61,8 +88,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 출판물 목록의 다음 페이지 커서
+    expose_headers=["X-Next-Cursor"],
 )
 
+# 요청 수/시간/응답 크기 메트릭 (가장 바깥에서 전체 처리 시간 측정)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(publications.router)
 app.include_router(awards.router)
@@ -71,22 +103,33 @@ app.include_router(representative_works.router)
 app.include_router(research_areas.router)
 app.include_router(research_highlights.router)
 app.include_router(cover_arts.router)
+app.include_router(cv.router)
+app.include_router(cv_markdown.router)
 app.include_router(auth.router)
 app.include_router(sitemap.router)
+app.include_router(admin.router)
+app.include_router(bootstrap.router)
 
 # 정적 파일 서빙
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "JoohoonKim Portfolio API is running!"}
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """API 상태 확인 엔드포인트"""
     return {
         "status": "healthy",
         "message": "API is running successfully"
     }
+
+
+# nginx 는 /api/ 만 프록시하므로 외부에는 노출되지 않음
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    return metrics_response()
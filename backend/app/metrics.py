@@ -0,0 +1,171 @@
+"""Prometheus 메트릭 (/metrics)
+
+- 라우트별 응답 시간/응답 크기 히스토그램, 처리 중인 요청 수
+- 비동기 엔진 커넥션 풀의 체크아웃 수, 사용 중/오버플로 커넥션 수, 대기 시간
+- 응답 캐시 적중/미스/축출/무효화, 업로드 바이트 수
+
+여러 워커(프로세스)로 실행할 때는 ``PROMETHEUS_MULTIPROC_DIR`` 에 빈 디렉토리를
+지정하면 각 워커가 값을 파일로 기록하고, 스크레이프 시 합산해서 내보냅니다.
+라벨은 경로 템플릿("/api/publications/{publication_id}")을 사용하므로 시계열
+수가 라우트 수에 비례해 일정하게 유지됩니다.
+"""
+import os
+import time
+from typing import Optional
+
+from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry,
+                               Counter, Gauge, Histogram, REGISTRY,
+                               generate_latest, multiprocess)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.responses import Response
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "HTTP 응답 본문 크기",
+    ["method", "route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수", ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts_total", "커넥션 풀 체크아웃 횟수")
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "사용 중인 커넥션 수",
+    multiprocess_mode="livesum")
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "pool_size 를 넘어 추가로 연 커넥션 수",
+    multiprocess_mode="livesum")
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds", "풀에서 커넥션을 얻기까지 걸린 시간",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+CACHE_EVENTS = Counter(
+    "response_cache_events_total", "응답 캐시 이벤트", ["rule", "event"])
+CACHE_BYTES = Gauge(
+    "response_cache_bytes", "응답 캐시가 사용 중인 메모리",
+    multiprocess_mode="livesum")
+
+UPLOAD_BYTES = Counter(
+    "upload_bytes_total", "업로드된 파일 바이트 수", ["directory"])
+UPLOAD_FILES = Counter(
+    "upload_files_total", "업로드된 파일 수", ["directory"])
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 기다린 시간을 기록하는 풀"""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+
+def _pool_overflow(engine: Engine) -> int:
+    # dispose() 후에는 풀이 새로 만들어지므로 매번 엔진에서 조회
+    overflow = getattr(engine.pool, "overflow", None)
+    return max(overflow(), 0) if overflow is not None else 0
+
+
+def instrument_pool(engine: Engine):
+    """풀 체크아웃/반납 이벤트로 사용 중 커넥션 수를 추적"""
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKOUTS.inc()
+        DB_POOL_CHECKED_OUT.inc()
+        DB_POOL_OVERFLOW.set(_pool_overflow(engine))
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        DB_POOL_CHECKED_OUT.dec()
+        DB_POOL_OVERFLOW.set(_pool_overflow(engine))
+
+
+def record_upload(directory: str, size: int):
+    UPLOAD_BYTES.labels(directory=directory).inc(size)
+    UPLOAD_FILES.labels(directory=directory).inc()
+
+
+def _route_template(scope: Scope) -> Optional[str]:
+    """라우팅된 경로 템플릿 (캐시 적중처럼 라우터를 거치지 않았으면 직접 매칭)"""
+    route = scope.get("route")
+    if route is None:
+        router = scope.get("router") or getattr(scope.get("app"), "router",
+                                                None)
+        for candidate in getattr(router, "routes", ()):
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", None)
+
+
+class MetricsMiddleware:
+    """요청 수/시간/응답 크기 기록"""
+
+    def __init__(self, app: ASGIApp, skip_paths=("/metrics",)):
+        self.app = app
+        self.skip_paths = set(skip_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method=method)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            # 매칭되지 않은 경로는 하나의 라벨로 묶어 시계열 폭증 방지
+            route = _route_template(scope) or "unmatched"
+            REQUEST_LATENCY.labels(method=method, route=route,
+                                   status=str(status)) \
+                .observe(time.perf_counter() - started)
+            RESPONSE_SIZE.labels(method=method, route=route).observe(size)
+
+
+def metrics_response() -> Response:
+    if MULTIPROCESS:
+        # 워커별 파일을 합산 (요청마다 새 레지스트리를 만드는 것이 권장 방식)
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+def mark_process_dead():
+    """종료하는 워커의 livesum 게이지 값을 제거"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Optional
 
 from pydantic import ConfigDict
+from sqlalchemy import Column, Index, LargeBinary, text
 from sqlmodel import SQLModel, Field
 
 
@@ -35,6 +36,9 @@ class Experience(SQLModel, table=True):
 
 class Award(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_award_year", "year"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
@@ -48,6 +52,35 @@ class Award(SQLModel, table=True):
 
 class Publication(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        # 목록 정렬 + 키셋 페이지네이션
+        Index("ix_publication_number_id", "number", "id"),
+        # 필터별로 같은 (number, id) 순서를 유지하는 인덱스
+        Index("ix_publication_year_number", "year", "number", "id"),
+        Index("ix_publication_status_number", "status", "number", "id"),
+        Index("ix_publication_journal_number", "journal", "number", "id"),
+        Index("ix_publication_first_author_number", "number", "id",
+              postgresql_where=text("is_first_author"),
+              sqlite_where=text("is_first_author = 1")),
+        Index("ix_publication_corresponding_number", "number", "id",
+              postgresql_where=text("is_corresponding_author"),
+              sqlite_where=text("is_corresponding_author = 1")),
+        Index("ix_publication_equal_contribution_number", "number", "id",
+              postgresql_where=text("is_equal_contribution"),
+              sqlite_where=text("is_equal_contribution = 1")),
+        Index("ix_publication_coauthor_number", "number", "id",
+              postgresql_where=text(
+                  "NOT is_first_author AND NOT is_corresponding_author "
+                  "AND NOT is_equal_contribution"),
+              sqlite_where=text(
+                  "is_first_author = 0 AND is_corresponding_author = 0 "
+                  "AND is_equal_contribution = 0")),
+        # /stats 집계를 테이블 대신 인덱스만 읽어서 처리
+        Index("ix_publication_stats", "status", "is_first_author",
+              "is_corresponding_author", "id"),
+        # 변경 지문 (count + max(updated_at))
+        Index("ix_publication_updated_at", "updated_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     number: int  # 논문 번호 (내림차순)
@@ -82,6 +115,9 @@ class Publication(SQLModel, table=True):
 
 class Conference(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_conference_date", "date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
@@ -96,6 +132,9 @@ class Conference(SQLModel, table=True):
 
 class Media(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_media_date", "date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
@@ -110,6 +149,14 @@ class Media(SQLModel, table=True):
 
 class RepresentativeWork(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        # 관리자 목록(전체)과 공개 목록(is_active) 정렬
+        Index("ix_representativework_order", "order_index"),
+        Index("ix_representativework_active_order", "order_index",
+              postgresql_where=text("is_active"),
+              sqlite_where=text("is_active = 1")),
+        Index("ix_representativework_updated_at", "updated_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
@@ -119,6 +166,10 @@ class RepresentativeWork(SQLModel, table=True):
     pages: Optional[str] = None  # 예: "474-481"
     year: Optional[str] = None  # 예: "2023"
     image_path: str  # 이미지 파일 경로
+    image_width: Optional[int] = None  # 업로드 시 계산 (app/image_metadata.py)
+    image_height: Optional[int] = None
+    image_color: Optional[str] = None  # 대표 색 (#rrggbb)
+    image_placeholder: Optional[str] = None  # 저화질 미리보기 data URI
     order_index: int = Field(default=0)  # 슬라이드 순서
     is_active: bool = Field(default=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -131,6 +182,10 @@ class GalleryImage(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     image_path: str
+    image_width: Optional[int] = None  # 업로드 시 계산 (app/image_metadata.py)
+    image_height: Optional[int] = None
+    image_color: Optional[str] = None  # 대표 색 (#rrggbb)
+    image_placeholder: Optional[str] = None  # 저화질 미리보기 data URI
     alt_text: Optional[str] = None
     category: str  # manufacturing, design, applications
     order_index: int = Field(default=0)
@@ -140,6 +195,14 @@ class GalleryImage(SQLModel, table=True):
 
 class ResearchArea(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        # 관리자 목록(전체)과 공개 목록(is_active) 정렬
+        Index("ix_researcharea_order", "order_index"),
+        Index("ix_researcharea_active_order", "order_index",
+              postgresql_where=text("is_active"),
+              sqlite_where=text("is_active = 1")),
+        Index("ix_researcharea_updated_at", "updated_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
@@ -153,20 +216,63 @@ class ResearchArea(SQLModel, table=True):
 
 
 class MarkdownCV(SQLModel, table=True):
+    """마크다운 CV 문서 (content 는 최신 버전, 이전 버전은 MarkdownCVRevision)"""
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        # 수정일순 목록
+        Index("ix_markdowncv_updated_at", "updated_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     content: str  # 마크다운 텍스트
     description: Optional[str] = None
-    is_active: bool = Field(default=False)
-    version: int = Field(default=1)
+    version: int = Field(default=1)  # 내용이 바뀔 때마다 증가
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class MarkdownCVRevision(SQLModel, table=True):
+    """마크다운 CV 의 버전별 내용 (스냅샷 또는 이전 버전 대비 델타, 압축 저장)
+
+    복원과 저장 규칙은 app/cv_history.py
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_markdowncvrevision_document_version", "document_id",
+              "version", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    document_id: int = Field(foreign_key="markdowncv.id", ondelete="CASCADE")
+    version: int
+    # 이 버전을 복원할 때 시작하는 스냅샷 버전 (스냅샷이면 자기 자신)
+    base_version: int
+    data: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    size: int  # 복원한 본문의 바이트 수
+    sha256: str  # 복원 결과 검증용
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ActiveMarkdownCV(SQLModel, table=True):
+    """활성 마크다운 CV 를 가리키는 포인터 (항상 id=1 한 행)"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    id: int = Field(default=1, primary_key=True,
+                    sa_column_kwargs={"autoincrement": False})
+    document_id: Optional[int] = Field(default=None,
+                                       foreign_key="markdowncv.id",
+                                       ondelete="SET NULL")
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class CVProfile(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_cvprofile_active", "id",
+              postgresql_where=text("is_active"),
+              sqlite_where=text("is_active = 1")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
@@ -180,6 +286,9 @@ class CVProfile(SQLModel, table=True):
 
 class ContactInfo(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_contactinfo_profile_order", "profile_id", "order_index"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     profile_id: int = Field(foreign_key="cvprofile.id")
@@ -192,6 +301,9 @@ class ContactInfo(SQLModel, table=True):
 
 class CVSection(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        Index("ix_cvsection_profile_order", "profile_id", "order_index"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     profile_id: int = Field(foreign_key="cvprofile.id")
@@ -204,9 +316,21 @@ class CVSection(SQLModel, table=True):
 
 class ResearchHighlight(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        # order_index 오름차순, id 내림차순 정렬 (관리자 목록 / 공개 목록)
+        Index("ix_researchhighlight_order", "order_index", text("id DESC")),
+        Index("ix_researchhighlight_active_order", "order_index", text("id DESC"),
+              postgresql_where=text("is_active"),
+              sqlite_where=text("is_active = 1")),
+        Index("ix_researchhighlight_updated_at", "updated_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     image_path: str
+    image_width: Optional[int] = None  # 업로드 시 계산 (app/image_metadata.py)
+    image_height: Optional[int] = None
+    image_color: Optional[str] = None  # 대표 색 (#rrggbb)
+    image_placeholder: Optional[str] = None  # 저화질 미리보기 data URI
     link: Optional[str] = None
     description: Optional[str] = None
     alt_text: Optional[str] = None
@@ -218,9 +342,21 @@ class ResearchHighlight(SQLModel, table=True):
 
 class CoverArt(SQLModel, table=True):
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        # order_index 오름차순, id 내림차순 정렬 (관리자 목록 / 공개 목록)
+        Index("ix_coverart_order", "order_index", text("id DESC")),
+        Index("ix_coverart_active_order", "order_index", text("id DESC"),
+              postgresql_where=text("is_active"),
+              sqlite_where=text("is_active = 1")),
+        Index("ix_coverart_updated_at", "updated_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     image_path: str
+    image_width: Optional[int] = None  # 업로드 시 계산 (app/image_metadata.py)
+    image_height: Optional[int] = None
+    image_color: Optional[str] = None  # 대표 색 (#rrggbb)
+    image_placeholder: Optional[str] = None  # 저화질 미리보기 data URI
     link: Optional[str] = None
     journal: str
     volume: Optional[str] = None
@@ -231,3 +367,26 @@ class CoverArt(SQLModel, table=True):
     is_active: bool = Field(default=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class UploadedFile(SQLModel, table=True):
+    """업로드 저장소의 파일 (내용 해시로 식별, 참조 수는 app/upload_store.py)"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    __table_args__ = (
+        # 같은 내용의 파일 찾기 (다른 디렉토리에 있으면 하드 링크로 재사용)
+        Index("ix_uploadedfile_sha256", "sha256"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    path: str = Field(unique=True)  # UPLOAD_ROOT 기준 경로 (cover-arts/<sha256>.jpg)
+    sha256: str
+    size: int
+    content_type: Optional[str] = None
+    ref_count: int = Field(default=0)  # 이 파일을 가리키는 행/컬럼 수
+    # 이미지 메타데이터 (이미지가 아니거나 읽을 수 없으면 None)
+    width: Optional[int] = None
+    height: Optional[int] = None
+    dominant_color: Optional[str] = None
+    placeholder: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,468 @@
+"""BibTeX / RIS 출판물 일괄 가져오기
+
+파일을 한 줄씩 읽으면서 항목 단위로 파싱하고(전체를 메모리에 올리지 않음),
+DOI 또는 정규화한 제목으로 기존 출판물/같은 파일 안의 중복을 걸러낸 뒤
+여러 행 INSERT 를 묶어서 한 트랜잭션으로 기록합니다.
+
+저자 표기는 기존 데이터와 같은 규칙을 따릅니다 - 이름 뒤의 ``*`` 는 공동 제1저자,
+``+`` 는 교신저자 (``parse_authors_contribution`` 참고).
+새 출판물의 number 는 현재 최댓값 다음부터 연도(같으면 파일 순서) 오름차순으로
+매기므로 최신 논문이 가장 큰 번호를 갖습니다.
+"""
+import io
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, \
+    Tuple
+
+from sqlalchemy import func, insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import Publication
+
+# 여러 행 INSERT 한 번에 넣을 행 수 (컬럼 수 x 행 수가 DB 파라미터 상한 이내)
+BATCH_SIZE = 500
+
+# biblatex pubstate -> Publication.status
+PUBSTATES = {
+    "inpress": "in-press",
+    "forthcoming": "in-press",
+    "submitted": "under-submission",
+    "inreview": "in-review",
+}
+STATUSES = {"published", "under-submission", "in-press", "in-review"}
+
+MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep",
+          "oct", "nov", "dec")
+
+
+def parse_authors_contribution(authors_str):
+    """저자 문자열에서 기여도 정보를 파싱"""
+    is_first_author = False
+    is_corresponding = False
+    is_equal_contribution = False
+
+    # Joohoon Kim이 first author인지 확인
+    if authors_str.startswith("Joohoon Kim"):
+        is_first_author = True
+    elif "Joohoon Kim*" in authors_str:
+        is_equal_contribution = True
+
+    # Corresponding author 확인 (+표시)
+    if "Junsuk Rho+" in authors_str:
+        is_corresponding = True
+
+    # Contribution type 결정
+    if is_first_author:
+        contribution_type = "first-author"
+    elif is_corresponding:
+        contribution_type = "corresponding"
+    elif is_equal_contribution:
+        contribution_type = "equal-contribution"
+    else:
+        contribution_type = "co-author"
+
+    return is_first_author, is_corresponding, is_equal_contribution, contribution_type
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+_LATEX_REPLACEMENTS = (("\\&", "&"), ("\\%", "%"), ("\\_", "_"),
+                       ("\\$", "$"), ("~", " "), ("---", "—"), ("--", "-"))
+# \textit{...} 같은 명령과 {\"o} 같은 악센트 기호 (인자만 남김)
+_LATEX_COMMAND = re.compile(r"\\[a-zA-Z]+\s*|\\[\"'`^=.]")
+
+
+def _clean_latex(value: str) -> str:
+    for old, new in _LATEX_REPLACEMENTS:
+        value = value.replace(old, new)
+    value = _LATEX_COMMAND.sub("", value)
+    return " ".join(value.replace("{", "").replace("}", "").split())
+
+
+_BARE_VALUE = re.compile(r"[^,}\s#]+")
+_CONCAT = re.compile(r"\s*#\s*")
+
+
+def _read_value(text: str, pos: int,
+                macros: Dict[str, str]) -> Tuple[str, int]:
+    """pos 에서 시작하는 필드 값 하나 ({...}, "...", 숫자/매크로)"""
+    if text[pos] == "{":
+        depth, start = 0, pos
+        while pos < len(text):
+            if text[pos] == "{":
+                depth += 1
+            elif text[pos] == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[start + 1:pos], pos + 1
+            pos += 1
+        raise ImportFormatError("unbalanced braces")
+    if text[pos] == '"':
+        end = pos + 1
+        depth = 0
+        while end < len(text):
+            char = text[end]
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+            elif char == '"' and depth == 0 and text[end - 1] != "\\":
+                return text[pos + 1:end], end + 1
+            end += 1
+        raise ImportFormatError("unterminated string")
+    match = _BARE_VALUE.match(text, pos)
+    if not match:
+        raise ImportFormatError("missing value")
+    # @string 으로 정의한 매크로 (month 의 may 같은 표준 매크로는 그대로)
+    return macros.get(match.group(0).lower(), match.group(0)), match.end()
+
+
+_ENTRY_HEAD = re.compile(r"@\s*(\w+)\s*\{\s*([^,\s]*)\s*,", re.S)
+_FIELD_NAME = re.compile(r"\s*,?\s*([\w\-:]+)\s*=\s*", re.S)
+
+
+_STRING_HEAD = re.compile(r"@\s*string\s*\{", re.I)
+
+
+def _parse_bibtex_entry(text: str,
+                        macros: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """항목 하나를 필드 사전으로 (@string 은 macros 에 추가하고 None)"""
+    string = _STRING_HEAD.match(text)
+    if string:
+        macros.update(_read_fields(text, string.end(), macros))
+        return None
+    head = _ENTRY_HEAD.match(text)
+    if not head:
+        kind = re.match(r"@\s*(\w+)", text)
+        if kind and kind.group(1).lower() in ("comment", "preamble"):
+            return None
+        raise ImportFormatError("malformed entry header")
+    entry = {"_type": head.group(1).lower(), "_key": head.group(2)}
+    entry.update(_read_fields(text, head.end(), macros))
+    return entry
+
+
+def _read_fields(text: str, pos: int,
+                 macros: Dict[str, str]) -> Dict[str, str]:
+    fields = {}
+    while True:
+        name = _FIELD_NAME.match(text, pos)
+        if not name:
+            break
+        value, pos = _read_value(text, name.end(), macros)
+        # "a" # "b" 연결은 이어 붙임
+        while True:
+            concat = _CONCAT.match(text, pos)
+            if not concat or concat.end() >= len(text):
+                break
+            more, pos = _read_value(text, concat.end(), macros)
+            value += more
+        fields[name.group(1).lower()] = value
+    return fields
+
+
+def iter_bibtex(lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """(시작 줄 번호, 필드) - 중괄호 깊이로 항목 경계를 찾으며 한 줄씩 읽음"""
+    buffer: List[str] = []
+    macros: Dict[str, str] = {}
+    depth = 0
+    opened = False
+    start_line = 0
+    for line_number, line in enumerate(lines, start=1):
+        if not buffer:
+            # 항목은 줄 처음의 @ 로 시작 (그 밖의 줄은 주석으로 취급)
+            if not line.lstrip().startswith("@"):
+                continue
+            start_line = line_number
+        buffer.append(line)
+        depth += line.count("{") - line.count("}")
+        opened = opened or "{" in line
+        if opened and depth <= 0:
+            text = "".join(buffer)
+            buffer, depth, opened = [], 0, False
+            try:
+                entry = _parse_bibtex_entry(text, macros)
+            except ImportFormatError as e:
+                raise ImportFormatError(f"line {start_line}: {e}")
+            if entry is not None:
+                yield start_line, entry
+    if buffer and "".join(buffer).strip():
+        raise ImportFormatError(f"line {start_line}: unterminated entry")
+
+
+def _bibtex_author(name: str) -> str:
+    """"Kim, Joohoon*" -> "Joohoon Kim*" (기여 표시는 이름 끝으로)"""
+    markers = "".join(re.findall(r"[*+]", name))
+    name = re.sub(r"[*+]", "", name)
+    parts = [part.strip() for part in name.split(",")]
+    if len(parts) == 2:
+        name = f"{parts[1]} {parts[0]}"
+    elif len(parts) == 3:  # "von Last, Jr, First"
+        name = f"{parts[2]} {parts[0]} {parts[1]}"
+    return " ".join(name.split()) + markers
+
+
+def _bibtex_record(entry: Dict[str, str]) -> Dict[str, Optional[str]]:
+    def get(*names: str) -> Optional[str]:
+        for name in names:
+            if entry.get(name):
+                return _clean_latex(entry[name]) or None
+        return None
+
+    authors = get("author")
+    arxiv = get("arxiv")
+    if not arxiv and (get("archiveprefix") or "").lower() == "arxiv":
+        arxiv = get("eprint")
+    return {
+        "title": get("title"),
+        "authors": ", ".join(_bibtex_author(author) for author in
+                             re.split(r"\s+and\s+", authors))
+        if authors else None,
+        "journal": get("journal", "journaltitle", "booktitle"),
+        "volume": get("volume"),
+        "pages": get("pages"),
+        "year": get("year") or (get("date") or "")[:4] or None,
+        "month": get("month"),
+        "doi": get("doi"),
+        "arxiv": arxiv,
+        "status": PUBSTATES.get((get("pubstate") or "").lower()),
+        "featured_info": get("note"),
+    }
+
+
+_RIS_LINE = re.compile(r"^([A-Z][A-Z0-9])  -(?: (.*))?$")
+
+
+def iter_ris(lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, List[str]]]]:
+    """(시작 줄 번호, 태그별 값 목록) - "ER  -" 로 항목 종료"""
+    entry: Optional[Dict[str, List[str]]] = None
+    start_line = 0
+    last_tag = None
+    for line_number, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        match = _RIS_LINE.match(line)
+        if not match:
+            # 태그 없는 줄은 이전 값의 연속
+            if entry is not None and last_tag and line.strip():
+                entry[last_tag][-1] += " " + line.strip()
+            continue
+        tag, value = match.group(1), (match.group(2) or "").strip()
+        if tag == "TY":
+            entry, start_line = {}, line_number
+        elif entry is None:
+            raise ImportFormatError(f"line {line_number}: {tag} before TY")
+        elif tag == "ER":
+            yield start_line, entry
+            entry = None
+        else:
+            entry.setdefault(tag, []).append(value)
+        last_tag = tag
+    if entry is not None:
+        raise ImportFormatError(f"line {start_line}: missing ER")
+
+
+def _ris_record(entry: Dict[str, List[str]]) -> Dict[str, Optional[str]]:
+    def get(*tags: str) -> Optional[str]:
+        for tag in tags:
+            if entry.get(tag) and entry[tag][0]:
+                return entry[tag][0]
+        return None
+
+    authors = entry.get("AU") or entry.get("A1") or []
+    pages = get("SP")
+    if pages and get("EP"):
+        pages = f"{pages}-{get('EP')}"
+    date = get("PY", "Y1", "DA") or ""
+    date_parts = [part for part in date.split("/") if part]
+    return {
+        "title": get("TI", "T1"),
+        "authors": ", ".join(_bibtex_author(author) for author in authors)
+        if authors else None,
+        "journal": get("JO", "JF", "T2", "JA"),
+        "volume": get("VL"),
+        "pages": pages,
+        "year": date[:4] or None,
+        "month": date_parts[1] if len(date_parts) > 1 else None,
+        "doi": get("DO"),
+        "arxiv": None,
+        "status": None,
+        "featured_info": get("N1"),
+    }
+
+
+@dataclass
+class ImportResult:
+    parsed: int = 0
+    inserted: int = 0
+    duplicates: List[dict] = field(default_factory=list)
+    errors: List[dict] = field(default_factory=list)
+    # 검증을 통과한 새 출판물 (number 는 import_publications 에서 채움)
+    records: List[dict] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        return {"parsed": self.parsed, "new": len(self.records),
+                "inserted": self.inserted,
+                "duplicates": self.duplicates, "errors": self.errors}
+
+
+def detect_format(filename: Optional[str], first_line: str) -> str:
+    suffix = Path(filename or "").suffix.lower()
+    if suffix in (".bib", ".bibtex"):
+        return "bibtex"
+    if suffix == ".ris":
+        return "ris"
+    stripped = first_line.strip()
+    if stripped.startswith(("@", "%")):
+        return "bibtex"
+    if _RIS_LINE.match(stripped):
+        return "ris"
+    raise ImportFormatError("unknown format (expected BibTeX or RIS)")
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    if not doi:
+        return None
+    doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:)", "", doi.strip(),
+                 flags=re.I)
+    return doi.lower() or None
+
+
+def normalize_title(title: str) -> str:
+    return re.sub(r"[\W_]+", "", title.lower())
+
+
+def _normalize_month(month: Optional[str]) -> Optional[str]:
+    if not month:
+        return None
+    if month.isdigit() and 1 <= int(month) <= 12:
+        return MONTHS[int(month) - 1].capitalize()
+    return month[:3].capitalize() if month[:3].lower() in MONTHS else month
+
+
+def _publication_values(record: Dict[str, Optional[str]]) -> dict:
+    missing = [name for name in ("title", "authors", "journal", "year")
+               if not record.get(name)]
+    if missing:
+        raise ImportFormatError(f"missing {', '.join(missing)}")
+    is_first, is_corresponding, is_equal, contribution = \
+        parse_authors_contribution(record["authors"])
+    status = record.get("status")
+    return {
+        "title": record["title"],
+        "authors": record["authors"],
+        "journal": record["journal"],
+        "volume": record.get("volume"),
+        "pages": record.get("pages"),
+        "year": record["year"],
+        "month": _normalize_month(record.get("month")),
+        "doi": normalize_doi(record.get("doi")),
+        "arxiv": record.get("arxiv"),
+        "is_first_author": is_first,
+        "is_corresponding_author": is_corresponding,
+        "is_equal_contribution": is_equal,
+        "contribution_type": contribution,
+        "status": status if status in STATUSES else "published",
+        "featured_info": record.get("featured_info"),
+    }
+
+
+def parse_file(lines: Iterable[str], filename: Optional[str] = None,
+               result: Optional[ImportResult] = None) -> ImportResult:
+    """BibTeX/RIS 줄 스트림을 읽어 result 에 레코드/오류를 누적"""
+    result = result or ImportResult()
+    lines = iter(lines)
+    first_lines: List[str] = []
+    # 형식 판별용으로 처음의 비어 있지 않은 줄까지만 미리 읽음
+    for line in lines:
+        first_lines.append(line)
+        if line.strip():
+            break
+    if not first_lines or not first_lines[-1].strip():
+        return result
+
+    def all_lines():
+        yield from first_lines
+        yield from lines
+
+    if detect_format(filename, first_lines[-1]) == "bibtex":
+        entries = ((line, _bibtex_record(entry))
+                   for line, entry in iter_bibtex(all_lines()))
+    else:
+        entries = ((line, _ris_record(entry))
+                   for line, entry in iter_ris(all_lines()))
+
+    source = filename or "<input>"
+    try:
+        for line, record in entries:
+            result.parsed += 1
+            try:
+                result.records.append(_publication_values(record))
+            except ImportFormatError as e:
+                result.errors.append({"file": source, "line": line,
+                                      "title": record.get("title"),
+                                      "error": str(e)})
+    except ImportFormatError as e:
+        # 구조가 깨진 파일은 그 지점 이후를 읽지 않음
+        result.errors.append({"file": source, "line": None, "title": None,
+                              "error": str(e)})
+    return result
+
+
+def parse_stream(stream: BinaryIO, filename: Optional[str],
+                 result: ImportResult) -> ImportResult:
+    """업로드된 바이너리 스트림을 UTF-8 텍스트로 한 줄씩 읽어 파싱"""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace")
+    try:
+        return parse_file(text, filename, result)
+    finally:
+        # 원본 스트림은 호출한 쪽(UploadFile)이 닫음
+        text.detach()
+
+
+async def import_publications(db: AsyncSession, result: ImportResult,
+                              dry_run: bool = False) -> ImportResult:
+    """중복을 제외한 레코드를 여러 행 INSERT 로 한 트랜잭션에 기록"""
+    existing = (await db.exec(
+        select(Publication.doi, Publication.title))).all()
+    seen_dois = {normalize_doi(doi) for doi, _ in existing if doi}
+    seen_titles = {normalize_title(title) for _, title in existing}
+
+    new_records = []
+    for record in result.records:
+        doi, title = record["doi"], normalize_title(record["title"])
+        if doi and doi in seen_dois:
+            reason = "doi"
+        elif title in seen_titles:
+            reason = "title"
+        else:
+            if doi:
+                seen_dois.add(doi)
+            seen_titles.add(title)
+            new_records.append(record)
+            continue
+        result.duplicates.append({"title": record["title"], "doi": doi,
+                                  "match": reason})
+
+    # 연도 오름차순(같으면 파일 순서)으로 기존 최댓값 다음 번호 부여
+    next_number = (await db.scalar(select(func.max(Publication.number))) or 0) + 1
+    now = datetime.utcnow()
+    rows = []
+    for offset, record in enumerate(
+            sorted(new_records, key=lambda r: r["year"])):
+        rows.append({**record, "number": next_number + offset,
+                     "created_at": now, "updated_at": now})
+    result.records = rows
+
+    if dry_run or not rows:
+        return result
+    table = Publication.__table__
+    for start in range(0, len(rows), BATCH_SIZE):
+        await db.exec(insert(table).values(rows[start:start + BATCH_SIZE]))
+    await db.commit()
+    result.inserted = len(rows)
+    return result
@@ -0,0 +1,179 @@
+"""마크다운 렌더링 (정제된 HTML + 목차 + 본문 이미지 목록)
+
+연구 분야 설명, CV 섹션, 마크다운 CV 본문을 서버에서 한 번 HTML 로 바꿔
+``?render=html`` 응답에 넣습니다. 클라이언트마다 마크다운을 다시 파싱하지 않아도
+됩니다.
+
+- Python-Markdown (tables, fenced code, 취소선, 목차용 heading id) 으로 변환한
+  뒤 nh3 로 허용된 태그/속성/URL 스킴만 남김 (본문의 raw HTML 포함)
+- 결과는 (테이블, id, 컬럼, updated_at) 키로 크기 제한이 있는 LRU 에 보관
+  - 같은 키라도 원문이 바뀌었으면(ORM 밖에서 수정 등) 다시 렌더링
+- Markdown 인스턴스는 스레드 안전하지 않으므로 스레드마다 하나씩 재사용
+"""
+import html
+import os
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import datetime
+from typing import Hashable, List, Optional, Tuple
+from urllib.parse import urlsplit
+from xml.etree.ElementTree import Element
+
+import markdown
+import nh3
+from markdown.extensions import Extension
+from markdown.extensions.toc import slugify_unicode
+from markdown.inlinepatterns import SimpleTagInlineProcessor
+from markdown.treeprocessors import Treeprocessor
+from starlette.concurrency import run_in_threadpool
+from typing_extensions import TypedDict
+
+CACHE_SIZE = int(os.getenv("MARKDOWN_CACHE_SIZE", "256"))
+# 이보다 짧은 본문은 스레드풀로 넘기지 않고 바로 렌더링
+INLINE_RENDER_CHARS = 4096
+
+_HEADINGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+_TAGS = nh3.ALLOWED_TAGS | {"del"}
+_ATTRIBUTES = deepcopy(nh3.ALLOWED_ATTRIBUTES)
+for _heading in _HEADINGS:
+    _ATTRIBUTES.setdefault(_heading, set()).add("id")
+_ATTRIBUTES.setdefault("code", set()).add("class")
+_ATTRIBUTES.setdefault("th", set()).add("style")
+_ATTRIBUTES.setdefault("td", set()).add("style")
+_URL_SCHEMES = {"http", "https", "mailto"}
+
+
+class TocEntry(TypedDict):
+    level: int
+    id: str
+    title: str
+
+
+class RenderedMarkdown(TypedDict):
+    html: str
+    toc: List[TocEntry]
+    images: List[str]
+
+
+class _ImageCollector(Treeprocessor):
+    """본문 이미지 URL 을 문서 순서대로 기록 (중복 제외)"""
+
+    def run(self, root: Element) -> None:
+        images = self.md.images = []
+        for element in root.iter("img"):
+            src = (element.get("src") or "").strip()
+            if src and src not in images and \
+                    urlsplit(src).scheme in ("", "http", "https"):
+                images.append(src)
+
+
+class _MarkdownExtras(Extension):
+    """GFM 취소선(~~text~~) + 이미지 수집"""
+
+    def extendMarkdown(self, md):
+        md.inlinePatterns.register(
+            SimpleTagInlineProcessor(r"(~{2})(.+?)~{2}", "del"), "del", 40)
+        md.treeprocessors.register(_ImageCollector(md), "collect_images", 0)
+
+
+_local = threading.local()
+
+
+def _markdown() -> markdown.Markdown:
+    md = getattr(_local, "md", None)
+    if md is None:
+        md = _local.md = markdown.Markdown(
+            extensions=["tables", "fenced_code", "sane_lists", "toc",
+                        _MarkdownExtras()],
+            extension_configs={"toc": {"slugify": slugify_unicode}},
+            output_format="html")
+    return md
+
+
+def _flatten_toc(tokens: List[dict]) -> List[TocEntry]:
+    entries = []
+    for token in tokens:
+        entries.append({"level": token["level"], "id": token["id"],
+                        "title": html.unescape(token["name"])})
+        entries.extend(_flatten_toc(token["children"]))
+    return entries
+
+
+def render_markdown(text: Optional[str]) -> RenderedMarkdown:
+    """마크다운 -> 정제된 HTML, 목차(heading 순서), 이미지 URL 목록"""
+    md = _markdown()
+    try:
+        body = md.convert(text or "")
+        toc = _flatten_toc(md.toc_tokens)
+        images = list(getattr(md, "images", []))
+    finally:
+        md.reset()
+    safe = nh3.clean(body, tags=_TAGS, attributes=_ATTRIBUTES,
+                     url_schemes=_URL_SCHEMES,
+                     filter_style_properties={"text-align"},
+                     set_tag_attribute_values={"img": {"loading": "lazy"}})
+    return {"html": safe, "toc": toc, "images": images}
+
+
+class RenderCache:
+    """(테이블, id, 컬럼, 버전) -> 렌더링 결과 LRU (스레드 안전)"""
+
+    def __init__(self, max_entries: int = CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[str, RenderedMarkdown]]" \
+            = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, text: str) -> Optional[RenderedMarkdown]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != text:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, text: str,
+            rendered: RenderedMarkdown) -> None:
+        with self._lock:
+            self._entries[key] = (text, rendered)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries),
+                    "max_entries": self.max_entries,
+                    "hits": self.hits, "misses": self.misses}
+
+
+render_cache = RenderCache()
+
+
+async def render_cached(table: str, row_id: int, column: str,
+                        version: datetime, text: Optional[str]
+                        ) -> RenderedMarkdown:
+    """행 단위로 메모이즈한 렌더링 (긴 본문은 스레드풀에서 변환)"""
+    text = text or ""
+    key = (table, row_id, column, version)
+    rendered = render_cache.get(key, text)
+    if rendered is None:
+        if len(text) > INLINE_RENDER_CHARS:
+            rendered = await run_in_threadpool(render_markdown, text)
+        else:
+            rendered = render_markdown(text)
+        render_cache.set(key, text, rendered)
+    return rendered
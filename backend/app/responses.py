@@ -0,0 +1,30 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """orjson 이 기본으로 처리하지 못하는 타입 변환 (SQLModel 객체 포함)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    # datetime/date/UUID/dataclass 는 orjson 이 직접 직렬화
+    return orjson.dumps(content, default=_default,
+                        option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 - 앱 전체 기본 응답 클래스"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
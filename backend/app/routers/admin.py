@@ -0,0 +1,66 @@
+from dataclasses import asdict
+from typing import Optional
+
+from app.cache import response_cache
+from app.database import engine
+from app.rendering import render_cache
+from app.security.security import require_admin
+from app.sql_logging import query_log
+from app.upload_gc import collect_garbage
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+class SqlLogSettings(BaseModel):
+    sample_rate: Optional[float] = Field(None, ge=0.0, le=1.0)
+    slow_query_ms: Optional[float] = Field(None, ge=0.0)
+
+
+@router.get("/cache/stats")
+async def get_cache_stats(admin: bool = Depends(require_admin)):
+    """응답 캐시 적중/미스/축출 통계 (+ 마크다운 렌더링 캐시)"""
+    return {**response_cache.stats(), "markdown": render_cache.stats()}
+
+
+@router.post("/cache/clear")
+async def clear_cache(admin: bool = Depends(require_admin)):
+    """응답 캐시/마크다운 렌더링 캐시 전체 비우기"""
+    response_cache.clear()
+    render_cache.clear()
+    return {"message": "Response cache cleared"}
+
+
+@router.get("/sql/slow-queries")
+async def get_slow_queries(admin: bool = Depends(require_admin)):
+    """최근 느린 쿼리 (최신순)와 SQL 로깅 설정"""
+    return {"settings": query_log.stats(),
+            "queries": query_log.slow_queries()}
+
+
+@router.post("/sql/slow-queries/clear")
+async def clear_slow_queries(admin: bool = Depends(require_admin)):
+    query_log.clear()
+    return {"message": "Slow query log cleared"}
+
+
+@router.put("/sql/settings")
+async def update_sql_settings(settings: SqlLogSettings,
+    admin: bool = Depends(require_admin)):
+    """샘플링 비율/느린 쿼리 기준 변경 (sample_rate=1.0 이면 전체 추적)"""
+    query_log.configure(sample_rate=settings.sample_rate,
+                        slow_query_ms=settings.slow_query_ms)
+    return query_log.stats()
+
+
+@router.post("/uploads/gc")
+async def collect_upload_garbage(
+    dry_run: bool = Query(False, description="True면 정리 대상만 반환"),
+    delete: bool = Query(False, description="True면 격리하지 않고 삭제"),
+    admin: bool = Depends(require_admin)):
+    """참조되지 않는 업로드 파일 정리 (파일/DB 작업은 스레드풀에서 실행)"""
+    result = await run_in_threadpool(collect_garbage, engine,
+                                     delete_files=delete, dry_run=dry_run)
+    return asdict(result)
@@ -1,61 +1,68 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..cache import invalidate_cache
 from ..database import get_db
 from ..models import Award
+from ..schemas import AwardRead, award_serializer, json_bytes_response
 from ..security.security import require_admin
 
 router = APIRouter(prefix="/api/awards", tags=["awards"])
 
 
-@router.get("/", response_model=List[Award])
-def get_awards(db: Session = Depends(get_db)):
-    return db.query(Award).order_by(Award.year.desc()).all()
+@router.get("/", response_model=List[AwardRead])
+async def get_awards(db: AsyncSession = Depends(get_db)):
+    rows = (await db.exec(
+        award_serializer.select().order_by(Award.year.desc()))).all()
+    return json_bytes_response(award_serializer.dump_many(rows))
 
 
 @router.post("/", response_model=Award)
-def create_award(
+async def create_award(
     award: Award,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     db.add(award)
-    db.commit()
-    db.refresh(award)
+    await db.commit()
+    invalidate_cache(Award)
+    await db.refresh(award)
     return award
 
 
 @router.put("/{award_id}", response_model=Award)
-def update_award(
+async def update_award(
     award_id: int,
     award: Award,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    db_award = db.query(Award).filter(Award.id == award_id).first()
+    db_award = await db.get(Award, award_id)
     if not db_award:
         raise HTTPException(status_code=404, detail="Award not found")
 
     for key, value in award.dict(exclude_unset=True).items():
         setattr(db_award, key, value)
 
-    db.commit()
-    db.refresh(db_award)
+    await db.commit()
+    invalidate_cache(Award)
+    await db.refresh(db_award)
     return db_award
 
 
 @router.delete("/{award_id}")
-def delete_award(
+async def delete_award(
     award_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    award = db.query(Award).filter(Award.id == award_id).first()
+    award = await db.get(Award, award_id)
     if not award:
         raise HTTPException(status_code=404, detail="Award not found")
 
-    db.delete(award)
-    db.commit()
+    await db.delete(award)
+    await db.commit()
+    invalidate_cache(Award)
     return {"message": "Award deleted successfully"}
@@ -0,0 +1,45 @@
+import asyncio
+from typing import List
+
+from app.database import AsyncSessionLocal
+from app.routers import research_areas, representative_works, publications, \
+    conferences, media, cover_arts
+from app.schemas import ResearchAreaRead, RepresentativeWorkRead, \
+    PublicationRead, ConferenceRead, MediaRead, CoverArtRead, \
+    json_bytes_response
+from fastapi import APIRouter
+from sqlmodel import SQLModel
+
+router = APIRouter(prefix="/api/bootstrap", tags=["bootstrap"])
+
+
+class BootstrapResponse(SQLModel):
+    research_areas: List[ResearchAreaRead] = []
+    representative_works: List[RepresentativeWorkRead] = []
+    publications: List[PublicationRead] = []
+    conferences: List[ConferenceRead] = []
+    media: List[MediaRead] = []
+    cover_arts: List[CoverArtRead] = []
+
+
+async def _load(loader, **params) -> bytes:
+    """각 조회를 별도 세션(커넥션)에서 실행 - 이벤트 루프에서 동시에 수행됨"""
+    async with AsyncSessionLocal() as db:
+        return (await loader(db=db, **params)).body
+
+
+@router.get("", response_model=BootstrapResponse)
+async def get_bootstrap():
+    """홈 페이지 첫 화면에 필요한 데이터를 한 번에 반환"""
+    parts = await asyncio.gather(
+        _load(research_areas.list_research_areas, active_only=True),
+        _load(representative_works.get_representative_works, active_only=True),
+        _load(publications.list_publications, status=["published"]),
+        _load(conferences.get_conferences),
+        _load(media.get_media),
+        _load(cover_arts.list_cover_arts, active_only=True),
+    )
+    # 각 라우터가 만든 JSON 바이트를 다시 파싱하지 않고 그대로 이어 붙임
+    body = b",".join(b'"%s":%s' % (name.encode(), part) for name, part in
+                     zip(BootstrapResponse.model_fields, parts))
+    return json_bytes_response(b"{" + body + b"}")
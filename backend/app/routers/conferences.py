@@ -2,55 +2,63 @@ from typing import List
 
 from app.security.security import require_admin
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..cache import invalidate_cache
 from ..database import get_db
 from ..models import Conference
+from ..schemas import ConferenceRead, conference_serializer, \
+    json_bytes_response
 
 router = APIRouter(prefix="/api/conferences", tags=["conferences"])
 
 
-@router.get("/", response_model=List[Conference])
-def get_conferences(db: Session = Depends(get_db)):
-    return db.query(Conference).order_by(Conference.date.desc()).all()
+@router.get("/", response_model=List[ConferenceRead])
+async def get_conferences(db: AsyncSession = Depends(get_db)):
+    rows = (await db.exec(
+        conference_serializer.select().order_by(Conference.date.desc()))).all()
+    return json_bytes_response(conference_serializer.dump_many(rows))
 
 
 @router.post("/", response_model=Conference)
-def create_conference(conference: Conference, db: Session = Depends(get_db),
+async def create_conference(conference: Conference,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)):
     db.add(conference)
-    db.commit()
-    db.refresh(conference)
+    await db.commit()
+    invalidate_cache(Conference)
+    await db.refresh(conference)
     return conference
 
 
 @router.put("/{conference_id}", response_model=Conference)
-def update_conference(conference_id: int, conference: Conference,
-    db: Session = Depends(get_db),
+async def update_conference(conference_id: int, conference: Conference,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    db_conference = db.query(Conference).filter(
-        Conference.id == conference_id).first()
+    db_conference = await db.get(Conference, conference_id)
     if not db_conference:
         raise HTTPException(status_code=404, detail="Conference not found")
 
     for key, value in conference.dict(exclude_unset=True).items():
         setattr(db_conference, key, value)
 
-    db.commit()
-    db.refresh(db_conference)
+    await db.commit()
+    invalidate_cache(Conference)
+    await db.refresh(db_conference)
     return db_conference
 
 
 @router.delete("/{conference_id}")
-def delete_conference(conference_id: int, db: Session = Depends(get_db),
+async def delete_conference(conference_id: int,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    conference = db.query(Conference).filter(
-        Conference.id == conference_id).first()
+    conference = await db.get(Conference, conference_id)
     if not conference:
         raise HTTPException(status_code=404, detail="Conference not found")
 
-    db.delete(conference)
-    db.commit()
+    await db.delete(conference)
+    await db.commit()
+    invalidate_cache(Conference)
     return {"message": "Conference deleted successfully"}
@@ -1,61 +1,67 @@
-import shutil
 from datetime import datetime
-from pathlib import Path
 from typing import List
 
+from app.cache import invalidate_cache
 from app.database import get_db
 from app.models import CoverArt
+from app.schemas import CoverArtRead, cover_art_serializer, \
+    json_bytes_response
 from app.security.security import require_admin
+from app.upload_store import store_uploads
+from app.uploads import COVER_ART_UPLOADS, UPLOAD_ROOT, accepts_uploads
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import File, UploadFile
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/api/cover-arts", tags=["cover-arts"])
 
-UPLOAD_DIR_CA = Path("../frontend/static/uploads/cover-arts")
+UPLOAD_DIR_CA = UPLOAD_ROOT / "cover-arts"
 UPLOAD_DIR_CA.mkdir(parents=True, exist_ok=True)
 
 
-@router.get("/", response_model=List[CoverArt])
-def list_cover_arts(
+@router.get("/", response_model=List[CoverArtRead])
+async def list_cover_arts(
     active_only: bool = Query(False, description="True면 is_active 항목만"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(CoverArt)
+    query = cover_art_serializer.select()
     if active_only:
-        query = query.filter(CoverArt.is_active == True)
-    return query.order_by(
+        query = query.where(CoverArt.is_active == True)
+    rows = (await db.exec(query.order_by(
         CoverArt.order_index.asc(),
         CoverArt.id.desc()
-    ).all()
+    ))).all()
+    return json_bytes_response(cover_art_serializer.dump_many(rows))
 
 
-@router.get("/{item_id}", response_model=CoverArt)
-def get_cover_art(item_id: int, db: Session = Depends(get_db)):
-    item = db.query(CoverArt).filter(CoverArt.id == item_id).first()
-    if not item:
+@router.get("/{item_id}", response_model=CoverArtRead)
+async def get_cover_art(item_id: int, db: AsyncSession = Depends(get_db)):
+    row = (await db.exec(cover_art_serializer.select().where(
+        CoverArt.id == item_id))).first()
+    if not row:
         raise HTTPException(status_code=404, detail="CoverArt not found")
-    return item
+    return json_bytes_response(cover_art_serializer.dump_one(row))
 
 
 @router.post("/", response_model=CoverArt)
-def create_cover_art(item: CoverArt, db: Session = Depends(get_db),
+async def create_cover_art(item: CoverArt, db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)):
     item.updated_at = datetime.utcnow()
     db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    invalidate_cache(CoverArt)
+    await db.refresh(item)
     return item
 
 
 @router.put("/{item_id}", response_model=CoverArt)
-def update_cover_art(
+async def update_cover_art(
     item_id: int,
     patch: CoverArt,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    db_item = db.query(CoverArt).filter(CoverArt.id == item_id).first()
+    db_item = await db.get(CoverArt, item_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="CoverArt not found")
 
@@ -65,33 +71,31 @@ def update_cover_art(
     db_item.updated_at = datetime.utcnow()
 
     db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
+    await db.commit()
+    invalidate_cache(CoverArt)
+    await db.refresh(db_item)
     return db_item
 
 
 @router.delete("/{item_id}")
-def delete_cover_art(item_id: int, db: Session = Depends(get_db),
+async def delete_cover_art(item_id: int, db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)):
-    item = db.query(CoverArt).filter(CoverArt.id == item_id).first()
+    item = await db.get(CoverArt, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="CoverArt not found")
-    db.delete(item)
-    db.commit()
+    await db.delete(item)
+    await db.commit()
+    invalidate_cache(CoverArt)
     return {"message": "CoverArt deleted successfully"}
 
 
 @router.post("/upload-image")
-async def upload_cover_art_image(file: UploadFile = File(...),
+@accepts_uploads(COVER_ART_UPLOADS)
+async def upload_cover_art_image(
+    files: List[UploadFile] = File(..., alias="file"),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)):
-    if not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="File must be an image")
-
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{file.filename}"
-    file_path = UPLOAD_DIR_CA / filename
-
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    return {"image_path": f"/static/uploads/cover-arts/{filename}"}
+    filenames = await store_uploads(db, files, UPLOAD_DIR_CA,
+                                    COVER_ART_UPLOADS)
+    paths = [f"/static/uploads/cover-arts/{name}" for name in filenames]
+    return {"image_path": paths[0], "image_paths": paths}
@@ -1,11 +1,21 @@
-import os
-import shutil
 from datetime import datetime
-from typing import List, Optional
-
+from typing import List, Literal, Optional, Sequence, Tuple
+
+from app.cv_history import get_active_document, record_version, \
+    set_active_document
+from app.export_cache import docx_path, ensure_docx, open_docx, \
+    remove_exports
+from app.rendering import TocEntry, render_cached
+from app.routers.cv_markdown import EXPORT_FORMAT, RENDER_CONTENT, \
+    attachment_headers, docx_response, read_document
 from app.security.security import require_admin
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlmodel import Session, select, SQLModel
+from app.upload_store import store_uploads
+from app.uploads import IMAGE_UPLOADS, UPLOAD_ROOT, accepts_uploads
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, \
+    UploadFile, File, Query
+from fastapi.responses import Response
+from sqlmodel import select, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..database import get_db
 from ..models import CVProfile, ContactInfo, CVSection, MarkdownCV
@@ -36,6 +46,20 @@ class CVProfileCreate(SQLModel):
     cv_sections: List[CVSectionCreate] = []
 
 
+class CVSectionRead(SQLModel):
+    id: int
+    profile_id: int
+    title: str
+    content: str
+    order_index: int
+    created_at: datetime
+    updated_at: datetime
+    # ?render=html 일 때만 채움
+    html: Optional[str] = None
+    toc: Optional[List[TocEntry]] = None
+    images: Optional[List[str]] = None
+
+
 class CVProfileResponse(SQLModel):
     id: int
     name: str
@@ -46,15 +70,24 @@ class CVProfileResponse(SQLModel):
     created_at: datetime
     updated_at: datetime
     contact_info: List[ContactInfo] = []
-    cv_sections: List[CVSection] = []
+    cv_sections: List[CVSectionRead] = []
 
 
-# 활성 CV 프로필 조회 (공개용)
-@router.get("/profile", response_model=CVProfileResponse)
-async def get_active_cv_profile(session: Session = Depends(get_db)):
-    # 활성 프로필 조회
+async def _read_section(section: CVSection,
+                        render: Optional[str]) -> CVSectionRead:
+    read = CVSectionRead.model_validate(section, from_attributes=True)
+    if render == "html":
+        rendered = await render_cached("cvsection", section.id, "content",
+                                       section.updated_at, section.content)
+        read = read.model_copy(update=rendered)
+    return read
+
+
+async def _load_active_profile(session: AsyncSession) -> Tuple[
+        CVProfile, Sequence[ContactInfo], Sequence[CVSection]]:
+    """활성 프로필과 연락처/섹션 (순서대로)"""
     statement = select(CVProfile).where(CVProfile.is_active == True)
-    profile = session.exec(statement).first()
+    profile = (await session.exec(statement)).first()
 
     if not profile:
         raise HTTPException(status_code=404,
@@ -64,13 +97,53 @@ async def get_active_cv_profile(session: Session = Depends(get_db)):
     contact_statement = select(ContactInfo).where(
         ContactInfo.profile_id == profile.id
     ).order_by(ContactInfo.order_index)
-    contact_info = session.exec(contact_statement).all()
+    contact_info = (await session.exec(contact_statement)).all()
 
     # CV 섹션 조회
     section_statement = select(CVSection).where(
         CVSection.profile_id == profile.id
     ).order_by(CVSection.order_index)
-    cv_sections = session.exec(section_statement).all()
+    cv_sections = (await session.exec(section_statement)).all()
+    return profile, contact_info, cv_sections
+
+
+def profile_markdown(profile: CVProfile, contact_info: Sequence[ContactInfo],
+                     cv_sections: Sequence[CVSection]) -> str:
+    """프로필 전체를 하나의 마크다운 문서로 (내보내기용)"""
+    lines = [f"# {profile.name}", ""]
+    if profile.profile_image:
+        lines += [f"![{profile.name}]({profile.profile_image})", ""]
+    if profile.title:
+        lines += [f"**{profile.title}**", ""]
+    if profile.bio:
+        lines += [profile.bio, ""]
+    for contact in contact_info:
+        value = contact.value
+        if contact.data_type == "email":
+            value = f"[{value}](mailto:{value})"
+        elif contact.data_type == "link":
+            value = f"[{value}]({value})"
+        lines.append(f"- **{contact.label}**: {value}")
+    for section in cv_sections:
+        lines += ["", f"## {section.title}", "", section.content]
+    return "\n".join(lines) + "\n"
+
+
+def profile_docx_path(profile: CVProfile, markdown: str):
+    """프로필 버전(updated_at)별 DOCX 캐시 경로"""
+    return docx_path("cvprofile", profile.id,
+                     profile.updated_at.strftime("%Y%m%d%H%M%S"),
+                     profile.name, markdown)
+
+
+# 활성 CV 프로필 조회 (공개용)
+@router.get("/profile", response_model=CVProfileResponse)
+async def get_active_cv_profile(
+    session: AsyncSession = Depends(get_db),
+    render: Optional[Literal["html"]] = Query(
+        None, description="html 이면 각 섹션 content 를 렌더링한 "
+                          "html/toc/images 추가")):
+    profile, contact_info, cv_sections = await _load_active_profile(session)
 
     # 응답 생성
     response = CVProfileResponse(
@@ -83,23 +156,43 @@ async def get_active_cv_profile(session: Session = Depends(get_db)):
         created_at=profile.created_at,
         updated_at=profile.updated_at,
         contact_info=list(contact_info),
-        cv_sections=list(cv_sections)
+        cv_sections=[await _read_section(section, render)
+                     for section in cv_sections]
     )
 
     return response
 
 
+# 활성 CV 프로필 내보내기 (공개용)
+@router.get("/profile/export")
+async def export_active_cv_profile(
+    export_format: Literal["md", "docx"] = EXPORT_FORMAT,
+    session: AsyncSession = Depends(get_db)):
+    profile, contact_info, cv_sections = await _load_active_profile(session)
+    markdown = profile_markdown(profile, contact_info, cv_sections)
+    filename = profile.name.replace(' ', '_')
+
+    if export_format == "docx":
+        handle = await open_docx(profile_docx_path(profile, markdown),
+                                 profile.name, markdown)
+        return docx_response(handle, f"{filename}.docx")
+    return Response(
+        content=markdown, media_type="text/markdown",
+        headers=attachment_headers(f"{filename}.md"))
+
+
 # CV 프로필 생성/업데이트 (관리자용)
 @router.post("/profile", response_model=CVProfileResponse)
 async def create_or_update_cv_profile(
     profile_data: CVProfileCreate,
-    session: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 
 ):
     # 기존 활성 프로필 비활성화
-    existing_profiles = session.exec(
-        select(CVProfile).where(CVProfile.is_active == True)).all()
+    existing_profiles = (await session.exec(
+        select(CVProfile).where(CVProfile.is_active == True))).all()
     for existing in existing_profiles:
         existing.is_active = False
         session.add(existing)
@@ -114,8 +207,8 @@ async def create_or_update_cv_profile(
         updated_at=datetime.utcnow()
     )
     session.add(new_profile)
-    session.commit()
-    session.refresh(new_profile)
+    await session.commit()
+    await session.refresh(new_profile)
 
     # 연락처 정보 추가
     for contact_data in profile_data.contact_info:
@@ -138,7 +231,18 @@ async def create_or_update_cv_profile(
         )
         session.add(section)
 
-    session.commit()
+    await session.commit()
+
+    # 교체된 프로필은 더 이상 내보내지 않으므로 파일 정리
+    for existing in existing_profiles:
+        await remove_exports("cvprofile", existing.id)
+
+    # 첫 다운로드를 기다리지 않도록 응답 후 DOCX 미리 생성
+    profile, contact_info, cv_sections = await _load_active_profile(session)
+    markdown = profile_markdown(profile, contact_info, cv_sections)
+    background_tasks.add_task(ensure_docx,
+                              profile_docx_path(profile, markdown),
+                              profile.name, markdown)
 
     # 응답을 위해 다시 조회
     return await get_active_cv_profile(session)
@@ -146,34 +250,32 @@ async def create_or_update_cv_profile(
 
 # 프로필 이미지 업로드
 @router.post("/upload-image")
-async def upload_profile_image(file: UploadFile = File(...),
+@accepts_uploads(IMAGE_UPLOADS)
+async def upload_profile_image(
+    files: List[UploadFile] = File(..., alias="file"),
+    session: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)):
-    # 업로드 디렉토리 생성
-    upload_dir = "../frontend/static/uploads/profiles"
-    os.makedirs(upload_dir, exist_ok=True)
-
-    # 파일 저장
-    file_path = os.path.join(upload_dir,
-                             f"{datetime.now().timestamp()}_{file.filename}")
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # 내용 해시를 파일명으로 저장
+    filenames = await store_uploads(session, files, UPLOAD_ROOT / "profiles",
+                                    IMAGE_UPLOADS)
 
-    return {"image_url": f"/{file_path}"}
+    urls = [f"/static/uploads/profiles/{name}" for name in filenames]
+    return {"image_url": urls[0], "image_urls": urls}
 
 
 # 기존 마크다운 CV와의 호환성 유지
 @router.get("/markdown/active")
-async def get_active_markdown_cv(session: Session = Depends(get_db)
+async def get_active_markdown_cv(
+    render: Optional[Literal["html"]] = RENDER_CONTENT,
+    session: AsyncSession = Depends(get_db)
 ):
-    statement = select(MarkdownCV).where(MarkdownCV.is_active == True).order_by(
-        MarkdownCV.version.desc())
-    cv = session.exec(statement).first()
+    cv = await get_active_document(session)
 
     if not cv:
         raise HTTPException(status_code=404,
                             detail="No active markdown CV found")
 
-    return cv
+    return await read_document(cv, render, is_active=True)
 
 
 # 마크다운 CV 생성/업데이트
@@ -182,31 +284,27 @@ async def create_markdown_cv(
     title: str,
     content: str,
     description: Optional[str] = None,
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    # 기존 활성 CV 비활성화
-    existing_cvs = session.exec(
-        select(MarkdownCV).where(MarkdownCV.is_active == True)).all()
-    for existing in existing_cvs:
-        existing.is_active = False
-        session.add(existing)
-
-    # 새 버전 번호 계산
-    latest_version = session.exec(
-        select(MarkdownCV).order_by(MarkdownCV.version.desc())).first()
-    new_version = (latest_version.version + 1) if latest_version else 1
-
-    # 새 CV 생성
-    new_cv = MarkdownCV(
-        title=title,
-        content=content,
-        description=description,
-        is_active=True,
-        version=new_version
-    )
-    session.add(new_cv)
-    session.commit()
-    session.refresh(new_cv)
-
-    return new_cv
+    # 활성 문서가 있으면 새 버전으로 저장 (전체 복사 대신 델타 기록)
+    cv = await get_active_document(session)
+    if cv is None:
+        cv = MarkdownCV(title=title, content=content, description=description)
+        session.add(cv)
+        await session.flush()
+        await record_version(session, cv)
+        await set_active_document(session, cv.id)
+    else:
+        if content != cv.content:
+            previous = cv.content
+            cv.content = content
+            cv.version += 1
+            await record_version(session, cv, previous)
+        cv.title = title
+        cv.description = description
+        cv.updated_at = datetime.utcnow()
+    await session.commit()
+    await session.refresh(cv)
+
+    return await read_document(cv, is_active=True)
@@ -1,12 +1,24 @@
+import os
 from datetime import datetime
-from typing import List, Optional
+from difflib import unified_diff
+from typing import BinaryIO, List, Literal, Optional
+from urllib.parse import quote
 
+from app.cv_history import active_document_id, delete_history, \
+    get_active_document, list_revisions, load_version, record_version, \
+    set_active_document
 from app.database import get_db
+from app.export_cache import DOCX_MEDIA_TYPE, docx_path, ensure_docx, \
+    open_docx, remove_exports
 from app.models import MarkdownCV
+from app.rendering import TocEntry, render_cached
 from app.security.security import require_admin
-from fastapi import APIRouter, HTTPException, Depends
+from app.uploads import CHUNK_SIZE
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/api/cv-markdown", tags=["cv-markdown"])
 
@@ -23,30 +35,128 @@ class CVMarkdownUpdate(BaseModel):
     description: Optional[str] = None
 
 
-@router.get("/documents", response_model=List[MarkdownCV])
-def get_cv_documents(db: Session = Depends(get_db)):
-    """모든 마크다운 CV 문서 목록 조회"""
-    return db.query(MarkdownCV).order_by(MarkdownCV.updated_at.desc()).all()
+class MarkdownCVRead(SQLModel):
+    id: int
+    title: str
+    content: str
+    description: Optional[str] = None
+    is_active: bool = False  # activemarkdowncv 포인터가 가리키는 문서인지
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    # ?render=html 일 때만 채움
+    html: Optional[str] = None
+    toc: Optional[List[TocEntry]] = None
+    images: Optional[List[str]] = None
+
+
+class RevisionRead(SQLModel):
+    version: int
+    is_snapshot: bool
+    size: int  # 본문 바이트 수
+    stored_size: int  # 압축한 스냅샷/델타 바이트 수
+    created_at: datetime
+
+
+class VersionRead(SQLModel):
+    document_id: int
+    version: int
+    content: str
 
 
-@router.get("/documents/active", response_model=Optional[MarkdownCV])
-def get_active_cv_document(db: Session = Depends(get_db)):
-    """현재 활성화된 CV 문서 조회"""
-    return db.query(MarkdownCV).filter(MarkdownCV.is_active == True).first()
+class VersionDiff(SQLModel):
+    document_id: int
+    from_version: int
+    to_version: int
+    diff: str  # unified diff
 
 
-@router.get("/documents/{doc_id}", response_model=MarkdownCV)
-def get_cv_document(doc_id: int, db: Session = Depends(get_db)):
-    """특정 CV 문서 조회"""
-    cv_doc = db.query(MarkdownCV).filter(MarkdownCV.id == doc_id).first()
+RENDER_CONTENT = Query(
+    None, description="html 이면 content 를 렌더링한 html/toc/images 추가")
+EXPORT_FORMAT = Query("md", alias="format",
+                      description="md: 마크다운 원문, docx: Word 문서")
+
+
+def attachment_headers(filename: str) -> dict:
+    """다운로드 헤더 (한글 파일명은 RFC 5987 형식)"""
+    return {"Content-Disposition":
+            f"attachment; filename*=utf-8''{quote(filename)}"}
+
+
+def docx_response(handle: BinaryIO, filename: str) -> StreamingResponse:
+    """open_docx 로 연 파일을 스트리밍 (경로가 그 사이 지워져도 끝까지 전송)"""
+    size = os.fstat(handle.fileno()).st_size
+
+    def chunks():
+        with handle:
+            while chunk := handle.read(CHUNK_SIZE):
+                yield chunk
+
+    return StreamingResponse(
+        chunks(), media_type=DOCX_MEDIA_TYPE,
+        headers={**attachment_headers(filename),
+                 "Content-Length": str(size)})
+
+
+def document_docx_path(cv_doc: MarkdownCV):
+    """문서 버전별 DOCX 캐시 경로"""
+    return docx_path("markdowncv", cv_doc.id, f"v{cv_doc.version}",
+                     cv_doc.title, cv_doc.content)
+
+
+async def read_document(cv_doc: MarkdownCV, render: Optional[str] = None,
+                        is_active: bool = False) -> MarkdownCVRead:
+    """응답용 문서 (render 가 html 이면 렌더링 결과 포함)"""
+    document = MarkdownCVRead.model_validate(cv_doc, from_attributes=True)
+    document.is_active = is_active
+    if render == "html":
+        rendered = await render_cached("markdowncv", cv_doc.id, "content",
+                                       cv_doc.updated_at, cv_doc.content)
+        document = document.model_copy(update=rendered)
+    return document
+
+
+async def _get_document(db: AsyncSession, doc_id: int) -> MarkdownCV:
+    cv_doc = await db.get(MarkdownCV, doc_id)
     if not cv_doc:
         raise HTTPException(status_code=404, detail="Document not found")
     return cv_doc
 
 
-@router.post("/documents", response_model=MarkdownCV)
-def create_cv_document(cv_data: CVMarkdownCreate,
-    db: Session = Depends(get_db),
+@router.get("/documents", response_model=List[MarkdownCVRead])
+async def get_cv_documents(db: AsyncSession = Depends(get_db)):
+    """모든 마크다운 CV 문서 목록 조회"""
+    active_id = await active_document_id(db)
+    result = await db.exec(
+        select(MarkdownCV).order_by(MarkdownCV.updated_at.desc()))
+    return [await read_document(cv_doc, is_active=cv_doc.id == active_id)
+            for cv_doc in result.all()]
+
+
+@router.get("/documents/active", response_model=Optional[MarkdownCVRead])
+async def get_active_cv_document(
+    render: Optional[Literal["html"]] = RENDER_CONTENT,
+    db: AsyncSession = Depends(get_db)):
+    """현재 활성화된 CV 문서 조회"""
+    cv_doc = await get_active_document(db)
+    return await read_document(cv_doc, render, is_active=True) \
+        if cv_doc else None
+
+
+@router.get("/documents/{doc_id}", response_model=MarkdownCVRead)
+async def get_cv_document(doc_id: int,
+    render: Optional[Literal["html"]] = RENDER_CONTENT,
+    db: AsyncSession = Depends(get_db)):
+    """특정 CV 문서 조회"""
+    cv_doc = await _get_document(db, doc_id)
+    return await read_document(cv_doc, render,
+                               is_active=await active_document_id(db) == doc_id)
+
+
+@router.post("/documents", response_model=MarkdownCVRead)
+async def create_cv_document(cv_data: CVMarkdownCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     """새 마크다운 CV 문서 생성"""
@@ -55,48 +165,57 @@ def create_cv_document(cv_data: CVMarkdownCreate,
             title=cv_data.title,
             content=cv_data.content,
             description=cv_data.description,
-            is_active=False
         )
 
         db.add(cv_doc)
-        db.commit()
-        db.refresh(cv_doc)
+        await db.flush()
+        await record_version(db, cv_doc)
+        await db.commit()
+        await db.refresh(cv_doc)
 
-        return cv_doc
+        # 첫 다운로드를 기다리지 않도록 응답 후 미리 생성
+        background_tasks.add_task(ensure_docx, document_docx_path(cv_doc),
+                                  cv_doc.title, cv_doc.content)
+        return await read_document(cv_doc)
 
     except Exception as e:
         raise HTTPException(status_code=500,
                             detail=f"Failed to create document: {str(e)}")
 
 
-@router.put("/documents/{doc_id}", response_model=MarkdownCV)
-def update_cv_document(
+@router.put("/documents/{doc_id}", response_model=MarkdownCVRead)
+async def update_cv_document(
     doc_id: int,
     cv_data: CVMarkdownUpdate,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     """CV 문서 수정"""
-    cv_doc = db.query(MarkdownCV).filter(MarkdownCV.id == doc_id).first()
-    if not cv_doc:
-        raise HTTPException(status_code=404, detail="Document not found")
+    cv_doc = await _get_document(db, doc_id)
 
     try:
         # 수정된 필드만 업데이트
         if cv_data.title is not None:
             cv_doc.title = cv_data.title
-        if cv_data.content is not None:
+        if cv_data.content is not None and cv_data.content != cv_doc.content:
+            # 내용이 변경되면 버전 증가 + 직전 버전 대비 델타 기록
+            previous = cv_doc.content
             cv_doc.content = cv_data.content
-            cv_doc.version += 1  # 내용이 변경되면 버전 증가
+            cv_doc.version += 1
+            await record_version(db, cv_doc, previous)
         if cv_data.description is not None:
             cv_doc.description = cv_data.description
 
         cv_doc.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(cv_doc)
+        await db.commit()
+        await db.refresh(cv_doc)
 
-        return cv_doc
+        background_tasks.add_task(ensure_docx, document_docx_path(cv_doc),
+                                  cv_doc.title, cv_doc.content)
+        return await read_document(
+            cv_doc, is_active=await active_document_id(db) == doc_id)
 
     except Exception as e:
         raise HTTPException(status_code=500,
@@ -104,22 +223,15 @@ def update_cv_document(
 
 
 @router.post("/documents/{doc_id}/set-active")
-def set_active_cv_document(doc_id: int, db: Session = Depends(get_db),
+async def set_active_cv_document(doc_id: int,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    """CV 문서를 활성화 (다른 모든 문서는 비활성화)"""
+    """CV 문서를 활성화 (활성 포인터 한 행만 갱신)"""
     try:
-        # 모든 문서를 비활성화
-        db.query(MarkdownCV).update({MarkdownCV.is_active: False})
-
-        # 선택된 문서만 활성화
-        cv_doc = db.query(MarkdownCV).filter(MarkdownCV.id == doc_id).first()
-        if not cv_doc:
-            raise HTTPException(status_code=404, detail="Document not found")
-
-        cv_doc.is_active = True
-        cv_doc.updated_at = datetime.utcnow()
-        db.commit()
+        cv_doc = await _get_document(db, doc_id)
+        await set_active_document(db, doc_id)
+        await db.commit()
 
         return {"message": f"Document '{cv_doc.title}' is now active"}
 
@@ -131,17 +243,17 @@ def set_active_cv_document(doc_id: int, db: Session = Depends(get_db),
 
 
 @router.delete("/documents/{doc_id}")
-def delete_cv_document(doc_id: int, db: Session = Depends(get_db),
+async def delete_cv_document(doc_id: int, db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     """CV 문서 삭제"""
-    cv_doc = db.query(MarkdownCV).filter(MarkdownCV.id == doc_id).first()
-    if not cv_doc:
-        raise HTTPException(status_code=404, detail="Document not found")
+    cv_doc = await _get_document(db, doc_id)
 
     try:
-        db.delete(cv_doc)
-        db.commit()
+        await delete_history(db, doc_id)
+        await db.delete(cv_doc)
+        await db.commit()
+        await remove_exports("markdowncv", doc_id)
 
         return {"message": "Document deleted successfully"}
 
@@ -151,11 +263,17 @@ def delete_cv_document(doc_id: int, db: Session = Depends(get_db),
 
 
 @router.get("/documents/{doc_id}/export")
-def export_cv_markdown(doc_id: int, db: Session = Depends(get_db)):
-    """마크다운 파일로 다운로드"""
-    cv_doc = db.query(MarkdownCV).filter(MarkdownCV.id == doc_id).first()
-    if not cv_doc:
-        raise HTTPException(status_code=404, detail="Document not found")
+async def export_cv_markdown(doc_id: int,
+    export_format: Literal["md", "docx"] = EXPORT_FORMAT,
+    db: AsyncSession = Depends(get_db)):
+    """마크다운 또는 DOCX 파일로 다운로드"""
+    cv_doc = await _get_document(db, doc_id)
+
+    if export_format == "docx":
+        handle = await open_docx(document_docx_path(cv_doc), cv_doc.title,
+                                 cv_doc.content)
+        return docx_response(handle,
+                             f"{cv_doc.title.replace(' ', '_')}.docx")
 
     from fastapi.responses import Response
 
@@ -164,5 +282,73 @@ def export_cv_markdown(doc_id: int, db: Session = Depends(get_db)):
     return Response(
         content=cv_doc.content,
         media_type="text/markdown",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        headers=attachment_headers(filename)
     )
+
+
+@router.get("/documents/{doc_id}/history",
+            response_model=List[RevisionRead])
+async def get_cv_document_history(doc_id: int,
+    db: AsyncSession = Depends(get_db),
+    admin: bool = Depends(require_admin)):
+    """버전 기록 (최신 버전부터, 본문 없이 저장 크기만)"""
+    await _get_document(db, doc_id)
+    return [RevisionRead(version=row.version,
+                         is_snapshot=row.base_version == row.version,
+                         size=row.size, stored_size=row.stored_size,
+                         created_at=row.created_at)
+            for row in await list_revisions(db, doc_id)]
+
+
+async def _load_version(db: AsyncSession, cv_doc: MarkdownCV,
+                        version: int) -> str:
+    content = await load_version(db, cv_doc, version)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Version not found")
+    return content
+
+
+@router.get("/documents/{doc_id}/versions/{version}",
+            response_model=VersionRead)
+async def get_cv_document_version(doc_id: int, version: int,
+    db: AsyncSession = Depends(get_db),
+    admin: bool = Depends(require_admin)):
+    """특정 버전의 본문 (가까운 스냅샷에서 델타를 적용해 복원)"""
+    cv_doc = await _get_document(db, doc_id)
+    return VersionRead(document_id=doc_id, version=version,
+                       content=await _load_version(db, cv_doc, version))
+
+
+@router.get("/documents/{doc_id}/diff", response_model=VersionDiff)
+async def get_cv_document_diff(doc_id: int,
+    from_version: Optional[int] = Query(
+        None, alias="from", description="기본값: to 의 직전 버전"),
+    to_version: Optional[int] = Query(
+        None, alias="to", description="기본값: 최신 버전"),
+    db: AsyncSession = Depends(get_db),
+    admin: bool = Depends(require_admin)):
+    """두 버전의 unified diff"""
+    cv_doc = await _get_document(db, doc_id)
+    to_version = cv_doc.version if to_version is None else to_version
+    from_version = to_version - 1 if from_version is None else from_version
+    old = await _load_version(db, cv_doc, from_version)
+    new = await _load_version(db, cv_doc, to_version)
+    diff = unified_diff(old.splitlines(keepends=True),
+                        new.splitlines(keepends=True),
+                        fromfile=f"v{from_version}", tofile=f"v{to_version}")
+    return VersionDiff(document_id=doc_id, from_version=from_version,
+                       to_version=to_version, diff="".join(diff))
+
+
+@router.post("/documents/{doc_id}/versions/{version}/restore",
+             response_model=MarkdownCVRead)
+async def restore_cv_document_version(doc_id: int, version: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    admin: bool = Depends(require_admin)):
+    """이전 버전의 본문을 새 버전으로 저장"""
+    cv_doc = await _get_document(db, doc_id)
+    return await update_cv_document(
+        doc_id, CVMarkdownUpdate(
+            content=await _load_version(db, cv_doc, version)),
+        background_tasks, db, admin)
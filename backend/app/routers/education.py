@@ -2,63 +2,69 @@ from typing import List
 
 from app.security.security import require_admin
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..database import get_db
 from ..models import Education
+from ..schemas import EducationRead, education_serializer, \
+    json_bytes_response
 
 router = APIRouter(prefix="/api/education", tags=["education"])
 
 
-@router.get("/", response_model=List[Education])
-def get_education(db: Session = Depends(get_db)):
-    return db.query(Education).all()
+@router.get("/", response_model=List[EducationRead])
+async def get_education(db: AsyncSession = Depends(get_db)):
+    rows = (await db.exec(education_serializer.select())).all()
+    return json_bytes_response(education_serializer.dump_many(rows))
 
 
-@router.get("/{education_id}", response_model=Education)
-def get_education_item(education_id: int, db: Session = Depends(get_db)):
-    education = db.query(Education).filter(Education.id == education_id).first()
-    if not education:
+@router.get("/{education_id}", response_model=EducationRead)
+async def get_education_item(education_id: int,
+    db: AsyncSession = Depends(get_db)):
+    row = (await db.exec(education_serializer.select().where(
+        Education.id == education_id))).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Education item not found")
-    return education
+    return json_bytes_response(education_serializer.dump_one(row))
 
 
 # Admin CRUD operations
 @router.post("/", response_model=Education)
-def create_education(education: Education, db: Session = Depends(get_db),
+async def create_education(education: Education,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     db.add(education)
-    db.commit()
-    db.refresh(education)
+    await db.commit()
+    await db.refresh(education)
     return education
 
 
 @router.put("/{education_id}", response_model=Education)
-def update_education(education_id: int, education: Education,
-    db: Session = Depends(get_db),
+async def update_education(education_id: int, education: Education,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    db_education = db.query(Education).filter(
-        Education.id == education_id).first()
+    db_education = await db.get(Education, education_id)
     if not db_education:
         raise HTTPException(status_code=404, detail="Education item not found")
 
     for key, value in education.dict(exclude_unset=True).items():
         setattr(db_education, key, value)
 
-    db.commit()
-    db.refresh(db_education)
+    await db.commit()
+    await db.refresh(db_education)
     return db_education
 
 
 @router.delete("/{education_id}")
-def delete_education(education_id: int, db: Session = Depends(get_db),
+async def delete_education(education_id: int,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)):
-    education = db.query(Education).filter(Education.id == education_id).first()
+    education = await db.get(Education, education_id)
     if not education:
         raise HTTPException(status_code=404, detail="Education item not found")
 
-    db.delete(education)
-    db.commit()
+    await db.delete(education)
+    await db.commit()
     return {"message": "Education item deleted successfully"}
@@ -2,55 +2,58 @@ from typing import List
 
 from app.security.security import require_admin
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..database import get_db
 from ..models import Experience
+from ..schemas import ExperienceRead, experience_serializer, \
+    json_bytes_response
 
 router = APIRouter(prefix="/api/experience", tags=["experience"])
 
 
-@router.get("/", response_model=List[Experience])
-def get_experience(db: Session = Depends(get_db)):
-    return db.query(Experience).all()
+@router.get("/", response_model=List[ExperienceRead])
+async def get_experience(db: AsyncSession = Depends(get_db)):
+    rows = (await db.exec(experience_serializer.select())).all()
+    return json_bytes_response(experience_serializer.dump_many(rows))
 
 
 @router.post("/", response_model=Experience)
-def create_experience(experience: Experience, db: Session = Depends(get_db),
+async def create_experience(experience: Experience,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)):
     db.add(experience)
-    db.commit()
-    db.refresh(experience)
+    await db.commit()
+    await db.refresh(experience)
     return experience
 
 
 @router.put("/{experience_id}", response_model=Experience)
-def update_experience(experience_id: int, experience: Experience,
-    db: Session = Depends(get_db),
+async def update_experience(experience_id: int, experience: Experience,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    db_experience = db.query(Experience).filter(
-        Experience.id == experience_id).first()
+    db_experience = await db.get(Experience, experience_id)
     if not db_experience:
         raise HTTPException(status_code=404, detail="Experience item not found")
 
     for key, value in experience.dict(exclude_unset=True).items():
         setattr(db_experience, key, value)
 
-    db.commit()
-    db.refresh(db_experience)
+    await db.commit()
+    await db.refresh(db_experience)
     return db_experience
 
 
 @router.delete("/{experience_id}")
-def delete_experience(experience_id: int, db: Session = Depends(get_db),
+async def delete_experience(experience_id: int,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    experience = db.query(Experience).filter(
-        Experience.id == experience_id).first()
+    experience = await db.get(Experience, experience_id)
     if not experience:
         raise HTTPException(status_code=404, detail="Experience item not found")
 
-    db.delete(experience)
-    db.commit()
+    await db.delete(experience)
+    await db.commit()
     return {"message": "Experience item deleted successfully"}
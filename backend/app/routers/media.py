@@ -2,53 +2,61 @@ from typing import List
 
 from app.security.security import require_admin
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..cache import invalidate_cache
 from ..database import get_db
 from ..models import Media
+from ..schemas import MediaRead, media_serializer, json_bytes_response
 
 router = APIRouter(prefix="/api/media", tags=["media"])
 
 
-@router.get("/", response_model=List[Media])
-def get_media(db: Session = Depends(get_db)):
-    return db.query(Media).order_by(Media.date.desc()).all()
+@router.get("/", response_model=List[MediaRead])
+async def get_media(db: AsyncSession = Depends(get_db)):
+    rows = (await db.exec(
+        media_serializer.select().order_by(Media.date.desc()))).all()
+    return json_bytes_response(media_serializer.dump_many(rows))
 
 
 @router.post("/", response_model=Media)
-def create_media(media: Media, db: Session = Depends(get_db),
+async def create_media(media: Media, db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     db.add(media)
-    db.commit()
-    db.refresh(media)
+    await db.commit()
+    invalidate_cache(Media)
+    await db.refresh(media)
     return media
 
 
 @router.put("/{media_id}", response_model=Media)
-def update_media(media_id: int, media: Media, db: Session = Depends(get_db),
+async def update_media(media_id: int, media: Media,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    db_media = db.query(Media).filter(Media.id == media_id).first()
+    db_media = await db.get(Media, media_id)
     if not db_media:
         raise HTTPException(status_code=404, detail="Media item not found")
 
     for key, value in media.dict(exclude_unset=True).items():
         setattr(db_media, key, value)
 
-    db.commit()
-    db.refresh(db_media)
+    await db.commit()
+    invalidate_cache(Media)
+    await db.refresh(db_media)
     return db_media
 
 
 @router.delete("/{media_id}")
-def delete_media(media_id: int, db: Session = Depends(get_db),
+async def delete_media(media_id: int, db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    media = db.query(Media).filter(Media.id == media_id).first()
+    media = await db.get(Media, media_id)
     if not media:
         raise HTTPException(status_code=404, detail="Media item not found")
 
-    db.delete(media)
-    db.commit()
+    await db.delete(media)
+    await db.commit()
+    invalidate_cache(Media)
     return {"message": "Media item deleted successfully"}
@@ -1,103 +1,213 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import List, Optional, Tuple
 
+from app.cache import invalidate_cache
 from app.database import get_db
+from app.facets import publication_index
 from app.models import Publication
+from app.publication_import import ImportFormatError, ImportResult, \
+    import_publications, parse_stream
+from app.schemas import PublicationRead, PublicationSearchResult, \
+    publication_serializer, json_bytes_response
+from app.search import full_text_search
 from app.security.security import require_admin
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from app.uploads import PUBLICATION_IMPORTS, accepts_uploads, check_uploads
+from fastapi import APIRouter, Depends, HTTPException, File, Query, \
+    UploadFile
+from fastapi.responses import Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 router = APIRouter(prefix="/api/publications", tags=["publications"])
 
 
-@router.get("/", response_model=List[Publication])
-def get_publications(
+# 한 페이지의 최대 크기
+MAX_PAGE_SIZE = 200
+
+
+def _encode_cursor(number: int, publication_id: int) -> str:
+    return urlsafe_b64encode(f"{number}:{publication_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, int]:
+    try:
+        number, publication_id = urlsafe_b64decode(
+            cursor.encode()).decode().split(":")
+        return int(number), int(publication_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def list_publications(
+    db: AsyncSession,
+    year: Optional[str] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    contribution: Optional[str] = None,
+    status: Optional[List[str]] = None,
+    journal: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Response:
+    """(number, id) 내림차순 키셋 페이지네이션
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다. 필터는 메모리의
+    비트맵 인덱스(app/facets.py)로 계산하므로 출판물이 바뀌지 않았다면 SQL 은
+    변경 지문 조회 한 번뿐입니다. limit 이 없으면 기존처럼 전체를 반환합니다.
+    """
+    index = await publication_index(db)
+    mask = index.match(year=year, year_from=year_from, year_to=year_to,
+                       contribution=contribution, status=status,
+                       journal=journal)
+    if cursor:
+        mask = index.after(mask, *_decode_cursor(cursor))
+
+    rows = index.iter_rows(mask)
+    if limit is None:
+        return json_bytes_response(publication_serializer.dump_many(rows))
+
+    # 한 행을 더 읽어서 다음 페이지 존재 여부 판단
+    page = list(islice(rows, limit + 1))
+    response = json_bytes_response(
+        publication_serializer.dump_many(page[:limit]))
+    if len(page) > limit:
+        last = dict(zip(publication_serializer.fields, page[limit - 1]))
+        response.headers["X-Next-Cursor"] = _encode_cursor(last["number"],
+                                                           last["id"])
+    return response
+
+
+@router.get("/", response_model=List[PublicationRead])
+async def get_publications(
     year: Optional[str] = Query(None, description="Filter by year"),
+    year_from: Optional[int] = Query(None, ge=1900, le=2999,
+                                     description="Filter by year range (inclusive)"),
+    year_to: Optional[int] = Query(None, ge=1900, le=2999,
+                                   description="Filter by year range (inclusive)"),
     contribution: Optional[str] = Query(None,
                                         description="Filter by contribution type: first-author, corresponding, co-author"),
-    status: Optional[str] = Query(None,
-                                  description="Filter by status: published, under-submission, in-press, in-review"),
-    db: Session = Depends(get_db)
+    status: Optional[List[str]] = Query(None,
+                                        description="Filter by status (repeatable): published, under-submission, in-press, in-review"),
+    journal: Optional[List[str]] = Query(None,
+                                         description="Filter by journal (repeatable)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE,
+                                 description="Page size (omit to return all)"),
+    cursor: Optional[str] = Query(None,
+                                  description="X-Next-Cursor value of the previous page"),
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(Publication)
-
-    if year:
-        query = query.filter(Publication.year == year)
-
-    if contribution:
-        if contribution == "first-author":
-            query = query.filter(Publication.is_first_author == True)
-        elif contribution == "corresponding":
-            query = query.filter(Publication.is_corresponding_author == True)
-        elif contribution == "equal-contribution":
-            query = query.filter(Publication.is_equal_contribution == True)
-        else:  # co-author
-            query = query.filter(
-                Publication.is_first_author == False,
-                Publication.is_corresponding_author == False,
-                Publication.is_equal_contribution == False
-            )
-
-    if status:
-        query = query.filter(Publication.status == status)
-
-    return query.order_by(Publication.number.desc()).all()
+    return await list_publications(
+        db, year=year, year_from=year_from, year_to=year_to,
+        contribution=contribution, status=status, journal=journal,
+        limit=limit, cursor=cursor)
 
 
 @router.get("/years")
-def get_available_years(db: Session = Depends(get_db)):
+async def get_available_years(db: AsyncSession = Depends(get_db)):
     """사용 가능한 연도 목록 반환"""
-    years = db.query(Publication.year).distinct().all()
-    return {"years": sorted([year[0] for year in years], reverse=True)}
+    index = await publication_index(db)
+    return {"years": sorted(index.years, reverse=True)}
 
 
 @router.get("/stats")
-def get_publication_stats(db: Session = Depends(get_db)):
-    """출판물 통계 정보 반환"""
-    total = db.query(Publication).count()
-    first_author = db.query(Publication).filter(
-        Publication.is_first_author == True).count()
-    corresponding = db.query(Publication).filter(
-        Publication.is_corresponding_author == True).count()
-    under_submission = db.query(Publication).filter(
-        Publication.status == "under-submission").count()
-
+async def get_publication_stats(db: AsyncSession = Depends(get_db)):
+    """출판물 통계 정보 반환 (비트맵 popcount)"""
+    index = await publication_index(db)
     return {
-        "total": total,
-        "first_author": first_author,
-        "corresponding": corresponding,
-        "under_submission": under_submission
+        "total": index.all.bit_count(),
+        "first_author": index.contributions["first-author"].bit_count(),
+        "corresponding": index.contributions["corresponding"].bit_count(),
+        "under_submission": index.statuses.get("under-submission",
+                                               0).bit_count()
     }
 
 
-@router.get("/{publication_id}", response_model=Publication)
-def get_publication(publication_id: int, db: Session = Depends(get_db)):
-    publication = db.query(Publication).filter(
-        Publication.id == publication_id).first()
-    if not publication:
+@router.get("/facets")
+async def get_publication_facets(
+    year: Optional[str] = Query(None, description="Selected year"),
+    contribution: Optional[str] = Query(None,
+                                        description="Selected contribution type"),
+    status: Optional[List[str]] = Query(None,
+                                        description="Selected statuses (repeatable)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """연도/상태/기여 유형별 개수를 한 번에 반환
+
+    각 항목은 자신을 제외한 나머지 선택을 적용한 개수입니다.
+    """
+    index = await publication_index(db)
+    return index.facets(year=year, contribution=contribution, status=status)
+
+
+@router.get("/search", response_model=List[PublicationSearchResult])
+async def search_publications(
+    q: str = Query(..., min_length=1, max_length=200,
+                   description="제목/저자/저널 검색어 (단어별 접두어 일치)"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)):
+    """출판물 전문 검색 (관련도순, 일치 부분 강조)"""
+    return await full_text_search(db, q, limit)
+
+
+@router.get("/{publication_id}", response_model=PublicationRead)
+async def get_publication(publication_id: int,
+    db: AsyncSession = Depends(get_db)):
+    row = (await db.exec(publication_serializer.select().where(
+        Publication.id == publication_id))).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Publication not found")
-    return publication
+    return json_bytes_response(publication_serializer.dump_one(row))
 
 
 # Admin CRUD operations
 @router.post("/", response_model=Publication)
-def create_publication(publication: Publication, db: Session = Depends(get_db),
+async def create_publication(publication: Publication,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     publication.updated_at = datetime.utcnow()
     db.add(publication)
-    db.commit()
-    db.refresh(publication)
+    await db.commit()
+    invalidate_cache(Publication)
+    await db.refresh(publication)
     return publication
 
 
+@router.post("/import")
+@accepts_uploads(PUBLICATION_IMPORTS)
+async def import_publication_files(
+    files: List[UploadFile] = File(...,
+                                   description="BibTeX (.bib) or RIS (.ris) files"),
+    dry_run: bool = Query(False,
+                          description="Report what would be imported without writing"),
+    db: AsyncSession = Depends(get_db),
+    admin: bool = Depends(require_admin)
+):
+    """BibTeX/RIS 일괄 가져오기 (DOI/제목 중복 제외, 한 트랜잭션)"""
+    check_uploads(files, PUBLICATION_IMPORTS)
+    result = ImportResult()
+    for file in files:
+        try:
+            await run_in_threadpool(parse_stream, file.file, file.filename,
+                                    result)
+        except ImportFormatError as e:
+            raise HTTPException(status_code=400,
+                                detail=f"{file.filename}: {e}")
+
+    await import_publications(db, result, dry_run=dry_run)
+    if result.inserted:
+        invalidate_cache(Publication)
+    return result.summary()
+
+
 @router.put("/{publication_id}", response_model=Publication)
-def update_publication(publication_id: int, publication: Publication,
-    db: Session = Depends(get_db),
+async def update_publication(publication_id: int, publication: Publication,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    db_publication = db.query(Publication).filter(
-        Publication.id == publication_id).first()
+    db_publication = await db.get(Publication, publication_id)
     if not db_publication:
         raise HTTPException(status_code=404, detail="Publication not found")
 
@@ -106,20 +216,22 @@ def update_publication(publication_id: int, publication: Publication,
             setattr(db_publication, key, value)
 
     db_publication.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_publication)
+    await db.commit()
+    invalidate_cache(Publication)
+    await db.refresh(db_publication)
     return db_publication
 
 
 @router.delete("/{publication_id}")
-def delete_publication(publication_id: int, db: Session = Depends(get_db),
+async def delete_publication(publication_id: int,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    publication = db.query(Publication).filter(
-        Publication.id == publication_id).first()
+    publication = await db.get(Publication, publication_id)
     if not publication:
         raise HTTPException(status_code=404, detail="Publication not found")
 
-    db.delete(publication)
-    db.commit()
+    await db.delete(publication)
+    await db.commit()
+    invalidate_cache(Publication)
     return {"message": "Publication deleted successfully"}
@@ -1,65 +1,71 @@
-import shutil
 from datetime import datetime
-from pathlib import Path
 from typing import List, Optional
 
+from app.cache import invalidate_cache
 from app.database import get_db
 from app.models import RepresentativeWork
+from app.schemas import RepresentativeWorkRead, \
+    representative_work_serializer, json_bytes_response
 from app.security.security import require_admin
+from app.upload_store import store_uploads
+from app.uploads import IMAGE_UPLOADS, UPLOAD_ROOT, accepts_uploads
 from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/api/representative-works",
                    tags=["representative-works"])
 
 # 업로드 디렉토리 설정
-UPLOAD_DIR = Path("../frontend/static/uploads")
+UPLOAD_DIR = UPLOAD_ROOT
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
-@router.get("/", response_model=List[RepresentativeWork])
-def get_representative_works(
+@router.get("/", response_model=List[RepresentativeWorkRead])
+async def get_representative_works(
     active_only: bool = True,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(RepresentativeWork)
+    query = representative_work_serializer.select()
     if active_only:
-        query = query.filter(RepresentativeWork.is_active == True)
-    return query.order_by(RepresentativeWork.order_index.asc()).all()
+        query = query.where(RepresentativeWork.is_active == True)
+    rows = (await db.exec(
+        query.order_by(RepresentativeWork.order_index.asc()))).all()
+    return json_bytes_response(representative_work_serializer.dump_many(rows))
 
 
-@router.get("/{work_id}", response_model=RepresentativeWork)
-def get_representative_work(work_id: int, db: Session = Depends(get_db)
+@router.get("/{work_id}", response_model=RepresentativeWorkRead)
+async def get_representative_work(work_id: int,
+    db: AsyncSession = Depends(get_db)
 ):
-    work = db.query(RepresentativeWork).filter(
-        RepresentativeWork.id == work_id).first()
-    if not work:
+    row = (await db.exec(representative_work_serializer.select().where(
+        RepresentativeWork.id == work_id))).first()
+    if not row:
         raise HTTPException(status_code=404,
                             detail="Representative work not found")
-    return work
+    return json_bytes_response(representative_work_serializer.dump_one(row))
 
 
 @router.post("/", response_model=RepresentativeWork)
-def create_representative_work(work: RepresentativeWork,
-    db: Session = Depends(get_db),
+async def create_representative_work(work: RepresentativeWork,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     work.updated_at = datetime.utcnow()
     db.add(work)
-    db.commit()
-    db.refresh(work)
+    await db.commit()
+    invalidate_cache(RepresentativeWork)
+    await db.refresh(work)
     return work
 
 
 @router.put("/{work_id}", response_model=RepresentativeWork)
-def update_representative_work(
+async def update_representative_work(
     work_id: int,
     work_data: RepresentativeWork,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    work = db.query(RepresentativeWork).filter(
-        RepresentativeWork.id == work_id).first()
+    work = await db.get(RepresentativeWork, work_id)
     if not work:
         raise HTTPException(status_code=404,
                             detail="Representative work not found")
@@ -69,49 +75,45 @@ def update_representative_work(
             setattr(work, key, value)
 
     work.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(work)
+    await db.commit()
+    invalidate_cache(RepresentativeWork)
+    await db.refresh(work)
     return work
 
 
 @router.delete("/{work_id}")
-def delete_representative_work(work_id: int, db: Session = Depends(get_db),
+async def delete_representative_work(work_id: int,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    work = db.query(RepresentativeWork).filter(
-        RepresentativeWork.id == work_id).first()
+    work = await db.get(RepresentativeWork, work_id)
     if not work:
         raise HTTPException(status_code=404,
                             detail="Representative work not found")
 
-    db.delete(work)
-    db.commit()
+    await db.delete(work)
+    await db.commit()
+    invalidate_cache(RepresentativeWork)
     return {"message": "Representative work deleted successfully"}
 
 
 @router.post("/upload-image")
-async def upload_image(file: UploadFile = File(...),
+@accepts_uploads(IMAGE_UPLOADS)
+async def upload_image(files: List[UploadFile] = File(..., alias="file"),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    if not file.content_type.startswith('image/'):
-        raise HTTPException(status_code=400, detail="File must be an image")
-
-    # 파일명 생성 (타임스탬프 + 원본 파일명)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{file.filename}"
-    file_path = UPLOAD_DIR / filename
-
-    # 파일 저장
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # 내용 해시를 파일명으로 저장
+    filenames = await store_uploads(db, files, UPLOAD_DIR, IMAGE_UPLOADS)
 
-    return {"image_path": f"static/uploads/{filename}"}
+    paths = [f"static/uploads/{name}" for name in filenames]
+    return {"image_path": paths[0], "image_paths": paths}
 
 
 @router.get("/gallery/")
-def get_gallery_images(
+async def get_gallery_images(
     category: Optional[str] = None,
     active_only: bool = True,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     return []
@@ -1,65 +1,105 @@
-import re
-import shutil
 from datetime import datetime
-from pathlib import Path
-from typing import List
+from typing import List, Literal, Optional
 
+from app.cache import invalidate_cache
 from app.database import get_db
 from app.models import ResearchArea
+from app.rendering import render_cached
+from app.schemas import ResearchAreaRead, research_area_serializer, \
+    research_area_rendered_serializer, json_bytes_response
 from app.security.security import require_admin
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
-from sqlalchemy.orm import Session
+from app.upload_store import store_uploads
+from app.uploads import ICON_UPLOADS, IMAGE_UPLOADS, UPLOAD_ROOT, \
+    accepts_uploads
+from fastapi import APIRouter, Depends, HTTPException, File, Query, \
+    UploadFile
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/api/research-areas", tags=["research-areas"])
 
 # 업로드 디렉토리 설정
-UPLOAD_DIR = Path("../frontend/static/uploads/icons")
+UPLOAD_DIR = UPLOAD_ROOT / "icons"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 # NEW: 본문 이미지 업로드 디렉토리
-CONTENT_UPLOAD_DIR = Path("../frontend/static/uploads/research-areas")
+CONTENT_UPLOAD_DIR = UPLOAD_ROOT / "research-areas"
 CONTENT_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
-@router.get("/", response_model=List[ResearchArea])
-def get_research_areas(
+RENDER_DESCRIPTION = Query(
+    None, description="html 이면 description 을 렌더링한 html/toc/images 추가")
+
+
+async def _render_description(row):
+    return await render_cached("researcharea", row.id, "description",
+                               row.updated_at, row.description)
+
+
+async def list_research_areas(
+    db: AsyncSession,
     active_only: bool = True,
-    db: Session = Depends(get_db)
+    render: Optional[str] = None,
 ):
-    query = db.query(ResearchArea)
+    """연구 분야 목록 응답 (라우트와 /api/bootstrap 이 함께 사용)"""
+    query = research_area_serializer.select()
     if active_only:
-        query = query.filter(ResearchArea.is_active == True)
-    return query.order_by(ResearchArea.order_index.asc()).all()
+        query = query.where(ResearchArea.is_active == True)
+    rows = (await db.exec(
+        query.order_by(ResearchArea.order_index.asc()))).all()
+    if render != "html":
+        return json_bytes_response(research_area_serializer.dump_many(rows))
+    rendered = [await _render_description(row) for row in rows]
+    return json_bytes_response(
+        research_area_rendered_serializer.dump_many(rows, rendered))
+
+
+@router.get("/", response_model=List[ResearchAreaRead])
+async def get_research_areas(
+    active_only: bool = True,
+    render: Optional[Literal["html"]] = RENDER_DESCRIPTION,
+    db: AsyncSession = Depends(get_db)
+):
+    return await list_research_areas(db, active_only=active_only,
+                                     render=render)
 
 
-@router.get("/{slug}", response_model=ResearchArea)
-def get_research_area(slug: str, db: Session = Depends(get_db)):
-    area = db.query(ResearchArea).filter(ResearchArea.slug == slug).first()
-    if not area:
+@router.get("/{slug}", response_model=ResearchAreaRead)
+async def get_research_area(
+    slug: str,
+    render: Optional[Literal["html"]] = RENDER_DESCRIPTION,
+    db: AsyncSession = Depends(get_db)
+):
+    row = (await db.exec(research_area_serializer.select().where(
+        ResearchArea.slug == slug))).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Research area not found")
-    return area
+    if render != "html":
+        return json_bytes_response(research_area_serializer.dump_one(row))
+    return json_bytes_response(research_area_rendered_serializer.dump_one(
+        row, await _render_description(row)))
 
 
 @router.post("/", response_model=ResearchArea)
-def create_research_area(area_data: ResearchArea,
-    db: Session = Depends(get_db),
+async def create_research_area(area_data: ResearchArea,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     area_data.updated_at = datetime.utcnow()
     db.add(area_data)
-    db.commit()
-    db.refresh(area_data)
+    await db.commit()
+    invalidate_cache(ResearchArea)
+    await db.refresh(area_data)
     return area_data
 
 
 @router.put("/{area_id}", response_model=ResearchArea)
-def update_research_area(
+async def update_research_area(
     area_id: int,
     area_data: ResearchArea,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    area = db.query(ResearchArea).filter(ResearchArea.id == area_id).first()
+    area = await db.get(ResearchArea, area_id)
     if not area:
         raise HTTPException(status_code=404, detail="Research area not found")
 
@@ -68,60 +108,52 @@ def update_research_area(
             setattr(area, key, value)
 
     area.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(area)
+    await db.commit()
+    invalidate_cache(ResearchArea)
+    await db.refresh(area)
     return area
 
 
 @router.delete("/{area_id}")
-def delete_research_area(
+async def delete_research_area(
     area_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    area = db.query(ResearchArea).filter(ResearchArea.id == area_id).first()
+    area = await db.get(ResearchArea, area_id)
     if not area:
         raise HTTPException(status_code=404, detail="Research area not found")
 
-    db.delete(area)
-    db.commit()
+    await db.delete(area)
+    await db.commit()
+    invalidate_cache(ResearchArea)
     return {"message": "Research area deleted successfully"}
 
 
 @router.post("/upload-icon")
-async def upload_icon(file: UploadFile = File(...),
+@accepts_uploads(ICON_UPLOADS)
+async def upload_icon(files: List[UploadFile] = File(..., alias="file"),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 
 ):
-    if not file.content_type.startswith('image/'):
-        raise HTTPException(status_code=400, detail="File must be an image")
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe = re.sub(r'[^A-Za-z0-9_.-]', '_', file.filename)
-    filename = f"{timestamp}_{safe}"
-    file_path = UPLOAD_DIR / filename
+    filenames = await store_uploads(db, files, UPLOAD_DIR, ICON_UPLOADS)
 
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    return {"icon_path": f"/static/uploads/icons/{filename}"}
+    paths = [f"/static/uploads/icons/{name}" for name in filenames]
+    return {"icon_path": paths[0], "icon_paths": paths}
 
 
 # NEW: 본문 이미지 업로드
 @router.post("/upload-content-image")
-async def upload_content_image(file: UploadFile = File(...),
+@accepts_uploads(IMAGE_UPLOADS)
+async def upload_content_image(
+    files: List[UploadFile] = File(..., alias="file"),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    if not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="File must be an image")
-
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe = re.sub(r'[^A-Za-z0-9_.-]', '_', file.filename)
-    filename = f"{timestamp}_{safe}"
-    file_path = CONTENT_UPLOAD_DIR / filename
-
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    filenames = await store_uploads(db, files, CONTENT_UPLOAD_DIR,
+                                    IMAGE_UPLOADS)
 
     # 프론트에서 Markdown으로 바로 삽입하기 좋은 절대 경로 반환
-    return {"image_path": f"/static/uploads/research-areas/{filename}"}
+    paths = [f"/static/uploads/research-areas/{name}" for name in filenames]
+    return {"image_path": paths[0], "image_paths": paths}
@@ -1,67 +1,72 @@
-import shutil
 from datetime import datetime
-from pathlib import Path
 from typing import List
 
+from app.cache import invalidate_cache
 from app.database import get_db
 from app.models import ResearchHighlight
+from app.schemas import ResearchHighlightRead, \
+    research_highlight_serializer, json_bytes_response
 from app.security.security import require_admin
+from app.upload_store import store_uploads
+from app.uploads import IMAGE_UPLOADS, UPLOAD_ROOT, accepts_uploads
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import File, UploadFile
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(prefix="/api/research-highlights",
                    tags=["research-highlights"])
 
-UPLOAD_DIR_HL = Path("../frontend/static/uploads/research-highlights")
+UPLOAD_DIR_HL = UPLOAD_ROOT / "research-highlights"
 UPLOAD_DIR_HL.mkdir(parents=True, exist_ok=True)
 
 
-@router.get("/", response_model=List[ResearchHighlight])
-def list_research_highlights(
+@router.get("/", response_model=List[ResearchHighlightRead])
+async def list_research_highlights(
     active_only: bool = Query(False, description="True면 is_active 항목만"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(ResearchHighlight)
+    query = research_highlight_serializer.select()
     if active_only:
-        query = query.filter(ResearchHighlight.is_active == True)
-    return query.order_by(
+        query = query.where(ResearchHighlight.is_active == True)
+    rows = (await db.exec(query.order_by(
         ResearchHighlight.order_index.asc(),
         ResearchHighlight.id.desc()
-    ).all()
+    ))).all()
+    return json_bytes_response(research_highlight_serializer.dump_many(rows))
 
 
-@router.get("/{item_id}", response_model=ResearchHighlight)
-def get_research_highlight(item_id: int, db: Session = Depends(get_db)):
-    item = db.query(ResearchHighlight).filter(
-        ResearchHighlight.id == item_id).first()
-    if not item:
+@router.get("/{item_id}", response_model=ResearchHighlightRead)
+async def get_research_highlight(item_id: int,
+    db: AsyncSession = Depends(get_db)):
+    row = (await db.exec(research_highlight_serializer.select().where(
+        ResearchHighlight.id == item_id))).first()
+    if not row:
         raise HTTPException(status_code=404,
                             detail="ResearchHighlight not found")
-    return item
+    return json_bytes_response(research_highlight_serializer.dump_one(row))
 
 
 @router.post("/", response_model=ResearchHighlight)
-def create_research_highlight(item: ResearchHighlight,
-    db: Session = Depends(get_db),
+async def create_research_highlight(item: ResearchHighlight,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
     item.updated_at = datetime.utcnow()
     db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    invalidate_cache(ResearchHighlight)
+    await db.refresh(item)
     return item
 
 
 @router.put("/{item_id}", response_model=ResearchHighlight)
-def update_research_highlight(
+async def update_research_highlight(
     item_id: int,
     patch: ResearchHighlight,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    db_item = db.query(ResearchHighlight).filter(
-        ResearchHighlight.id == item_id).first()
+    db_item = await db.get(ResearchHighlight, item_id)
     if not db_item:
         raise HTTPException(status_code=404,
                             detail="ResearchHighlight not found")
@@ -72,38 +77,37 @@ def update_research_highlight(
     db_item.updated_at = datetime.utcnow()
 
     db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
+    await db.commit()
+    invalidate_cache(ResearchHighlight)
+    await db.refresh(db_item)
     return db_item
 
 
 @router.delete("/{item_id}")
-def delete_research_highlight(item_id: int, db: Session = Depends(get_db),
+async def delete_research_highlight(item_id: int,
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    item = db.query(ResearchHighlight).filter(
-        ResearchHighlight.id == item_id).first()
+    item = await db.get(ResearchHighlight, item_id)
     if not item:
         raise HTTPException(status_code=404,
                             detail="ResearchHighlight not found")
-    db.delete(item)
-    db.commit()
+    await db.delete(item)
+    await db.commit()
+    invalidate_cache(ResearchHighlight)
     return {"message": "ResearchHighlight deleted successfully"}
 
 
 @router.post("/upload-image")
-async def upload_highlight_image(file: UploadFile = File(...),
+@accepts_uploads(IMAGE_UPLOADS)
+async def upload_highlight_image(
+    files: List[UploadFile] = File(..., alias="file"),
+    db: AsyncSession = Depends(get_db),
     admin: bool = Depends(require_admin)
 ):
-    if not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="File must be an image")
-
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{file.filename}"
-    file_path = UPLOAD_DIR_HL / filename
-
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    filenames = await store_uploads(db, files, UPLOAD_DIR_HL, IMAGE_UPLOADS)
 
     # 프론트에서 직접 <img src=...> 로 사용
-    return {"image_path": f"/static/uploads/research-highlights/{filename}"}
+    paths = [f"/static/uploads/research-highlights/{name}"
+             for name in filenames]
+    return {"image_path": paths[0], "image_paths": paths}
@@ -1,29 +1,185 @@
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from app.conditional import table_states
 from app.database import get_db
-from app.models import ResearchArea
-from fastapi import APIRouter, Depends
-from fastapi.responses import Response
-from sqlalchemy.orm import Session
+from app.models import ResearchArea, Publication, CoverArt, \
+    RepresentativeWork, ResearchHighlight
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 router = APIRouter(
     prefix="/api/search"
 )
 
+BASE_URL = "https://joohoonkim.site"
+SITEMAP_URL = f"{BASE_URL}/api/search"
+# 사이트맵 한 파일의 최대 URL 수 (프로토콜 상한은 50,000)
+MAX_URLS_PER_SITEMAP = int(os.getenv("SITEMAP_MAX_URLS", "50000"))
+
+URLSET_OPEN = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+               '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+               'xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">'
+               '\n')
+INDEX_OPEN = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+              '<sitemapindex '
+              'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+
+
+@dataclass
+class SitemapUrl:
+    path: str
+    lastmod: Optional[datetime] = None
+    images: List[str] = field(default_factory=list)
+
+
+def _absolute(path: str) -> str:
+    return f"{BASE_URL}/{path.lstrip('/')}"
+
+
+def _w3c_date(value: datetime) -> str:
+    # DB 의 타임스탬프는 naive UTC
+    return value.replace(tzinfo=timezone.utc, microsecond=0).isoformat()
+
+
+def _max(*values: Optional[datetime]) -> Optional[datetime]:
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+async def _research_urls(db: AsyncSession) -> List[SitemapUrl]:
+    rows = (await db.exec(
+        select(ResearchArea.slug, ResearchArea.updated_at,
+               ResearchArea.icon_path)
+        .where(ResearchArea.is_active == True)
+        .order_by(ResearchArea.order_index.asc())
+    )).all()
+    urls = [SitemapUrl("/research", _max(*(row.updated_at for row in rows)))]
+    urls += [SitemapUrl(f"/research/{row.slug}", row.updated_at,
+                        [row.icon_path] if row.icon_path else [])
+             for row in rows]
+    return urls
+
+
+async def _publication_urls(db: AsyncSession) -> List[SitemapUrl]:
+    latest = await db.scalar(select(func.max(Publication.updated_at)))
+    highlights = (await db.exec(
+        select(ResearchHighlight.image_path, ResearchHighlight.updated_at)
+        .where(ResearchHighlight.is_active == True)
+        .order_by(ResearchHighlight.order_index.asc())
+    )).all()
+    return [SitemapUrl(
+        "/publications",
+        _max(latest, *(row.updated_at for row in highlights)),
+        [row.image_path for row in highlights],
+    )]
+
+
+async def _home_urls(db: AsyncSession) -> List[SitemapUrl]:
+    works = (await db.exec(
+        select(RepresentativeWork.image_path, RepresentativeWork.updated_at)
+        .where(RepresentativeWork.is_active == True)
+        .order_by(RepresentativeWork.order_index.asc())
+    )).all()
+    covers = (await db.exec(
+        select(CoverArt.image_path, CoverArt.updated_at)
+        .where(CoverArt.is_active == True)
+        .order_by(CoverArt.order_index.asc(), CoverArt.id.desc())
+    )).all()
+    return [SitemapUrl(
+        "/",
+        _max(*(row.updated_at for row in works),
+             *(row.updated_at for row in covers)),
+        [row.image_path for row in works] + [row.image_path for row in covers],
+    )]
+
+
+async def _static_urls(db: AsyncSession) -> List[SitemapUrl]:
+    return [SitemapUrl("/awards"), SitemapUrl("/conferences"),
+            SitemapUrl("/cv")]
+
+
+# 섹션별 (이름, 의존 테이블, 생성 함수) - 의존 테이블이 바뀐 섹션만 다시 생성
+SECTIONS = (
+    ("home", ("representativework", "coverart"), _home_urls),
+    ("research", ("researcharea",), _research_urls),
+    ("publications", ("publication", "researchhighlight"), _publication_urls),
+    ("static", (), _static_urls),
+)
+
+# 섹션 이름 -> (의존 테이블 상태, URL 목록)
+# (동시 요청이 같은 섹션을 중복 생성해도 결과가 같으므로 잠금 없이 교체)
+_sections: Dict[str, Tuple[str, List[SitemapUrl]]] = {}
+
+
+async def collect_urls(db: AsyncSession) -> List[SitemapUrl]:
+    """변경된 섹션만 다시 조회하여 전체 URL 목록 생성"""
+    states = await table_states(
+        {t for _, deps, _ in SECTIONS for t in deps})
+    urls: List[SitemapUrl] = []
+    for name, deps, build in SECTIONS:
+        seed = repr([states[t] for t in deps])
+        cached = _sections.get(name)
+        if cached is None or cached[0] != seed:
+            cached = _sections[name] = (seed, await build(db))
+        urls.extend(cached[1])
+    return urls
+
+
+def _render_url(url: SitemapUrl) -> str:
+    parts = [f"<url><loc>{escape(_absolute(url.path))}</loc>"]
+    if url.lastmod is not None:
+        parts.append(f"<lastmod>{_w3c_date(url.lastmod)}</lastmod>")
+    for image in url.images:
+        parts.append(f"<image:image><image:loc>{escape(_absolute(image))}"
+                     f"</image:loc></image:image>")
+    parts.append("</url>\n")
+    return "".join(parts)
+
+
+def _stream_urlset(urls: List[SitemapUrl]) -> Iterator[str]:
+    yield URLSET_OPEN
+    for url in urls:
+        yield _render_url(url)
+    yield "</urlset>\n"
+
+
+def _stream_index(chunks: List[List[SitemapUrl]]) -> Iterator[str]:
+    yield INDEX_OPEN
+    for number, chunk in enumerate(chunks, start=1):
+        lastmod = _max(*(url.lastmod for url in chunk))
+        entry = f"<sitemap><loc>{SITEMAP_URL}/sitemap-{number}.xml</loc>"
+        if lastmod is not None:
+            entry += f"<lastmod>{_w3c_date(lastmod)}</lastmod>"
+        yield entry + "</sitemap>\n"
+    yield "</sitemapindex>\n"
+
+
+def _chunks(urls: List[SitemapUrl]) -> List[List[SitemapUrl]]:
+    return [urls[i:i + MAX_URLS_PER_SITEMAP]
+            for i in range(0, len(urls), MAX_URLS_PER_SITEMAP)]
+
 
 @router.get("/sitemap.xml")
-def sitemap(db: Session = Depends(get_db)):
-    base = "https://joohoonkim.site"
-    areas = db.query(ResearchArea).filter(ResearchArea.is_active == True).all()
-    urls = [
-        f"{base}/",
-        f"{base}/research",
-        f"{base}/publications",
-        f"{base}/awards",
-        f"{base}/conferences",
-        f"{base}/cv",
-        *[f"{base}/research/{a.slug}" for a in areas],
-    ]
-    xml = ['<?xml version="1.0" encoding="UTF-8"?>',
-           '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
-    xml += [f"<url><loc>{u}</loc></url>" for u in urls]
-    xml.append("</urlset>")
-    return Response("".join(xml), media_type="application/xml")
+async def sitemap(db: AsyncSession = Depends(get_db)):
+    """URL 수가 상한을 넘으면 자동으로 사이트맵 인덱스로 전환"""
+    urls = await collect_urls(db)
+    if len(urls) > MAX_URLS_PER_SITEMAP:
+        body = _stream_index(_chunks(urls))
+    else:
+        body = _stream_urlset(urls)
+    return StreamingResponse(body, media_type="application/xml")
+
+
+@router.get("/sitemap-{number}.xml")
+async def sitemap_part(number: int, db: AsyncSession = Depends(get_db)):
+    chunks = _chunks(await collect_urls(db))
+    if not 1 <= number <= len(chunks) or len(chunks) == 1:
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    return StreamingResponse(_stream_urlset(chunks[number - 1]),
+                             media_type="application/xml")
@@ -0,0 +1,229 @@
+"""공개 조회용 읽기 스키마와 사전 컴파일된 직렬화기
+
+목록 응답은 테이블 모델을 response_model 로 쓰는 대신 필요한 컬럼만
+SELECT 하고, 스키마에서 미리 만들어 둔 TypeAdapter 로 곧바로 JSON 바이트를
+만듭니다. ORM 객체 생성과 응답 재검증을 모두 건너뜁니다.
+"""
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Type
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy import Select, select
+from sqlmodel import SQLModel
+from typing_extensions import TypedDict
+
+from app.models import Publication, Award, Conference, Media, CoverArt, \
+    ResearchHighlight, RepresentativeWork, ResearchArea, Education, Experience
+from app.rendering import TocEntry
+
+
+class PublicationRead(SQLModel):
+    id: int
+    number: int
+    title: str
+    authors: str
+    journal: str
+    volume: Optional[str] = None
+    pages: Optional[str] = None
+    year: str
+    month: Optional[str] = None
+    doi: Optional[str] = None
+    arxiv: Optional[str] = None
+    is_first_author: bool
+    is_corresponding_author: bool
+    is_equal_contribution: bool
+    contribution_type: str
+    status: str
+    impact_factor: Optional[float] = None
+    featured_info: Optional[str] = None
+    updated_at: datetime
+
+
+class PublicationSearchResult(PublicationRead):
+    """전문 검색 결과 (강조 필드는 HTML 이스케이프 후 <mark> 로 감싼 문자열)"""
+    rank: float
+    title_highlight: str
+    authors_highlight: str
+
+
+class AwardRead(SQLModel):
+    id: int
+    title: str
+    organization: str
+    location: str
+    year: str
+    rank: Optional[str] = None
+    description: Optional[str] = None
+
+
+class ConferenceRead(SQLModel):
+    id: int
+    title: str
+    conference_name: str
+    location: str
+    date: str
+    presentation_type: str
+    award: Optional[str] = None
+    description: Optional[str] = None
+
+
+class MediaRead(SQLModel):
+    id: int
+    title: str
+    source: str
+    date: str
+    url: Optional[str] = None
+    description: Optional[str] = None
+    category: str
+    image_url: Optional[str] = None
+
+
+class CoverArtRead(SQLModel):
+    id: int
+    image_path: str
+    image_width: Optional[int] = None
+    image_height: Optional[int] = None
+    image_color: Optional[str] = None
+    image_placeholder: Optional[str] = None
+    link: Optional[str] = None
+    journal: str
+    volume: Optional[str] = None
+    year: Optional[str] = None
+    description: Optional[str] = None
+    alt_text: Optional[str] = None
+    order_index: int
+    is_active: bool
+    updated_at: datetime
+
+
+class ResearchHighlightRead(SQLModel):
+    id: int
+    image_path: str
+    image_width: Optional[int] = None
+    image_height: Optional[int] = None
+    image_color: Optional[str] = None
+    image_placeholder: Optional[str] = None
+    link: Optional[str] = None
+    description: Optional[str] = None
+    alt_text: Optional[str] = None
+    order_index: int
+    is_active: bool
+    updated_at: datetime
+
+
+class RepresentativeWorkRead(SQLModel):
+    id: int
+    title: str
+    journal: str
+    volume: Optional[str] = None
+    is_in_revision: bool
+    pages: Optional[str] = None
+    year: Optional[str] = None
+    image_path: str
+    image_width: Optional[int] = None
+    image_height: Optional[int] = None
+    image_color: Optional[str] = None
+    image_placeholder: Optional[str] = None
+    order_index: int
+    is_active: bool
+    updated_at: datetime
+
+
+class ResearchAreaRead(SQLModel):
+    id: int
+    title: str
+    slug: str
+    description: str
+    icon_path: Optional[str] = None
+    order_index: int
+    is_active: bool
+    updated_at: datetime
+
+
+class ResearchAreaRenderedRead(ResearchAreaRead):
+    """?render=html 응답 - description 을 렌더링한 HTML/목차/이미지 추가"""
+    html: str
+    toc: List[TocEntry]
+    images: List[str]
+
+
+class EducationRead(SQLModel):
+    id: int
+    degree: str
+    institution: str
+    location: str
+    start_year: str
+    end_year: str
+    advisor: Optional[str] = None
+    description: Optional[str] = None
+
+
+class ExperienceRead(SQLModel):
+    id: int
+    position: str
+    organization: str
+    location: str
+    start_year: str
+    end_year: str
+    description: Optional[str] = None
+    host_advisor: Optional[str] = None
+
+
+class ReadSerializer:
+    """읽기 스키마 하나에 대한 SELECT 컬럼과 사전 컴파일된 JSON 직렬화기
+
+    스키마 필드로 TypedDict 를 만들어 TypeAdapter 를 한 번만 컴파일합니다.
+    DB 에서 읽은 행은 이미 올바른 타입이므로 검증 없이 직렬화만 합니다.
+    테이블 컬럼이 아닌 필드(렌더링 결과 등)는 dump 때 extras 로 넘깁니다.
+    """
+
+    def __init__(self, schema: Type[SQLModel], model: Type[SQLModel]):
+        self.schema = schema
+        self.model = model
+        self.fields = tuple(name for name in schema.model_fields
+                            if name in model.__table__.c)
+        self.columns = [model.__table__.c[name] for name in self.fields]
+        row_type = TypedDict(f"{schema.__name__}Row", {
+            name: field.annotation
+            for name, field in schema.model_fields.items()
+        })
+        self._one = TypeAdapter(row_type)
+        self._many = TypeAdapter(List[row_type])
+
+    def select(self) -> Select:
+        return select(*self.columns)
+
+    def dump_one(self, row: Sequence, extra: Optional[dict] = None) -> bytes:
+        return self._one.dump_json({**dict(zip(self.fields, row)),
+                                    **(extra or {})})
+
+    def dump_many(self, rows: Iterable[Sequence],
+                  extras: Optional[Iterable[dict]] = None) -> bytes:
+        fields = self.fields
+        if extras is None:
+            return self._many.dump_json(
+                [dict(zip(fields, row)) for row in rows])
+        return self._many.dump_json([{**dict(zip(fields, row)), **extra}
+                                     for row, extra in zip(rows, extras)])
+
+
+publication_serializer = ReadSerializer(PublicationRead, Publication)
+award_serializer = ReadSerializer(AwardRead, Award)
+conference_serializer = ReadSerializer(ConferenceRead, Conference)
+media_serializer = ReadSerializer(MediaRead, Media)
+cover_art_serializer = ReadSerializer(CoverArtRead, CoverArt)
+research_highlight_serializer = ReadSerializer(ResearchHighlightRead,
+                                               ResearchHighlight)
+representative_work_serializer = ReadSerializer(RepresentativeWorkRead,
+                                                RepresentativeWork)
+research_area_serializer = ReadSerializer(ResearchAreaRead, ResearchArea)
+research_area_rendered_serializer = ReadSerializer(ResearchAreaRenderedRead,
+                                                   ResearchArea)
+education_serializer = ReadSerializer(EducationRead, Education)
+experience_serializer = ReadSerializer(ExperienceRead, Experience)
+
+
+def json_bytes_response(content: bytes) -> Response:
+    """이미 직렬화된 JSON 바이트를 그대로 응답"""
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,199 @@
+"""출판물 전문 검색
+
+- PostgreSQL: 제목(english, 가중치 A) + 저자(simple, B) + 저널(simple, C) 로
+  만든 생성 컬럼 ``publication.search_vector`` 와 GIN 인덱스를 사용하고
+  ts_rank_cd 로 정렬, ts_headline 으로 일치 부분을 강조합니다.
+- SQLite (로컬 개발): 외부 콘텐츠 FTS5 테이블 ``publication_fts`` 를 트리거로
+  동기화하고 bm25 로 정렬, highlight() 로 강조합니다.
+
+검색어는 단어 단위로 잘라 각 단어의 접두어 일치를 AND 로 묶습니다.
+강조 결과는 HTML 이스케이프 후 ``<mark>`` 태그로 감싸서 반환합니다.
+"""
+import html
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.engine import Connection
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import Publication
+from app.schemas import publication_serializer
+
+# 검색어 최대 단어 수
+MAX_TERMS = 8
+# 강조 구간 표시 (사용자 입력과 겹치지 않는 사설 영역 문자)
+MARK_START = "\ue000"
+MARK_END = "\ue001"
+
+POSTGRES_SETUP = (
+    """
+    ALTER TABLE publication ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(authors, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(journal, '')), 'C')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_publication_search_vector
+    ON publication USING gin (search_vector)
+    """,
+)
+
+SQLITE_SETUP = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS publication_fts USING fts5(
+        title, authors, journal,
+        content='publication', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS publication_fts_ai AFTER INSERT ON publication
+    BEGIN
+        INSERT INTO publication_fts (rowid, title, authors, journal)
+        VALUES (new.id, new.title, new.authors, new.journal);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS publication_fts_ad AFTER DELETE ON publication
+    BEGIN
+        INSERT INTO publication_fts (publication_fts, rowid, title, authors,
+                                     journal)
+        VALUES ('delete', old.id, old.title, old.authors, old.journal);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS publication_fts_au AFTER UPDATE ON publication
+    BEGIN
+        INSERT INTO publication_fts (publication_fts, rowid, title, authors,
+                                     journal)
+        VALUES ('delete', old.id, old.title, old.authors, old.journal);
+        INSERT INTO publication_fts (rowid, title, authors, journal)
+        VALUES (new.id, new.title, new.authors, new.journal);
+    END
+    """,
+)
+
+
+def install_search(connection: Connection) -> None:
+    """검색용 컬럼/인덱스(또는 FTS5 테이블)를 생성 - 여러 번 실행해도 안전"""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        for statement in POSTGRES_SETUP:
+            connection.execute(text(statement))
+    elif dialect == "sqlite":
+        exists = connection.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE name = 'publication_fts'"
+        )).first()
+        for statement in SQLITE_SETUP:
+            connection.execute(text(statement))
+        if not exists:
+            # 이미 있던 행을 색인
+            connection.execute(text(
+                "INSERT INTO publication_fts (publication_fts) "
+                "VALUES ('rebuild')"))
+
+
+@contextmanager
+def deferred_search_index(connection: Connection):
+    """대량 적재 동안 SQLite FTS 트리거를 끄고, 끝난 뒤 한 번에 다시 색인
+
+    행마다 트리거로 색인하는 것보다 rebuild 한 번이 훨씬 빠릅니다.
+    SQLite DDL 은 트랜잭션에 포함되므로 적재가 실패하면 트리거도 복구됩니다.
+    PostgreSQL 생성 컬럼은 끌 수 없으므로 그대로 둡니다.
+    """
+    if connection.dialect.name != "sqlite":
+        yield
+        return
+    for suffix in ("ai", "ad", "au"):
+        connection.execute(text(
+            f"DROP TRIGGER IF EXISTS publication_fts_{suffix}"))
+    yield
+    connection.execute(text(
+        "INSERT INTO publication_fts (publication_fts) VALUES ('rebuild')"))
+    install_search(connection)
+
+
+def search_terms(query: str) -> List[str]:
+    return re.findall(r"\w+", query.lower())[:MAX_TERMS]
+
+
+def highlight_html(value: str) -> str:
+    return html.escape(value).replace(MARK_START, "<mark>") \
+        .replace(MARK_END, "</mark>")
+
+
+def _postgres_statement(terms: List[str], limit: int):
+    # 제목은 어간 추출(english), 저자/저널은 그대로(simple) 색인되어 있으므로
+    # 단어마다 두 설정의 접두어 쿼리를 OR 로 묶은 뒤 전체를 AND 로 결합
+    tsquery = None
+    for term in terms:
+        part = func.to_tsquery("english", f"{term}:*") \
+            .op("||")(func.to_tsquery("simple", f"{term}:*"))
+        tsquery = part if tsquery is None else tsquery.op("&&")(part)
+
+    vector = literal_column("publication.search_vector")
+    rank = func.ts_rank_cd(vector, tsquery)
+    ranked = (
+        select(*publication_serializer.columns, rank.label("rank"))
+        .where(vector.op("@@")(tsquery))
+        .order_by(rank.desc(), Publication.number.desc())
+        .limit(limit)
+        .subquery()
+    )
+    # 강조(ts_headline)는 비용이 크므로 LIMIT 이후의 행에만 적용
+    options = f"StartSel={MARK_START}, StopSel={MARK_END}, HighlightAll=true"
+    return select(
+        ranked,
+        func.ts_headline("english", ranked.c.title, tsquery, options)
+        .label("title_highlight"),
+        func.ts_headline("simple", ranked.c.authors, tsquery, options)
+        .label("authors_highlight"),
+    ).order_by(ranked.c.rank.desc(), ranked.c.number.desc())
+
+
+def _sqlite_statement(terms: List[str], limit: int):
+    fts = table("publication_fts", column("rowid"))
+    fts_name = literal_column("publication_fts")
+    match = " ".join(f'"{term}"*' for term in terms)
+    # bm25 는 작을수록 관련도가 높음 (제목 > 저자 > 저널 가중치)
+    bm25 = func.bm25(fts_name, 10.0, 5.0, 1.0)
+    return (
+        select(
+            *publication_serializer.columns,
+            (-bm25).label("rank"),
+            func.highlight(fts_name, 0, MARK_START, MARK_END)
+            .label("title_highlight"),
+            func.highlight(fts_name, 1, MARK_START, MARK_END)
+            .label("authors_highlight"),
+        )
+        .select_from(fts.join(Publication, Publication.id == fts.c.rowid))
+        .where(fts_name.op("MATCH")(match))
+        .order_by(bm25, Publication.number.desc())
+        .limit(limit)
+    )
+
+
+async def full_text_search(db: AsyncSession, query: str,
+                           limit: int) -> List[Dict[str, Any]]:
+    """관련도순 검색 결과 (출판물 필드 + rank + 강조된 제목/저자)"""
+    terms = search_terms(query)
+    if not terms:
+        return []
+    if db.bind.dialect.name == "postgresql":
+        statement = _postgres_statement(terms, limit)
+    else:
+        statement = _sqlite_statement(terms, limit)
+
+    results = []
+    for row in (await db.exec(statement)).mappings():
+        result = {name: row[name] for name in publication_serializer.fields}
+        result["rank"] = float(row["rank"])
+        result["title_highlight"] = highlight_html(row["title_highlight"])
+        result["authors_highlight"] = highlight_html(
+            row["authors_highlight"])
+        results.append(result)
+    return results
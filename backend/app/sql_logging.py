@@ -0,0 +1,284 @@
+"""SQL 로깅 (샘플링 + 느린 쿼리 기록)
+
+엔진의 ``echo=True`` 는 모든 쿼리를 동기적으로 stdout 에 쓰기 때문에 운영에서는
+사용하지 않습니다. 대신
+
+- 설정한 비율만큼만 쿼리를 샘플링해서 로그로 남기고
+- 기준 시간보다 오래 걸린 쿼리는 SQL, 파라미터, 소요 시간, 요청 경로와 함께
+  최근 N 개를 링 버퍼에 보관합니다 (관리자 API 에서 조회).
+
+로그 출력은 QueueHandler 를 통해 별도 스레드에서 처리되므로 요청 처리 경로에서
+I/O 를 기다리지 않습니다. 전체 추적이 필요하면 샘플링 비율을 1.0 으로 올립니다.
+
+요청마다 쿼리 수와 DB 시간을 집계하고, 같은 SQL 이 기준 횟수 이상 반복되면
+N+1 의심 경고를 남깁니다. ``SQL_DEBUG_HEADERS=1`` 이면 집계 결과를 응답 헤더
+(X-DB-Query-Count, X-DB-Time-Ms, X-DB-Max-Repeats)로 내보내고,
+``assert_query_budget`` 은 이 헤더로 라우트별 쿼리 수 상한을 검사합니다
+(scripts/check_query_budgets.py, 테스트에서 사용).
+"""
+import logging
+import os
+import queue
+import random
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.sql")
+
+# 파라미터는 길이가 클 수 있으므로 잘라서 보관
+MAX_PARAMETERS_LENGTH = 500
+
+# 같은 SQL 이 요청 하나에서 이 횟수 이상 실행되면 N+1 의심
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+DEBUG_HEADERS = os.getenv("SQL_DEBUG_HEADERS", "").lower() in ("1", "true",
+                                                              "yes")
+
+# 현재 요청 경로 ("GET /api/publications/")
+current_route: ContextVar[Optional[str]] = ContextVar("current_route",
+                                                      default=None)
+
+
+@dataclass
+class RequestQueries:
+    """요청 하나(또는 track_queries 블록)에서 실행된 쿼리 집계"""
+    count: int = 0
+    duration_ms: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def add(self, statement: str, duration_ms: float):
+        self.count += 1
+        self.duration_ms += duration_ms
+        self.statements[statement] += 1
+
+    def most_repeated(self) -> Tuple[Optional[str], int]:
+        if not self.statements:
+            return None, 0
+        return self.statements.most_common(1)[0]
+
+
+request_queries: ContextVar[Optional[RequestQueries]] = ContextVar(
+    "request_queries", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[RequestQueries]:
+    """블록 안에서 실행된 쿼리 수/시간 집계 (스크립트에서도 사용 가능)"""
+    queries = RequestQueries()
+    token = request_queries.set(queries)
+    try:
+        yield queries
+    finally:
+        request_queries.reset(token)
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    parameters: str
+    duration_ms: float
+    route: Optional[str]
+    executed_at: datetime
+
+
+class QueryLog:
+    """쿼리 샘플링 설정과 느린 쿼리 링 버퍼"""
+
+    def __init__(self, sample_rate: float, slow_query_ms: float,
+                 max_entries: int):
+        self.sample_rate = sample_rate
+        self.slow_query_ms = slow_query_ms
+        self._slow: deque = deque(maxlen=max_entries)
+        self._lock = Lock()
+        self.statements = 0
+        self.sampled = 0
+        self.slow = 0
+
+    def configure(self, sample_rate: Optional[float] = None,
+                  slow_query_ms: Optional[float] = None):
+        if sample_rate is not None:
+            self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        if slow_query_ms is not None:
+            self.slow_query_ms = max(slow_query_ms, 0.0)
+
+    def record(self, statement: str, parameters: Any, duration_ms: float):
+        route = current_route.get()
+        self.statements += 1
+        queries = request_queries.get()
+        if queries is not None:
+            queries.add(statement, duration_ms)
+        if self.sample_rate and random.random() < self.sample_rate:
+            self.sampled += 1
+            logger.info("%.1fms %s %s %s", duration_ms, route or "-",
+                        statement, _format_parameters(parameters))
+        if duration_ms >= self.slow_query_ms:
+            self.slow += 1
+            entry = SlowQuery(statement=statement,
+                              parameters=_format_parameters(parameters),
+                              duration_ms=round(duration_ms, 3), route=route,
+                              executed_at=datetime.utcnow())
+            with self._lock:
+                self._slow.append(entry)
+            logger.warning("slow query %.1fms %s %s", duration_ms,
+                           route or "-", statement)
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """최근 느린 쿼리 (최신순)"""
+        with self._lock:
+            entries = list(self._slow)
+        return [asdict(entry) for entry in reversed(entries)]
+
+    def clear(self):
+        with self._lock:
+            self._slow.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sample_rate": self.sample_rate,
+            "slow_query_ms": self.slow_query_ms,
+            "max_entries": self._slow.maxlen,
+            "statements": self.statements,
+            "sampled": self.sampled,
+            "slow": self.slow,
+        }
+
+
+def _format_parameters(parameters: Any) -> str:
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        return text[:MAX_PARAMETERS_LENGTH] + "..."
+    return text
+
+
+query_log = QueryLog(
+    sample_rate=float(os.getenv("SQL_LOG_SAMPLE_RATE", "0")),
+    slow_query_ms=float(os.getenv("SQL_SLOW_QUERY_MS", "100")),
+    max_entries=int(os.getenv("SQL_SLOW_QUERY_LOG_SIZE", "200")),
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context,
+                           executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    started = conn.info["query_start"].pop()
+    query_log.record(statement, parameters,
+                     (time.perf_counter() - started) * 1000)
+
+
+def _handle_error(context):
+    # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각만 제거
+    if context.connection is not None and \
+            context.connection.info.get("query_start"):
+        context.connection.info["query_start"].pop()
+
+
+_listener: Optional[QueueListener] = None
+
+
+def _start_listener():
+    """로그 레코드를 큐에 넣고 별도 스레드에서 출력"""
+    global _listener
+    if _listener is not None:
+        return
+    records: queue.Queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [sql] %(message)s"))
+    _listener = QueueListener(records, handler)
+    _listener.start()
+    logger.addHandler(QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def install(engine: Engine):
+    """엔진에 쿼리 시간 측정 이벤트를 등록"""
+    _start_listener()
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryContextMiddleware:
+    """요청 경로를 컨텍스트 변수에 설정하고 요청별 쿼리 수/시간을 집계"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route = f"{scope['method']} {scope['path']}"
+        token = current_route.set(route)
+        try:
+            with track_queries() as queries:
+                await self.app(scope, receive,
+                               self._with_headers(send, queries)
+                               if DEBUG_HEADERS else send)
+        finally:
+            current_route.reset(token)
+
+        statement, repeats = queries.most_repeated()
+        if repeats >= N_PLUS_ONE_THRESHOLD:
+            logger.warning("possible N+1: %s ran %d times in %s (%d queries)",
+                           " ".join(statement.split()), repeats, route,
+                           queries.count)
+
+    @staticmethod
+    def _with_headers(send: Send, queries: RequestQueries) -> Send:
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(queries.count)
+                headers["X-DB-Time-Ms"] = f"{queries.duration_ms:.2f}"
+                headers["X-DB-Max-Repeats"] = str(queries.most_repeated()[1])
+            await send(message)
+
+        return send_wrapper
+
+
+class QueryBudgetExceeded(AssertionError):
+    """assert_query_budget 의 쿼리 수 초과 (응답은 response 로 확인)"""
+
+    def __init__(self, route: str, queries: int, budget: int, response):
+        super().__init__(f"{route}: {queries} queries (budget {budget})")
+        self.route = route
+        self.queries = queries
+        self.budget = budget
+        self.response = response
+
+
+def assert_query_budget(client, path: str, max_queries: int,
+                        method: str = "GET", **request_kwargs):
+    """client(TestClient) 로 path 를 요청하고 쿼리 수가 max_queries 이하인지 확인
+
+    ``SQL_DEBUG_HEADERS=1`` 로 import 한 앱이어야 합니다. 실패 응답은
+    raise_for_status 로, 예산 초과는 QueryBudgetExceeded 로 알리고, 통과하면
+    응답을 반환합니다.
+    """
+    response = client.request(method, path, **request_kwargs)
+    response.raise_for_status()
+    count = response.headers.get("X-DB-Query-Count")
+    if count is None:
+        raise RuntimeError("X-DB-Query-Count header is missing "
+                           "(start the app with SQL_DEBUG_HEADERS=1)")
+    if int(count) > max_queries:
+        raise QueryBudgetExceeded(f"{method} {path}", int(count),
+                                  max_queries, response)
+    return response
@@ -0,0 +1,210 @@
+"""업로드 저장소 정리 - 어떤 콘텐츠 행도 가리키지 않는 파일 격리/삭제
+
+콘텐츠를 지우거나 이미지를 바꿔도 업로드 파일은 남습니다. 이 작업은
+업로드 디렉토리를 훑으며 모든 테이블의 업로드 참조(이미지/아이콘/프로필 경로와
+마크다운 본문의 링크)에 없는 파일을 찾아 정리합니다.
+
+- 참조 집합은 ``uploadedfile.ref_count`` 가 아니라 콘텐츠 행에서 매번 다시 계산
+  (정리 후 ref_count 도 같은 값으로 맞춤)
+- 업로드 직후 아직 저장 전인 파일을 지우지 않도록, 파일 수정 시각과 등록 행의
+  updated_at 이 모두 유예 기간보다 오래된 파일만 대상
+- 훑는 동안 같은 내용이 다시 업로드되거나 콘텐츠가 저장될 수 있으므로, 실제
+  정리는 저장소 잠금(배타)을 잡은 뒤 파일 수정 시각을 다시 보고, 참조 수를 다시
+  계산한 다음 ``ref_count = 0 AND updated_at < 기준`` 조건으로 지워진 등록 행의
+  파일만 옮김 (업로드는 같은 잠금(공유) 안에서 파일을 두고 수정 시각을 올림)
+- 본문 링크 형태로 적을 수 없는 파일명(공백/괄호 등이 든 옛 파일)은 건너뜀
+- 기본은 격리: 같은 볼륨의 ``.upload-quarantine/<시각>/`` 로 옮기고(되돌리려면
+  원래 경로로 mv), 보관 기간이 지난 격리 묶음은 다음 실행 때 삭제
+- 하드 링크로 공유된 파일은 모든 링크가 정리될 때만 용량이 줄어든 것으로 계산
+"""
+import os
+import shutil
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Connection, Engine
+
+from app.models import UploadedFile
+from app.upload_store import PLAIN_NAME, count_references, iter_store_files, \
+    recount_references
+from app.uploads import UPLOAD_ROOT, store_lock
+
+QUARANTINE_ROOT = Path(os.getenv("UPLOAD_QUARANTINE_DIR",
+                                 str(UPLOAD_ROOT.parent / ".upload-quarantine")))
+GRACE_PERIOD = timedelta(hours=float(os.getenv("UPLOAD_GC_GRACE_HOURS", "24")))
+QUARANTINE_RETENTION = timedelta(
+    days=float(os.getenv("UPLOAD_GC_RETENTION_DAYS", "30")))
+BATCH_FORMAT = "%Y%m%dT%H%M%S"
+# 한 번에 삭제할 uploadedfile 행 수
+DELETE_BATCH_SIZE = 500
+
+_files = UploadedFile.__table__
+
+
+@dataclass
+class GCResult:
+    dry_run: bool = False
+    mode: str = "quarantine"
+    scanned_files: int = 0
+    scanned_bytes: int = 0
+    referenced_files: int = 0
+    # 참조되지 않지만 유예 기간 안이라 남긴 파일
+    recent_files: int = 0
+    # 본문 링크로 적을 수 없는 이름이라 판단하지 않고 남긴 파일
+    skipped_files: int = 0
+    orphaned: List[str] = field(default_factory=list)
+    orphaned_bytes: int = 0
+    quarantine: Optional[str] = None
+    purged_batches: List[str] = field(default_factory=list)
+    # 실제로 디스크에서 사라지는 용량 (격리는 보관 기간이 지나 삭제될 때 계산)
+    bytes_reclaimed: int = 0
+
+
+def _reclaimable(stats: Iterable[os.stat_result]) -> int:
+    """이 파일들을 모두 지우면 줄어드는 용량 (같은 inode 의 링크가 다 지워질 때만)"""
+    links: Dict[Tuple[int, int], List[os.stat_result]] = defaultdict(list)
+    for stat in stats:
+        links[(stat.st_dev, stat.st_ino)].append(stat)
+    return sum(group[0].st_size for group in links.values()
+               if len(group) >= group[0].st_nlink)
+
+
+def _expired_batches(now: datetime, retention: timedelta) -> List[Path]:
+    if not QUARANTINE_ROOT.is_dir():
+        return []
+    batches = []
+    for entry in os.scandir(QUARANTINE_ROOT):
+        try:
+            created = datetime.strptime(entry.name, BATCH_FORMAT)
+        except ValueError:
+            continue
+        if entry.is_dir() and now - created > retention:
+            batches.append(Path(entry.path))
+    return sorted(batches)
+
+
+def _batch_stats(batch: Path) -> List[os.stat_result]:
+    return [os.stat(os.path.join(directory, name))
+            for directory, _, names in os.walk(batch) for name in names]
+
+
+def _confirm_orphans(connection: Connection,
+                     candidates: List[Tuple[str, Path, os.stat_result]],
+                     registered: Set[str], cutoff: datetime
+                     ) -> List[Tuple[str, Path, os.stat_result]]:
+    """잠금 안에서 후보를 다시 확인하고 등록 행을 지움 (커밋은 호출 측)
+
+    훑은 뒤 다시 업로드된 파일(수정 시각), 새로 참조되거나 다시 등록된 파일
+    (ref_count / updated_at)은 빠집니다.
+    """
+    fresh = {}
+    for path, file, _ in candidates:
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            continue
+        if datetime.utcfromtimestamp(stat.st_mtime) <= cutoff:
+            fresh[path] = (file, stat)
+
+    references = recount_references(connection)
+    confirmed: Set[str] = set()
+    paths = [path for path in fresh if path in registered]
+    for start in range(0, len(paths), DELETE_BATCH_SIZE):
+        confirmed.update(connection.execute(
+            delete(_files)
+            .where(_files.c.path.in_(paths[start:start + DELETE_BATCH_SIZE]),
+                   _files.c.ref_count == 0, _files.c.updated_at < cutoff)
+            .returning(_files.c.path)).scalars())
+    # 훑을 때 등록되지 않았던 파일은 그 사이 등록되지 않았어야 함
+    unregistered = [path for path in fresh if path not in registered]
+    for start in range(0, len(unregistered), DELETE_BATCH_SIZE):
+        batch = unregistered[start:start + DELETE_BATCH_SIZE]
+        now_registered = set(connection.execute(
+            select(_files.c.path).where(_files.c.path.in_(batch))).scalars())
+        confirmed.update(path for path in batch if path not in now_registered
+                         and path not in references)
+    return [(path, *fresh[path]) for path in fresh if path in confirmed]
+
+
+def _count_orphans(result: GCResult,
+                   orphans: List[Tuple[str, Path, os.stat_result]],
+                   delete_files: bool) -> None:
+    result.orphaned = [path for path, _, _ in orphans]
+    result.orphaned_bytes = sum(stat.st_size for _, _, stat in orphans)
+    if delete_files:
+        result.bytes_reclaimed += _reclaimable(
+            stat for _, _, stat in orphans)
+
+
+def collect_garbage(engine: Engine, grace: timedelta = GRACE_PERIOD,
+                    delete_files: bool = False,
+                    retention: timedelta = QUARANTINE_RETENTION,
+                    dry_run: bool = False) -> GCResult:
+    """참조되지 않는 업로드 파일을 격리(기본) 또는 삭제"""
+    now = datetime.utcnow()
+    result = GCResult(dry_run=dry_run,
+                      mode="delete" if delete_files else "quarantine")
+    cutoff = now - grace
+
+    with engine.connect() as connection:
+        references = count_references(connection)
+        touched = dict(connection.execute(
+            select(_files.c.path, _files.c.updated_at)).all())
+
+        orphans: List[Tuple[str, Path, os.stat_result]] = []
+        for path, file in iter_store_files():
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            result.scanned_files += 1
+            result.scanned_bytes += stat.st_size
+            if path in references:
+                result.referenced_files += 1
+                continue
+            if not PLAIN_NAME.fullmatch(path):
+                result.skipped_files += 1
+                continue
+            modified = datetime.utcfromtimestamp(stat.st_mtime)
+            if max(modified, touched.get(path) or modified) > cutoff:
+                result.recent_files += 1
+                continue
+            orphans.append((path, file, stat))
+
+        expired = _expired_batches(now, retention)
+        result.purged_batches = [batch.name for batch in expired]
+        for batch in expired:
+            result.bytes_reclaimed += _reclaimable(_batch_stats(batch))
+        if dry_run:
+            _count_orphans(result, orphans, delete_files)
+            return result
+
+        # 확인부터 파일 이동까지 잠금 안에서 - 그동안 업로드는 파일을 두지 못하고
+        # 기다렸다가, 옮겨진 파일은 새로 씀
+        with store_lock(exclusive=True):
+            # 등록 행을 먼저 지우고 커밋 - 파일 정리가 중간에 실패해도
+            # 남은 파일은 등록되지 않은 고아 파일로 다음 실행 때 다시 정리됨
+            orphans = _confirm_orphans(connection, orphans, set(touched),
+                                       cutoff)
+            connection.commit()
+            _count_orphans(result, orphans, delete_files)
+
+            if orphans and not delete_files:
+                batch = QUARANTINE_ROOT / now.strftime(BATCH_FORMAT)
+                result.quarantine = str(batch)
+                for path, file, _ in orphans:
+                    target = batch / path
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(file, target)
+            elif orphans:
+                for _, file, _ in orphans:
+                    file.unlink(missing_ok=True)
+
+    for batch in expired:
+        shutil.rmtree(batch, ignore_errors=True)
+    return result
+
@@ -0,0 +1,386 @@
+"""업로드 저장소 (내용 주소 + 참조 수)
+
+업로드 파일은 ``<디렉토리>/<sha256><확장자>`` 로 저장하고, ``uploadedfile``
+테이블에 경로/해시/크기와 이 파일을 가리키는 콘텐츠 수(ref_count)를 기록합니다.
+
+- 같은 디렉토리에 같은 내용이 있으면 복사해 둔 임시 파일을 버리고 기존 경로를
+  반환
+- 다른 디렉토리에 같은 내용이 있으면 복사하지 않고 하드 링크로 공유
+- 콘텐츠 행의 업로드 URL 컬럼(마크다운 본문 포함)이 바뀌면 flush 직전에
+  참조 수를 증감 - 어디서도 참조하지 않는 파일은 app/upload_gc.py 가 정리
+- 이미지는 업로드 때 크기/대표 색/미리보기를 계산해 함께 저장하고, 콘텐츠 행의
+  image_path 가 바뀌면 flush 직전에 그 값을 행의 image_* 컬럼으로 복사
+- ORM 을 거치지 않은 변경(픽스처 등) 뒤에는 ``recount_references`` /
+  ``sync_image_metadata`` 로 다시 계산
+"""
+import asyncio
+import mimetypes
+import os
+import re
+from collections import Counter
+from datetime import datetime
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, \
+    Tuple
+from urllib.parse import unquote, urlsplit
+
+from fastapi import UploadFile
+from sqlalchemy import event, func, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.image_metadata import METADATA_FIELDS, analyze_images
+from app.metrics import record_upload
+from app.models import CoverArt, CVProfile, CVSection, GalleryImage, \
+    MarkdownCV, Media, RepresentativeWork, ResearchArea, ResearchHighlight, \
+    UploadedFile
+from app.uploads import UPLOAD_ROOT, UploadPolicy, check_uploads, \
+    commit_upload, file_extension, link_upload, stage_upload, store_lock
+
+# 업로드 URL 을 담는 컬럼: (컬럼, 마크다운 본문 여부)
+REFERENCE_COLUMNS = {
+    CoverArt: (("image_path", False),),
+    ResearchHighlight: (("image_path", False),),
+    RepresentativeWork: (("image_path", False),),
+    GalleryImage: (("image_path", False),),
+    ResearchArea: (("icon_path", False), ("description", True)),
+    CVProfile: (("profile_image", False),),
+    CVSection: (("content", True),),
+    MarkdownCV: (("content", True),),
+    Media: (("image_url", False),),
+}
+
+# 이미지 메타데이터를 복사해 두는 모델: 이미지 경로 컬럼
+IMAGE_COLUMNS = {
+    CoverArt: "image_path",
+    ResearchHighlight: "image_path",
+    RepresentativeWork: "image_path",
+    GalleryImage: "image_path",
+}
+# uploadedfile 컬럼 -> 콘텐츠 행 컬럼
+IMAGE_METADATA_COLUMNS = {
+    "width": "image_width",
+    "height": "image_height",
+    "dominant_color": "image_color",
+    "placeholder": "image_placeholder",
+}
+
+# 업로드 라우트가 파일을 쓰는 디렉토리 (UPLOAD_ROOT 기준, "" 는 루트)
+STORE_DIRECTORIES = ("", "cover-arts", "icons", "profiles", "research-areas",
+                     "research-highlights")
+
+URL_PREFIX = "static/uploads/"
+# 마크다운/HTML 본문의 업로드 URL (대안마다 URL 그룹 하나)
+MARKDOWN_URL = re.compile(
+    # 링크 대상을 <...> 로 감싼 경우 ](<url>), [ref]: <url> - 공백/괄호 허용
+    r"\](?:\(|:)\s*<[^<>\n]*?(/?static/uploads/[^<>\n]+)>"
+    # HTML 속성 src="..." / href='...'
+    r"|(?:src|href)\s*=\s*\"[^\"\n]*?(/?static/uploads/[^\"\n]+)\""
+    r"|(?:src|href)\s*=\s*'[^'\n]*?(/?static/uploads/[^'\n]+)'"
+    # 그 밖에는 공백/괄호/따옴표 전까지 (퍼센트 인코딩은 store_path 가 해석)
+    r"|(/?static/uploads/[^\s\"'()<>\[\]]+)")
+# 위의 마지막 형태로 적을 수 있는 파일명 - 아니면 정리 작업이 건너뜀
+PLAIN_NAME = re.compile(r"[^\s\"'()<>\[\]]+")
+
+INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+_files = UploadedFile.__table__
+
+
+def iter_store_files() -> Iterable[Tuple[str, Path]]:
+    """저장소 디렉토리의 파일 (저장소 경로, 실제 경로) - 작성 중인 임시 파일 제외
+
+    디렉토리 목록을 한 번에 읽지 않고 scandir 로 하나씩 돌려줍니다.
+    """
+    for directory in STORE_DIRECTORIES:
+        base = UPLOAD_ROOT / directory
+        if not base.is_dir():
+            continue
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith("."):
+                    path = f"{directory}/{entry.name}" if directory \
+                        else entry.name
+                    yield path, Path(entry.path)
+
+
+def store_path(url: Optional[str]) -> Optional[str]:
+    """업로드 URL (/static/uploads/..., 절대 URL 포함) -> 저장소 경로"""
+    if not url:
+        return None
+    value = url.strip()
+    if "://" in value:
+        value = urlsplit(value).path
+    value = unquote(value).lstrip("/")
+    if not value.startswith(URL_PREFIX):
+        return None
+    return value[len(URL_PREFIX):] or None
+
+
+def _url_matches(text: str) -> Iterator[Tuple[Tuple[int, int], str]]:
+    for match in MARKDOWN_URL.finditer(text):
+        # 대안마다 그룹이 하나라서 마지막으로 일치한 그룹이 URL
+        yield match.span(match.lastindex), match.group(match.lastindex)
+
+
+def markdown_urls(text: Optional[str]) -> List[str]:
+    """본문의 업로드 URL (문서 순서대로)"""
+    return [url for _, url in _url_matches(text or "")]
+
+
+def replace_markdown_urls(text: str, replace: Callable[[str], str]) -> str:
+    """본문의 업로드 URL 만 replace(url) 로 바꿈 (감싼 <> / 따옴표는 유지)"""
+    parts, last = [], 0
+    for (start, end), url in _url_matches(text):
+        parts += [text[last:start], replace(url)]
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def value_references(value: Optional[str], markdown: bool) -> Set[str]:
+    if not value:
+        return set()
+    if not markdown:
+        path = store_path(value)
+        return {path} if path else set()
+    return {path for path in map(store_path, markdown_urls(value)) if path}
+
+
+def _history_references(values: Iterable, markdown: bool) -> Set[str]:
+    return set().union(*(value_references(value, markdown)
+                         for value in values))
+
+
+def _reference_delta(session: Session) -> Counter:
+    """flush 될 추가/변경/삭제 행의 업로드 참조 증감"""
+    delta = Counter()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        columns = REFERENCE_COLUMNS.get(type(obj))
+        if not columns:
+            continue
+        state = inspect(obj)
+        deleted = obj in session.deleted
+        for column, markdown in columns:
+            history = state.attrs[column].history
+            if not history.has_changes() and not deleted:
+                continue
+            before = _history_references(
+                chain(history.unchanged, history.deleted), markdown)
+            after = set() if deleted else _history_references(
+                chain(history.unchanged, history.added), markdown)
+            delta.update(after - before)
+            delta.subtract(before - after)
+    return delta
+
+
+def track_references(session_class) -> None:
+    """session_class 의 flush 마다 업로드 참조 수를 갱신"""
+
+    @event.listens_for(session_class, "before_flush")
+    def _update_reference_counts(session, flush_context, instances):
+        changes = {path: count for path, count
+                   in _reference_delta(session).items() if count}
+        if not changes:
+            return
+        # session.connection() 은 autoflush 없이 같은 트랜잭션에서 실행
+        connection = session.connection()
+        now = datetime.utcnow()
+        for path, count in sorted(changes.items()):
+            connection.execute(
+                update(_files).where(_files.c.path == path)
+                .values(ref_count=_files.c.ref_count + count, updated_at=now))
+
+
+def _image_metadata(connection: Connection, paths: Set[str]
+                    ) -> Dict[str, dict]:
+    if not paths:
+        return {}
+    rows = connection.execute(
+        select(_files.c.path, *(_files.c[name] for name in METADATA_FIELDS))
+        .where(_files.c.path.in_(paths))).all()
+    return {row[0]: dict(zip(METADATA_FIELDS, row[1:])) for row in rows}
+
+
+def track_image_metadata(session_class) -> None:
+    """session_class 의 flush 마다 이미지가 바뀐 행에 메타데이터를 복사"""
+
+    @event.listens_for(session_class, "before_flush")
+    def _copy_image_metadata(session, flush_context, instances):
+        changed = []
+        for obj in chain(session.new, session.dirty):
+            column = IMAGE_COLUMNS.get(type(obj))
+            if column and inspect(obj).attrs[column].history.has_changes():
+                changed.append((obj, store_path(getattr(obj, column))))
+        if not changed:
+            return
+        found = _image_metadata(session.connection(),
+                                {path for _, path in changed if path})
+        empty = dict.fromkeys(METADATA_FIELDS)
+        for obj, path in changed:
+            # 저장소 밖의 이미지(외부 URL 등)는 값을 비움
+            for name, value in found.get(path, empty).items():
+                setattr(obj, IMAGE_METADATA_COLUMNS[name], value)
+
+
+def sync_image_metadata(connection: Connection) -> int:
+    """콘텐츠 행의 image_* 컬럼을 uploadedfile 기준으로 다시 맞추고 바뀐 행 수 반환"""
+    changed = 0
+    now = datetime.utcnow()
+    targets = list(IMAGE_METADATA_COLUMNS.values())
+    for model, column in IMAGE_COLUMNS.items():
+        table = model.__table__
+        rows = connection.execute(select(
+            table.c.id, table.c[column],
+            *(table.c[name] for name in targets))).all()
+        found = _image_metadata(
+            connection, {path for row in rows if (path := store_path(row[1]))})
+        for row in rows:
+            metadata = found.get(store_path(row[1]),
+                                 dict.fromkeys(METADATA_FIELDS))
+            values = {IMAGE_METADATA_COLUMNS[name]: value
+                      for name, value in metadata.items()}
+            if tuple(values.values()) == tuple(row[2:]):
+                continue
+            if "updated_at" in table.c:
+                values["updated_at"] = now
+            connection.execute(
+                update(table).where(table.c.id == row[0]).values(**values))
+            changed += 1
+    return changed
+
+
+def count_references(connection: Connection) -> Counter:
+    """모든 콘텐츠 행을 읽어 경로별 참조 수 계산"""
+    counts = Counter()
+    for model, columns in REFERENCE_COLUMNS.items():
+        table = model.__table__
+        names = [column for column, _ in columns]
+        for row in connection.execute(select(*(table.c[name]
+                                               for name in names))):
+            for value, (_, markdown) in zip(row, columns):
+                counts.update(value_references(value, markdown))
+    return counts
+
+
+def recount_references(connection: Connection) -> Counter:
+    """uploadedfile.ref_count 를 콘텐츠 행 기준으로 다시 계산 (경로별 참조 수 반환)"""
+    counts = count_references(connection)
+    now = datetime.utcnow()
+    for path, ref_count in connection.execute(
+            select(_files.c.path, _files.c.ref_count)).all():
+        if counts.get(path, 0) != ref_count:
+            connection.execute(
+                update(_files).where(_files.c.path == path)
+                .values(ref_count=counts.get(path, 0), updated_at=now))
+    return counts
+
+
+def register_files(dialect: str, rows: List[dict]):
+    """uploadedfile 등록 INSERT
+
+    같은 경로가 이미 있으면 updated_at 만 올리고(정리 작업의 유예 기간을 다시
+    시작), 비어 있는 이미지 메타데이터를 채웁니다.
+    """
+    statement = INSERTS[dialect](_files).values(rows)
+    values = {name: func.coalesce(_files.c[name], statement.excluded[name])
+              for name in METADATA_FIELDS if name in rows[0]}
+    values["updated_at"] = statement.excluded.updated_at
+    return statement.on_conflict_do_update(index_elements=["path"],
+                                           set_=values)
+
+
+def _place(staged: Path, target: Path, sources: List[Path]) -> None:
+    # 정리 작업이 파일을 옮기는 동안에는 기다림 (app/upload_gc.py)
+    with store_lock():
+        if target.exists():
+            # 같은 디렉토리에 같은 내용이 이미 있음 (재업로드) - 수정 시각을
+            # 올려 정리 작업의 유예 기간을 다시 시작
+            os.utime(target)
+            return
+        for source in sources:
+            if source.exists():
+                link_upload(source, target)
+                return
+        commit_upload(staged, target)
+
+
+async def _stage_all(files: List[UploadFile], directory: Path,
+                     max_bytes: int) -> List[Tuple[str, int, Path]]:
+    """파일마다 임시 파일로 복사하며 해시 계산 (하나라도 실패하면 모두 정리)"""
+    results = await asyncio.gather(*(
+        run_in_threadpool(stage_upload, file, directory, max_bytes)
+        for file in files), return_exceptions=True)
+    errors = [result for result in results
+              if isinstance(result, BaseException)]
+    if errors:
+        for result in results:
+            if not isinstance(result, BaseException):
+                result[2].unlink(missing_ok=True)
+        raise errors[0]
+    return results
+
+
+async def store_uploads(db: AsyncSession, files: List[UploadFile],
+                        directory: Path, policy: UploadPolicy) -> List[str]:
+    """검사 후 파일들을 병렬로 해시/저장하고 등록 (요청 순서대로 파일명 반환)"""
+    check_uploads(files, policy)
+    staged = await _stage_all(files, directory, policy.max_bytes)
+    try:
+        return await _store_staged(db, files, directory, staged)
+    finally:
+        # 기존 파일을 쓰거나 링크한 경우 남은 임시 파일 정리
+        for _, _, path in staged:
+            path.unlink(missing_ok=True)
+
+
+async def _store_staged(db: AsyncSession, files: List[UploadFile],
+                        directory: Path,
+                        staged: List[Tuple[str, int, Path]]) -> List[str]:
+    hashes = [(digest, size) for digest, size, _ in staged]
+
+    known: Dict[str, List[Path]] = {}
+    # 같은 내용의 이미지 메타데이터는 이미 계산된 값을 재사용
+    analyzed: Dict[str, dict] = {}
+    for path, sha256, *metadata in (await db.exec(
+            select(_files.c.path, _files.c.sha256,
+                   *(_files.c[name] for name in METADATA_FIELDS))
+            .where(_files.c.sha256.in_({digest for digest, _ in hashes})))):
+        known.setdefault(sha256, []).append(UPLOAD_ROOT / path)
+        if metadata[0] is not None:
+            analyzed[sha256] = dict(zip(METADATA_FIELDS, metadata))
+
+    targets = [directory / f"{digest}{file_extension(file)}"
+               for file, (digest, _) in zip(files, hashes)]
+    await asyncio.gather(*(
+        run_in_threadpool(_place, path, target, known.get(digest, []))
+        for target, (digest, _, path) in zip(targets, staged)))
+
+    pending = {digest: target for file, target, (digest, _)
+               in zip(files, targets, hashes)
+               if digest not in analyzed
+               and (file.content_type or "").startswith("image/")}
+    for digest, metadata in zip(pending, await analyze_images(
+            str(target) for target in pending.values())):
+        analyzed[digest] = metadata or {}
+
+    now = datetime.utcnow()
+    rows = {}
+    for file, target, (digest, size) in zip(files, targets, hashes):
+        path = target.relative_to(UPLOAD_ROOT).as_posix()
+        rows[path] = {
+            "path": path, "sha256": digest, "size": size,
+            "content_type": file.content_type
+            or mimetypes.guess_type(target.name)[0],
+            "ref_count": 0, "created_at": now, "updated_at": now,
+            **{name: analyzed.get(digest, {}).get(name)
+               for name in METADATA_FIELDS},
+        }
+        record_upload(directory.name, size)
+    await db.exec(register_files(db.bind.dialect.name, list(rows.values())))
+    await db.commit()
+    return [target.name for target in targets]
@@ -0,0 +1,286 @@
+"""업로드 파일 저장
+
+업로드된 파일은 내용의 SHA-256 해시를 파일명으로 저장합니다. 같은 URL 은
+항상 같은 바이트를 가리키므로 nginx 에서 ``Cache-Control: immutable`` 로
+1년 동안 캐시할 수 있습니다 (nginx.conf 참고).
+
+- 라우트마다 ``UploadPolicy`` (파일당 최대 크기, 파일 수, 허용 형식)를 두고
+  ``@accepts_uploads`` 로 엔드포인트에 연결
+- FastAPI 는 폼 본문을 모두 받은 뒤 핸들러를 호출하므로, 크기 제한은
+  ``UploadLimitMiddleware`` 가 본문을 읽는 시점에 적용
+  - 요청 전체: 파일 수 x (파일당 크기 + 여유분). Content-Length 가 크면 읽기 전에,
+    chunked 전송이면 넘는 순간 413
+  - 파트(파일)마다: multipart 본문을 받는 대로 파싱해 한 파트가 파일당 크기를
+    넘는 순간 413 (스풀 파일에 끝까지 받지 않음)
+- 형식/크기 검사는 파일을 쓰기 전에 모두 끝내고, 저장은 app/upload_store.py 가
+  파일마다 스레드풀에서 병렬로 처리
+- 스풀된 업로드는 한 번만 읽어 저장 디렉토리의 임시 파일로 복사하면서 해시를
+  계산하고, ``<sha256><확장자>`` 로 이름만 바꿈
+"""
+import fcntl
+import hashlib
+import mimetypes
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, UploadFile
+from python_multipart.multipart import MultipartParser, parse_options_header
+from python_multipart.exceptions import MultipartParseError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UPLOAD_ROOT = Path("../frontend/static/uploads")
+# 파일 배치(공유)와 정리 작업(배타)을 프로세스 사이에서 직렬화하는 잠금 파일
+STORE_LOCK = UPLOAD_ROOT / ".store.lock"
+CHUNK_SIZE = 1024 * 1024
+# 파일마다 붙는 multipart 헤더/경계와 다른 폼 필드 여유분
+MULTIPART_OVERHEAD = 64 * 1024
+
+IMAGE_EXTENSIONS = (".avif", ".bmp", ".gif", ".ico", ".jpeg", ".jpg", ".png",
+                    ".svg", ".tif", ".tiff", ".webp")
+
+_EXTENSION = re.compile(r"^\.[a-z0-9]{1,8}$")
+
+
+def _megabytes(name: str, default: int) -> int:
+    return int(float(os.getenv(name, str(default))) * 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class UploadPolicy:
+    """라우트별 업로드 제한 (content_types/extensions 가 비어 있으면 검사 안 함)"""
+    max_bytes: int
+    max_files: int = 10
+    content_types: Tuple[str, ...] = ("image/",)
+    extensions: Tuple[str, ...] = IMAGE_EXTENSIONS
+    type_error: str = "File must be an image"
+
+    @property
+    def max_request_bytes(self) -> int:
+        return self.max_files * (self.max_bytes + MULTIPART_OVERHEAD)
+
+
+IMAGE_UPLOADS = UploadPolicy(max_bytes=_megabytes("UPLOAD_MAX_IMAGE_MB", 10))
+COVER_ART_UPLOADS = UploadPolicy(
+    max_bytes=_megabytes("UPLOAD_MAX_COVER_ART_MB", 30))
+ICON_UPLOADS = UploadPolicy(max_bytes=_megabytes("UPLOAD_MAX_ICON_MB", 2))
+PUBLICATION_IMPORTS = UploadPolicy(
+    max_bytes=_megabytes("UPLOAD_MAX_IMPORT_MB", 20), max_files=20,
+    content_types=(), extensions=())
+
+
+def accepts_uploads(policy: UploadPolicy):
+    """엔드포인트에 업로드 정책을 연결 (UploadLimitMiddleware 가 참조)"""
+
+    def decorate(endpoint):
+        endpoint.upload_policy = policy
+        return endpoint
+
+    return decorate
+
+
+def _too_large(limit: int) -> HTTPException:
+    size = f"{limit // 1024 // 1024} MB" if limit >= 1024 * 1024 \
+        else f"{limit // 1024} KB"
+    return HTTPException(status_code=413,
+                         detail=f"File too large (max {size})")
+
+
+class _PartSizeLimit:
+    """multipart 본문을 받는 대로 파싱해 파트마다 본문 바이트 수를 셈
+
+    파싱만 하고 내용은 버립니다. 형식이 잘못된 본문은 검사를 멈추고 그대로
+    넘겨 FastAPI 의 폼 파싱이 400 으로 처리하게 합니다.
+    """
+
+    def __init__(self, boundary: bytes, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.exceeded = False
+        self.parser: Optional[MultipartParser] = MultipartParser(
+            boundary, {"on_part_begin": self._begin,
+                       "on_part_data": self._data})
+
+    def _begin(self):
+        self.size = 0
+
+    def _data(self, data: bytes, start: int, end: int):
+        self.size += end - start
+        if self.size > self.max_bytes:
+            self.exceeded = True
+
+    def feed(self, body: bytes) -> None:
+        if self.parser is None or not body:
+            return
+        try:
+            self.parser.write(body)
+        except MultipartParseError:
+            self.parser = None
+        if self.exceeded:
+            raise _too_large(self.max_bytes)
+
+    @classmethod
+    def for_request(cls, scope: Scope,
+                    max_bytes: int) -> Optional["_PartSizeLimit"]:
+        content_type = dict(scope["headers"]).get(b"content-type", b"")
+        kind, options = parse_options_header(content_type)
+        boundary = options.get(b"boundary")
+        if kind != b"multipart/form-data" or not boundary:
+            return None
+        return cls(boundary, max_bytes)
+
+
+class UploadLimitMiddleware:
+    """업로드 라우트의 요청 본문 크기 제한
+
+    라우팅이 끝난 뒤 본문을 처음 읽을 때 scope 의 엔드포인트에서 정책을 찾습니다.
+    요청 전체 크기와 함께 파트마다 ``max_bytes`` 를 적용하므로, 한도를 넘는 파일
+    하나는 끝까지 받기 전에(핸들러 실행 전) 거절됩니다.
+    HTTPException 은 FastAPI 의 본문 파싱을 그대로 통과해 413 응답이 됩니다.
+
+    ``scope["endpoint"]`` 는 Starlette 라우터가 매칭한 라우트의 child scope 를
+    ``scope.update()`` 로 같은 dict 에 합치기 때문에 이 미들웨어에서도 보입니다
+    (starlette.routing.Router.app). 라우팅이 scope 를 복사하도록 바뀌면 정책을
+    찾지 못해 제한 없이 통과하므로, 업그레이드 때 업로드 한도 413 동작을 확인해야
+    합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+        checked = False
+        parts: Optional[_PartSizeLimit] = None
+
+        async def limited_receive() -> Message:
+            nonlocal received, checked, parts
+            policy = getattr(scope.get("endpoint"), "upload_policy", None)
+            if policy is None:
+                return await receive()
+            limit = policy.max_request_bytes
+            if not checked:
+                checked = True
+                length = dict(scope["headers"]).get(b"content-length")
+                if length and length.isdigit() and int(length) > limit:
+                    raise _too_large(policy.max_bytes)
+                parts = _PartSizeLimit.for_request(scope, policy.max_bytes)
+            message = await receive()
+            body = message.get("body", b"")
+            received += len(body)
+            if received > limit:
+                raise _too_large(policy.max_bytes)
+            if parts is not None:
+                parts.feed(body)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def file_extension(file: UploadFile) -> str:
+    """원본 파일명(없으면 content type)에서 안전한 확장자를 추출"""
+    suffix = Path(file.filename or "").suffix.lower()
+    if _EXTENSION.match(suffix):
+        return suffix
+    guessed = mimetypes.guess_extension(file.content_type or "") or ""
+    return guessed if _EXTENSION.match(guessed) else ""
+
+
+def check_uploads(files: List[UploadFile], policy: UploadPolicy) -> None:
+    """파일 수/형식/크기를 저장 전에 한 번에 검사"""
+    if not files:
+        raise HTTPException(status_code=400, detail="No file uploaded")
+    if len(files) > policy.max_files:
+        raise HTTPException(status_code=400,
+                            detail=f"Too many files (max {policy.max_files})")
+    for file in files:
+        content_type = file.content_type or ""
+        if policy.content_types and \
+                not content_type.startswith(policy.content_types):
+            raise HTTPException(status_code=400, detail=policy.type_error)
+        if policy.extensions and file_extension(file) not in policy.extensions:
+            raise HTTPException(status_code=400, detail=policy.type_error)
+        if file.size is not None and file.size > policy.max_bytes:
+            raise _too_large(policy.max_bytes)
+
+
+def stage_upload(file: UploadFile, directory: Path,
+                 max_bytes: Optional[int] = None) -> Tuple[str, int, Path]:
+    """업로드 내용을 directory 의 임시 파일로 복사하면서 (SHA-256, 크기) 계산
+
+    스풀된 업로드는 이 한 번만 읽습니다. 돌려준 임시 파일은 호출 측이
+    ``commit_upload`` 로 이름을 바꾸거나 지웁니다.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".upload-")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        file.file.seek(0)
+        with os.fdopen(fd, "wb") as buffer:
+            while chunk := file.file.read(CHUNK_SIZE):
+                size += len(chunk)
+                # 크기를 모르는 스트림도 한도를 넘는 순간 중단
+                if max_bytes is not None and size > max_bytes:
+                    raise _too_large(max_bytes)
+                digest.update(chunk)
+                buffer.write(chunk)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return digest.hexdigest(), size, Path(tmp_path)
+
+
+def commit_upload(staged: Path, target: Path) -> None:
+    """stage_upload 의 임시 파일을 target 으로 원자적으로 이름 변경"""
+    os.chmod(staged, 0o644)
+    os.replace(staged, target)
+
+
+def replace_atomically(target: Path, write) -> None:
+    """같은 디렉토리의 임시 경로에 만든 뒤 원자적으로 이름 변경"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".upload-")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+@contextmanager
+def store_lock(exclusive: bool = False) -> Iterator[None]:
+    """업로드 저장소 잠금 (flock, 블로킹이므로 스레드풀에서 사용)"""
+    STORE_LOCK.parent.mkdir(parents=True, exist_ok=True)
+    with open(STORE_LOCK, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def link_upload(source: Path, target: Path) -> None:
+    """같은 내용의 기존 파일을 하드 링크로 공유 (다른 파일 시스템이면 복사)"""
+
+    def link(tmp_path: str):
+        os.unlink(tmp_path)
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+
+    replace_atomically(target, link)
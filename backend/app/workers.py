@@ -0,0 +1,38 @@
+"""CPU 작업용 프로세스 풀 (이미지 분석, DOCX 생성)
+
+디코딩/문서 생성처럼 CPU 를 오래 쓰는 작업은 이벤트 루프나 스레드풀 대신
+별도 프로세스에서 실행합니다. 워커에서 실행할 함수는 DB/라우터 모듈을
+import 하지 않는 가벼운 모듈에 두어 워커가 빨리 뜨도록 합니다.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+WORKER_PROCESSES = int(os.getenv("WORKER_PROCESSES", "2"))
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 서버 프로세스의 스레드/커넥션을 물려받지 않도록 spawn 으로 생성
+        _executor = ProcessPoolExecutor(
+            max_workers=WORKER_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+async def run_in_process(func: Callable[..., Any], *args: Any) -> Any:
+    """func(*args) 를 워커 프로세스에서 실행 (인자/결과는 pickle 가능해야 함)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pool(), func, *args)
+
+
+def shutdown_process_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
@@ -0,0 +1,71 @@
+"""등록된 업로드 이미지의 크기/대표 색/미리보기 계산 + 콘텐츠 행에 복사
+
+새 업로드는 업로드 때 계산되므로, 이 스크립트는 기존 파일에 한 번 실행합니다.
+파일 등록이 먼저 필요합니다 (``python scripts/dedupe_uploads.py``).
+여러 번 실행해도 안전합니다.
+
+    python scripts/backfill_image_metadata.py
+    python scripts/backfill_image_metadata.py --force   # 모두 다시 계산
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from sqlalchemy import select, update
+
+from app.database import create_db_and_tables, engine
+from app.image_metadata import METADATA_FIELDS, analyze_image
+from app.models import UploadedFile
+from app.upload_store import sync_image_metadata
+from app.uploads import IMAGE_EXTENSIONS, UPLOAD_ROOT
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="업로드 이미지 메타데이터 계산 + 콘텐츠 행 복사")
+    parser.add_argument("--force", action="store_true",
+                        help="이미 계산된 파일도 다시 계산")
+    args = parser.parse_args()
+
+    create_db_and_tables()
+    table = UploadedFile.__table__
+    query = select(table.c.id, table.c.path)
+    if not args.force:
+        query = query.where(table.c.width.is_(None))
+    with engine.connect() as connection:
+        rows = [row for row in connection.execute(query)
+                if os.path.splitext(row.path)[1].lower() in IMAGE_EXTENSIONS]
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(
+            analyze_image, [str(UPLOAD_ROOT / row.path) for row in rows],
+            chunksize=8))
+    elapsed = time.perf_counter() - started
+
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        for row, metadata in zip(rows, results):
+            if metadata is None:
+                continue
+            connection.execute(update(table).where(table.c.id == row.id)
+                               .values(**metadata, updated_at=now))
+        changed = sync_image_metadata(connection)
+
+    analyzed = sum(metadata is not None for metadata in results)
+    print(f"🖼️  이미지 {len(rows)}개 중 {analyzed}개 분석 ({elapsed:.2f}s)")
+    for row, metadata in zip(rows, results):
+        if metadata is None:
+            print(f"   ⚠️  읽을 수 없음: {row.path}")
+    print(f"✅ 콘텐츠 행 {changed}개 갱신 ({', '.join(METADATA_FIELDS)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""목록 API 응답 직렬화 벤치마크
+
+1) encoder: 테이블 모델 response_model 의 FastAPI 직렬화 경로
+   (검증 → serialize → render)로 JSONResponse 와 ORJSONResponse 를 비교
+2) read: 인메모리 SQLite 에서 테이블 모델을 읽어 직렬화하던 기존 경로와
+   읽기 스키마 + 사전 컴파일 직렬화기를 쓰는 현재 라우터를 CPU 시간과
+   메모리 할당량(tracemalloc)으로 비교
+
+    python scripts/benchmark_serialization.py [--scale 1 10] [--repeat 200]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import Publication, Award, Conference, CoverArt, \
+    ResearchHighlight, RepresentativeWork, ResearchArea, Media
+from app.responses import ORJSONResponse
+from app.routers import publications, awards, conferences, media, cover_arts, \
+    research_highlights, representative_works, research_areas
+
+# 운영 데이터 기준의 행 수 (--scale 로 배수 적용)
+BASE_ROWS = {
+    "/api/publications/": 66,
+    "/api/awards/": 20,
+    "/api/conferences/": 40,
+    "/api/media/": 15,
+    "/api/cover-arts/": 15,
+    "/api/research-highlights/": 12,
+    "/api/representative-works/": 8,
+    "/api/research-areas/": 3,
+}
+
+NOW = datetime(2025, 9, 1, 12, 0, 0, 123456)
+
+
+def _publication(i):
+    return Publication(
+        id=i, number=i, year=str(2015 + i % 10), month="Jan",
+        title=f"Metasurface study number {i} on scalable nanofabrication " * 2,
+        authors="Joohoon Kim*, Dong Kyo Oh*, Trung Hoang, Junsuk Rho+",
+        journal="Nature Communications", volume=str(i), pages=f"{i}-{i + 9}",
+        doi=f"10.1038/s41467-025-{i:05d}", is_first_author=i % 3 == 0,
+        is_corresponding_author=i % 4 == 0, is_equal_contribution=i % 5 == 0,
+        contribution_type="first-author", status="published",
+        impact_factor=14.7, featured_info="Cover article",
+        created_at=NOW, updated_at=NOW - timedelta(days=i),
+    )
+
+
+def _award(i):
+    return Award(id=i, title=f"Best Paper Award {i}", organization="KSME",
+                 location="Korea", year=str(2015 + i % 10), rank="1st",
+                 description="Awarded for outstanding research", created_at=NOW)
+
+
+def _conference(i):
+    return Conference(id=i, title=f"Invited talk {i} on metalenses",
+                      conference_name="CLEO", location="San Jose, USA",
+                      date=f"2024-0{1 + i % 9}", presentation_type="Oral",
+                      award=None, description="Metasurface session",
+                      created_at=NOW)
+
+
+def _media(i):
+    return Media(id=i, title=f"News article {i}", source="Korea Herald",
+                 date=f"2024-0{1 + i % 9}-01", url="https://example.com/news",
+                 description="Coverage of metalens mass production",
+                 category="news", image_url="/static/uploads/news.jpg",
+                 created_at=NOW)
+
+
+def _cover_art(i):
+    return CoverArt(id=i, image_path=f"/static/uploads/cover-arts/{i}.jpg",
+                    link="https://doi.org/10.1038/x", journal="Nature Materials",
+                    volume=str(i), year="2024", description="Front cover",
+                    alt_text="cover", order_index=i, is_active=True,
+                    created_at=NOW, updated_at=NOW)
+
+
+def _highlight(i):
+    return ResearchHighlight(
+        id=i, image_path=f"/static/uploads/research-highlights/{i}.jpg",
+        link="https://doi.org/10.1038/x", description="Highlight " * 10,
+        alt_text="highlight", order_index=i, is_active=True,
+        created_at=NOW, updated_at=NOW)
+
+
+def _work(i):
+    return RepresentativeWork(
+        id=i, title=f"Representative work {i}", journal="Nature",
+        volume=str(i), is_in_revision=False, pages="474-481", year="2023",
+        image_path=f"/static/uploads/{i}.jpg", order_index=i, is_active=True,
+        created_at=NOW, updated_at=NOW)
+
+
+def _area(i):
+    return ResearchArea(id=i, title=f"Area {i}", slug=f"area-{i}",
+                        description="## Overview\n" + "Markdown body. " * 200,
+                        icon_path=f"/static/uploads/icons/{i}.png",
+                        order_index=i, is_active=True,
+                        created_at=NOW, updated_at=NOW)
+
+
+FACTORIES = {
+    "/api/publications/": _publication,
+    "/api/awards/": _award,
+    "/api/conferences/": _conference,
+    "/api/media/": _media,
+    "/api/cover-arts/": _cover_art,
+    "/api/research-highlights/": _highlight,
+    "/api/representative-works/": _work,
+    "/api/research-areas/": _area,
+}
+
+
+# 경로별 (테이블 모델, 현재 라우터 함수, 호출 인자)
+READ_ENDPOINTS = {
+    "/api/publications/": (Publication, publications.list_publications, {}),
+    "/api/awards/": (Award, awards.get_awards, {}),
+    "/api/conferences/": (Conference, conferences.get_conferences, {}),
+    "/api/media/": (Media, media.get_media, {}),
+    "/api/cover-arts/": (CoverArt, cover_arts.list_cover_arts,
+                         {"active_only": False}),
+    "/api/research-highlights/": (
+        ResearchHighlight, research_highlights.list_research_highlights,
+        {"active_only": False}),
+    "/api/representative-works/": (
+        RepresentativeWork, representative_works.get_representative_works,
+        {"active_only": False}),
+    "/api/research-areas/": (ResearchArea, research_areas.list_research_areas,
+                             {"active_only": False}),
+}
+
+
+def _measure(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def _allocated_kb(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def run_encoders(scales, repeat):
+    loop = asyncio.new_event_loop()
+
+    def old_path(field, rows):
+        content = loop.run_until_complete(serialize_response(
+            field=field, response_content=rows))
+        return JSONResponse(content).body
+
+    def new_path(field, rows):
+        content = loop.run_until_complete(serialize_response(
+            field=field, response_content=rows))
+        return ORJSONResponse(content).body
+
+    print(f"{'endpoint':32} {'rows':>6} {'json ms':>9} {'orjson ms':>10} "
+          f"{'speedup':>8}")
+    for scale in scales:
+        for path, (model, _, _) in READ_ENDPOINTS.items():
+            field = create_model_field(name="response", type_=List[model])
+            rows = [FACTORIES[path](i) for i in
+                    range(1, BASE_ROWS[path] * scale + 1)]
+            assert old_path(field, rows) == new_path(field, rows)
+            old_ms = _measure(lambda: old_path(field, rows), repeat)
+            new_ms = _measure(lambda: new_path(field, rows), repeat)
+            print(f"{path:32} {len(rows):>6} {old_ms:>9.3f} {new_ms:>10.3f} "
+                  f"{old_ms / new_ms:>7.2f}x")
+    loop.close()
+
+
+async def _seed(engine, scale):
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        for path, factory in FACTORIES.items():
+            db.add_all(factory(i) for i in
+                       range(1, BASE_ROWS[path] * scale + 1))
+        await db.commit()
+
+
+def run_read_paths(scales, repeat):
+    loop = asyncio.new_event_loop()
+
+    print(f"{'endpoint':32} {'rows':>6} {'table ms':>9} {'read ms':>8} "
+          f"{'table KB':>9} {'read KB':>8}")
+    for scale in scales:
+        # 라우터와 같은 비동기 세션으로 읽기 위해 하나의 인메모리 DB 를 공유
+        engine = create_async_engine("sqlite+aiosqlite://",
+                                     poolclass=StaticPool)
+        loop.run_until_complete(_seed(engine, scale))
+
+        for path, (model, endpoint, params) in READ_ENDPOINTS.items():
+            field = create_model_field(name="response", type_=List[model])
+
+            async def table_read():
+                async with AsyncSession(engine) as db:
+                    rows = (await db.exec(select(model))).scalars().all()
+                    content = await serialize_response(
+                        field=field, response_content=rows)
+                    return ORJSONResponse(content).body
+
+            async def schema_read():
+                async with AsyncSession(engine) as db:
+                    return (await endpoint(db=db, **params)).body
+
+            def table_path():
+                return loop.run_until_complete(table_read())
+
+            def read_path():
+                return loop.run_until_complete(schema_read())
+
+            table_ms = _measure(table_path, repeat)
+            read_ms = _measure(read_path, repeat)
+            print(f"{path:32} {BASE_ROWS[path] * scale:>6} {table_ms:>9.3f} "
+                  f"{read_ms:>8.3f} {_allocated_kb(table_path):>9.1f} "
+                  f"{_allocated_kb(read_path):>8.1f}")
+        loop.run_until_complete(engine.dispose())
+    loop.close()
+
+
+def run(scales, repeat):
+    print("== encoder (JSONResponse vs ORJSONResponse)")
+    run_encoders(scales, repeat)
+    print()
+    print("== read path (table model response_model vs read schema)")
+    run_read_paths(scales, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    run(args.scale, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
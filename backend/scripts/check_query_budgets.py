@@ -0,0 +1,165 @@
+"""라우트별 쿼리 예산 검사
+
+임시 SQLite DB 에 샘플 데이터를 만든 뒤 각 라우트를
+``app.sql_logging.assert_query_budget`` 으로 호출하고, 디버그 헤더
+(X-DB-Query-Count)로 집계한 쿼리 수가 예산을 넘으면 실패합니다.
+배포 전에 실행해서 DB 왕복 횟수가 늘어나는 회귀를 잡습니다.
+
+응답 캐시를 비운 상태(첫 요청)를 기준으로 하므로 지문 조회가 가능한 테이블의
+GET 은 지문 쿼리 1 회가 포함됩니다. 출판물 조회는 비트맵 인덱스(app/facets.py)의
+변경 확인과 재생성 쿼리가 더해집니다.
+
+    python scripts/check_query_budgets.py
+"""
+import os
+import secrets
+import sys
+import tempfile
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+os.chdir(project_root)
+
+workdir = tempfile.mkdtemp(prefix="query-budget-")
+ADMIN_PASSWORD = secrets.token_hex(8)
+os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/budget.db"
+os.environ["SQL_DEBUG_HEADERS"] = "1"
+os.environ["CV_EXPORT_DIR"] = f"{workdir}/cv-exports"
+os.environ.setdefault("SECRET_KEY", secrets.token_hex(16))
+os.environ.setdefault("FRONTEND_ORIGIN", "http://localhost")
+os.environ["ADMIN_USERNAME"] = "admin"
+
+from passlib.context import CryptContext
+
+os.environ["ADMIN_PASSWORD_HASH"] = CryptContext(schemes=["bcrypt"]).hash(
+    ADMIN_PASSWORD)
+
+from fastapi.testclient import TestClient
+
+from app import facets
+from app.cache import response_cache
+from app.main import app
+from app.routers import sitemap
+from app.sql_logging import QueryBudgetExceeded, assert_query_budget
+
+# 예산 검사 전에 만들어 둘 데이터 (경로, 본문)
+FIXTURES = {
+    "publication": ("/api/publications/", {
+        "number": 1, "title": "Metalens", "authors": "Joohoon Kim*",
+        "journal": "Nature", "year": "2024", "status": "published"}),
+    "award": ("/api/awards/", {
+        "title": "Best Paper", "organization": "KSME", "location": "Korea",
+        "year": "2024"}),
+    "conference": ("/api/conferences/", {
+        "title": "Talk", "conference_name": "CLEO", "location": "USA",
+        "date": "2024-05", "presentation_type": "Oral"}),
+    "cover_art": ("/api/cover-arts/", {
+        "image_path": "/static/uploads/cover-arts/a.jpg", "journal": "Nature"}),
+    "highlight": ("/api/research-highlights/", {
+        "image_path": "/static/uploads/research-highlights/a.jpg"}),
+    "work": ("/api/representative-works/", {
+        "title": "Work", "journal": "Nature",
+        "image_path": "static/uploads/a.jpg"}),
+    "area": ("/api/research-areas/", {
+        "title": "Design", "slug": "design", "description": "## Overview"}),
+    "cv_profile": ("/api/cv/profile", {
+        "name": "Joohoon Kim", "title": "Professor", "bio": "Metasurfaces",
+        "contact_info": [{"label": "Email", "value": "a@b.c",
+                          "data_type": "email"}],
+        "cv_sections": [{"title": "Education", "content": "- PhD"},
+                        {"title": "Awards", "content": "- Best Paper"}]}),
+    "cv_document": ("/api/cv-markdown/documents", {
+        "title": "CV", "content": "# CV\n\n## Education\n\n- PhD\n"}),
+}
+
+# 픽스처를 만든 뒤 실행할 요청 (메서드, 경로)
+SETUP = [
+    ("POST", "/api/cv-markdown/documents/{cv_document}/set-active"),
+]
+
+# PUT 본문 (없으면 픽스처 본문을 그대로 사용)
+UPDATES = {
+    # 본문이 바뀌어야 버전 기록(델타) 쿼리까지 포함됨
+    "/api/cv-markdown/documents": {
+        "content": "# CV\n\n## Education\n\n- PhD\n- MS\n"},
+}
+
+# (메서드, 경로, 최대 쿼리 수)
+QUERY_BUDGETS = [
+    ("GET", "/api/publications/", 3),
+    ("GET", "/api/publications/years", 3),
+    ("GET", "/api/publications/stats", 3),
+    ("GET", "/api/publications/facets", 3),
+    ("GET", "/api/publications/search?q=meta", 2),
+    ("GET", "/api/publications/{publication}", 2),
+    ("GET", "/api/awards/", 1),
+    ("GET", "/api/conferences/", 1),
+    ("GET", "/api/cover-arts/", 2),
+    ("GET", "/api/cover-arts/{cover_art}", 2),
+    ("GET", "/api/research-highlights/", 2),
+    ("GET", "/api/representative-works/", 2),
+    ("GET", "/api/research-areas/", 2),
+    ("GET", "/api/research-areas/design", 2),
+    ("GET", "/api/bootstrap", 7),
+    ("GET", "/api/search/sitemap.xml", 7),
+    ("GET", "/api/cv/profile", 3),
+    ("GET", "/api/cv-markdown/documents/active", 1),
+    ("PUT", "/api/publications/{publication}", 3),
+    ("PUT", "/api/awards/{award}", 3),
+    ("PUT", "/api/cover-arts/{cover_art}", 3),
+    ("PUT", "/api/research-areas/{area}", 3),
+    ("PUT", "/api/cv-markdown/documents/{cv_document}", 6),
+    ("DELETE", "/api/conferences/{conference}", 2),
+]
+
+
+def main():
+    failures = []
+    with TestClient(app, base_url="https://testserver") as client:
+        response = client.post("/api/auth/login", json={
+            "username": "admin", "password": ADMIN_PASSWORD})
+        response.raise_for_status()
+
+        ids = {}
+        bodies = {}
+        for name, (path, body) in FIXTURES.items():
+            response = client.post(path, json=body)
+            response.raise_for_status()
+            ids[name] = response.json()["id"]
+            bodies[path.rstrip("/")] = UPDATES.get(path.rstrip("/"), body)
+        for method, template in SETUP:
+            client.request(method, template.format(**ids)).raise_for_status()
+
+        print(f"{'route':48} {'queries':>7} {'budget':>6} {'db ms':>7} "
+              f"{'repeats':>7}")
+        for method, template, budget in QUERY_BUDGETS:
+            path = template.format(**ids)
+            response_cache.clear()
+            sitemap._sections.clear()
+            facets._index = None
+            body = bodies.get(path.rsplit("/", 1)[0]) \
+                if method == "PUT" else None
+            label = f"{method} {template}"
+            try:
+                response = assert_query_budget(client, path, budget,
+                                               method=method, json=body)
+            except QueryBudgetExceeded as exceeded:
+                response = exceeded.response
+                failures.append(f"{label}: {exceeded.queries} queries "
+                                f"(budget {budget})")
+
+            print(f"{label:48} {response.headers['X-DB-Query-Count']:>7} "
+                  f"{budget:>6} "
+                  f"{float(response.headers['X-DB-Time-Ms']):>7.2f} "
+                  f"{response.headers['X-DB-Max-Repeats']:>7}")
+
+    if failures:
+        print("\nquery budget exceeded:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nall routes within query budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""핫 라우트 쿼리 플랜 검사
+
+공개 GET 라우트를 호출하면서 실행된 SQL 을 모은 뒤 EXPLAIN 으로 플랜을 확인하고,
+큰 테이블(기본 1,000 행 이상)을 인덱스 없이 전체 스캔하는 쿼리가 있으면
+실패합니다. 인덱스를 추가/삭제하거나 라우터 쿼리를 바꾼 뒤 실행합니다.
+
+기본값은 임시 SQLite DB 에 큰 테이블을 만들어 검사합니다. 데이터가 채워진
+PostgreSQL DB 를 지정하면 시드 없이 GET 요청만 보내고 EXPLAIN (FORMAT JSON)
+결과에서 Seq Scan 을 찾습니다.
+
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --database-url postgresql://...
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import secrets
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+os.chdir(project_root)
+
+parser = argparse.ArgumentParser(description="핫 라우트 쿼리 플랜 검사")
+parser.add_argument("--database-url",
+                    help="검사할 DB (생략하면 임시 SQLite DB 를 만들어 시드)")
+parser.add_argument("--min-rows", type=int, default=1000,
+                    help="전체 스캔을 허용하지 않는 테이블의 최소 행 수")
+args = parser.parse_args()
+
+SEED = args.database_url is None
+if SEED:
+    workdir = tempfile.mkdtemp(prefix="query-plan-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/plans.db"
+else:
+    os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", secrets.token_hex(16))
+os.environ.setdefault("FRONTEND_ORIGIN", "http://localhost")
+# 수 MB 짜리 전체 목록 응답을 캐시에 저장하며 압축하는 시간은 플랜과 무관
+os.environ["COMPRESSION_MINIMUM_SIZE"] = str(2 ** 62)
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, insert, select, text
+from sqlmodel import SQLModel
+
+from app.cache import response_cache
+from app.database import async_engine, create_db_and_tables, engine
+from app.main import app
+from app.models import Award, Conference, CoverArt, Media, Publication, \
+    RepresentativeWork, ResearchArea, ResearchHighlight
+from app.routers import sitemap
+
+# 시드할 테이블별 행 수
+SEED_ROWS = {
+    Publication: 20000,
+    Award: 5000,
+    Conference: 5000,
+    Media: 5000,
+    CoverArt: 3000,
+    ResearchHighlight: 3000,
+    RepresentativeWork: 3000,
+    ResearchArea: 3000,
+}
+
+JOURNALS = ["Nature", "Science", "Nature Materials", "Nature Photonics",
+            "Light: Science & Applications", "ACS Nano", "Advanced Materials",
+            "Nano Letters", "Optica", "Laser & Photonics Reviews"]
+STATUSES = ["published", "published", "published", "in-press", "in-review",
+            "under-submission"]
+
+# 검사할 공개 GET 라우트 ({publication}, {slug}, {cursor} 는 실행 중에 채움)
+HOT_ROUTES = [
+    "/api/publications/",
+    "/api/publications/?limit=20",
+    "/api/publications/?limit=20&cursor={cursor}",
+    "/api/publications/?year=2020",
+    "/api/publications/?year_from=2018&year_to=2020&limit=20",
+    "/api/publications/?contribution=first-author&limit=20",
+    "/api/publications/?contribution=corresponding&limit=20",
+    "/api/publications/?contribution=equal-contribution&limit=20",
+    "/api/publications/?contribution=co-author&limit=20",
+    "/api/publications/?status=published&limit=20",
+    "/api/publications/?journal=Nature&journal=Science&limit=20",
+    "/api/publications/years",
+    "/api/publications/stats",
+    "/api/publications/search?q=metasurface",
+    "/api/publications/{publication}",
+    "/api/awards/",
+    "/api/conferences/",
+    "/api/cover-arts/",
+    "/api/cover-arts/?active_only=true",
+    "/api/research-highlights/?active_only=true",
+    "/api/representative-works/?active_only=true",
+    "/api/research-areas/?active_only=true",
+    "/api/research-areas/{slug}",
+    "/api/bootstrap",
+    "/api/search/sitemap.xml",
+]
+
+
+def _rows(model, count: int):
+    rng = random.Random(model.__tablename__)
+    now = datetime.utcnow()
+    for i in range(1, count + 1):
+        row = {"created_at": now, "updated_at": now - timedelta(minutes=i)}
+        if model is Publication:
+            first = rng.random() < 0.3
+            row.update(
+                number=i, title=f"Metasurface optics study {i}",
+                authors=f"Author {i % 97}, Joohoon Kim", year=str(1990 + i % 35),
+                journal=rng.choice(JOURNALS), status=rng.choice(STATUSES),
+                is_first_author=first,
+                is_corresponding_author=rng.random() < 0.2,
+                is_equal_contribution=rng.random() < 0.05,
+                contribution_type="first-author" if first else "co-author")
+        elif model is Award:
+            row.update(title=f"Award {i}", organization="KSME",
+                       location="Korea", year=str(1990 + i % 35))
+        elif model is Conference:
+            row.update(title=f"Talk {i}", conference_name="CLEO",
+                       location="USA", presentation_type="Oral",
+                       date=f"{1990 + i % 35}-{1 + i % 12:02d}")
+        elif model is Media:
+            row.update(title=f"News {i}", source="Press",
+                       date=f"{1990 + i % 35}-{1 + i % 12:02d}-01")
+        else:
+            row.update(order_index=i, is_active=i % 20 == 0,
+                       image_path=f"/static/uploads/{i}.jpg")
+            if model is CoverArt:
+                row.update(journal=rng.choice(JOURNALS))
+            elif model is RepresentativeWork:
+                row.update(title=f"Work {i}", journal=rng.choice(JOURNALS))
+            elif model is ResearchArea:
+                row.pop("image_path")
+                row.update(title=f"Area {i}", slug=f"area-{i}",
+                           description="## Overview")
+        columns = model.__table__.c
+        yield {key: value for key, value in row.items() if key in columns}
+
+
+def seed():
+    create_db_and_tables()
+    with engine.begin() as connection:
+        for model, count in SEED_ROWS.items():
+            connection.execute(insert(model.__table__), list(_rows(model, count)))
+        # 플래너가 실제 분포를 보도록 통계 갱신
+        connection.execute(text("ANALYZE"))
+
+
+class StatementRecorder:
+    """비동기 엔진에서 실행된 SQL 을 라우트별로 수집"""
+
+    def __init__(self):
+        self.statements = None
+
+    def __call__(self, conn, cursor, statement, parameters, context,
+                 executemany):
+        if self.statements is not None and \
+                statement.lstrip().upper().startswith("SELECT"):
+            self.statements.setdefault(statement, parameters)
+
+
+SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+def _sqlite_full_scans(plan_rows):
+    details = [row[3] for row in plan_rows]
+    tables = [match.group(1) for match in map(SQLITE_FULL_SCAN.match, details)
+              if match]
+    return tables, details
+
+
+def _postgres_full_scans(plan):
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    tables, nodes = [], [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan":
+            tables.append(node["Relation Name"])
+        nodes.extend(node.get("Plans", ()))
+    return tables, [json.dumps(plan, indent=1)]
+
+
+async def inspect(routes):
+    """테이블별 행 수와 라우트별 (경로, SQL, 전체 스캔 테이블, 플랜) 목록"""
+    results = []
+    try:
+        async with async_engine.connect() as connection:
+            sizes = {name: await connection.scalar(
+                         select(func.count()).select_from(table))
+                     for name, table in SQLModel.metadata.tables.items()}
+            postgres = connection.dialect.name == "postgresql"
+            prefix = "EXPLAIN (FORMAT JSON) " if postgres \
+                else "EXPLAIN QUERY PLAN "
+            for path, statements in routes:
+                for statement, parameters in statements.items():
+                    result = await connection.exec_driver_sql(
+                        prefix + statement, parameters)
+                    if postgres:
+                        tables, plan = _postgres_full_scans(result.scalar())
+                    else:
+                        tables, plan = _sqlite_full_scans(result.all())
+                    results.append((path, statement, tables, plan))
+    finally:
+        # 풀에 남은 커넥션의 드라이버 스레드가 종료를 막지 않도록 정리
+        await async_engine.dispose()
+    return sizes, results
+
+
+def main():
+    if SEED:
+        seed()
+
+    recorder = StatementRecorder()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", recorder)
+    routes = []
+    with TestClient(app, base_url="https://testserver") as client:
+        first = client.get("/api/publications/?limit=20")
+        first.raise_for_status()
+        slugs = client.get("/api/research-areas/?active_only=true").json()
+        values = {"publication": first.json()[0]["id"],
+                  "cursor": first.headers.get("X-Next-Cursor", ""),
+                  "slug": slugs[0]["slug"] if slugs else "design"}
+
+        for template in HOT_ROUTES:
+            path = template.format(**values)
+            response_cache.clear()
+            sitemap._sections.clear()
+            recorder.statements = {}
+            client.get(path).raise_for_status()
+            routes.append((path, recorder.statements))
+            recorder.statements = None
+
+    sizes, results = asyncio.run(inspect(routes))
+    large = {name for name, rows in sizes.items() if rows >= args.min_rows}
+
+    failures = []
+    print(f"{'route':62} {'queries':>7} result")
+    for path, statements in routes:
+        scans = [(statement, tables, plan)
+                 for route, statement, tables, plan in results
+                 if route == path and large.intersection(tables)]
+        print(f"{path:62} {len(statements):>7} "
+              f"{'SEQ SCAN' if scans else 'ok'}")
+        failures.extend((path, statement, plan)
+                        for statement, _, plan in scans)
+
+    if failures:
+        print(f"\nfull table scans on tables with >= {args.min_rows} rows:")
+        for path, statement, plan in failures:
+            print(f"\n{path}\n  {' '.join(statement.split())}")
+            for line in plan:
+                print(f"    {line}")
+        sys.exit(1)
+    print("\nno full table scans on large tables")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""업로드 라우트의 크기 제한 검사
+
+``@accepts_uploads`` 가 붙은 라우트마다 파일당 한도(max_bytes)보다 1 바이트 큰
+파일 하나를 chunked 로 보내고, 본문을 끝까지 보내기 전에 413 이 오는지
+확인합니다. 핸들러는 폼 본문을 모두 받은 뒤에야 실행되므로, 본문이 남은 채로
+(unread > 0) 413 이 오면 핸들러 전에 거절된 것입니다.
+
+    python scripts/check_upload_limits.py
+"""
+import os
+import secrets
+import sys
+import tempfile
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+os.chdir(project_root)
+
+workdir = tempfile.mkdtemp(prefix="upload-limits-")
+ADMIN_PASSWORD = secrets.token_hex(8)
+os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/limits.db"
+os.environ.setdefault("SECRET_KEY", secrets.token_hex(16))
+os.environ.setdefault("FRONTEND_ORIGIN", "http://localhost")
+os.environ["ADMIN_USERNAME"] = "admin"
+
+from passlib.context import CryptContext
+
+os.environ["ADMIN_PASSWORD_HASH"] = CryptContext(schemes=["bcrypt"]).hash(
+    ADMIN_PASSWORD)
+
+import asyncio
+
+import httpx
+from fastapi.routing import APIRoute
+
+from app.main import app
+
+BOUNDARY = "upload-limit-check"
+CHUNK_SIZE = 64 * 1024
+
+
+def upload_routes():
+    for route in app.routes:
+        policy = getattr(getattr(route, "endpoint", None), "upload_policy",
+                         None)
+        if isinstance(route, APIRoute) and policy is not None:
+            field = next(param.alias for param in route.dependant.body_params)
+            yield route.path, field, policy
+
+
+class OversizedPart:
+    """파일 하나짜리 multipart 본문 (보낸 바이트 수 기록)"""
+
+    def __init__(self, field: str, size: int):
+        self.field = field
+        self.size = size
+        self.sent = 0
+        self.total = 0
+
+    async def __aiter__(self):
+        head = (f"--{BOUNDARY}\r\nContent-Disposition: form-data; "
+                f"name=\"{self.field}\"; filename=\"large.png\"\r\n"
+                f"Content-Type: image/png\r\n\r\n").encode()
+        tail = f"\r\n--{BOUNDARY}--\r\n".encode()
+        self.total = len(head) + self.size + len(tail)
+        # ASGITransport 는 앱이 receive 할 때마다 한 청크씩 가져감
+        yield self._count(head)
+        remaining = self.size
+        while remaining:
+            chunk = min(CHUNK_SIZE, remaining)
+            remaining -= chunk
+            yield self._count(b"\0" * chunk)
+        yield self._count(tail)
+
+    def _count(self, data: bytes) -> bytes:
+        self.sent += len(data)
+        return data
+
+
+async def check() -> list:
+    failures = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport,
+                                 base_url="https://testserver") as client:
+        response = await client.post("/api/auth/login", json={
+            "username": "admin", "password": ADMIN_PASSWORD})
+        response.raise_for_status()
+
+        print(f"{'route':48} {'max MB':>7} {'status':>6} {'unread B':>9}")
+        for path, field, policy in upload_routes():
+            body = OversizedPart(field, policy.max_bytes + 1)
+            response = await client.post(path, content=body, headers={
+                "Content-Type": f"multipart/form-data; boundary={BOUNDARY}"})
+            print(f"{path:48} {policy.max_bytes / 1024 / 1024:>7.2f} "
+                  f"{response.status_code:>6} {body.total - body.sent:>9}")
+            if response.status_code != 413:
+                failures.append(f"{path}: {response.status_code} "
+                                f"(expected 413)")
+            elif body.sent >= body.total:
+                failures.append(f"{path}: whole body read before 413")
+    return failures
+
+
+def main():
+    failures = asyncio.run(check())
+    if failures:
+        print("\nupload limit not enforced:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nall upload routes reject an oversized part early")
+
+
+if __name__ == "__main__":
+    main()
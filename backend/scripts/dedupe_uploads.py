@@ -0,0 +1,169 @@
+"""업로드 저장소 정리: 중복 파일 병합 + 등록 + 참조 수 계산
+
+타임스탬프 파일명으로 저장하던 때의 업로드를 내용 해시 이름
+(``<sha256><확장자>``)으로 바꾸면서 같은 내용의 파일은 하나만 남깁니다.
+DB 의 경로/마크다운 참조도 새 경로로 바꾸고, ``uploadedfile`` 등록과 참조 수
+계산까지 한 번에 처리합니다. 여러 번 실행해도 안전합니다.
+
+순서: 새 이름으로 하드 링크 생성 -> DB 갱신(한 트랜잭션) -> 옛 파일 삭제
+(도중에 실패해도 DB 가 가리키는 파일은 항상 남아 있음)
+
+    python scripts/dedupe_uploads.py --dry-run
+    python scripts/dedupe_uploads.py
+"""
+import argparse
+import hashlib
+import mimetypes
+import os
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from sqlalchemy import delete, select, update
+
+from app.database import create_db_and_tables, engine
+from app.models import UploadedFile
+from app.upload_store import REFERENCE_COLUMNS, URL_PREFIX, \
+    iter_store_files, recount_references, register_files, \
+    replace_markdown_urls, store_path
+from app.uploads import CHUNK_SIZE, UPLOAD_ROOT, link_upload
+
+
+def file_digest(path: Path) -> Tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _rewrite_url(url: str, renames: Dict[str, str]) -> str:
+    """URL 형태(/static/..., static/..., 절대 URL)는 유지하고 경로만 교체"""
+    path = store_path(url)
+    if path not in renames:
+        return url
+    new = URL_PREFIX + renames[path]
+    if "://" in url:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}/{new}"
+    return f"/{new}" if url.lstrip().startswith("/") else new
+
+
+def rewrite_references(connection, renames: Dict[str, str]) -> int:
+    """콘텐츠 행의 옛 업로드 경로를 새 경로로 바꾸고 바뀐 행 수를 반환"""
+    changed = 0
+    now = datetime.utcnow()
+    for model, columns in REFERENCE_COLUMNS.items():
+        table = model.__table__
+        names = [column for column, _ in columns]
+        rows = connection.execute(
+            select(table.c.id, *(table.c[name] for name in names))).all()
+        for row in rows:
+            values = {}
+            for value, (name, markdown) in zip(row[1:], columns):
+                if not value:
+                    continue
+                if markdown:
+                    new = replace_markdown_urls(
+                        value, lambda url: _rewrite_url(url, renames))
+                else:
+                    new = _rewrite_url(value, renames)
+                if new != value:
+                    values[name] = new
+            if not values:
+                continue
+            # 응답 캐시/사이트맵이 변경을 알 수 있도록 updated_at 갱신
+            if "updated_at" in table.c:
+                values["updated_at"] = now
+            connection.execute(
+                update(table).where(table.c.id == row[0]).values(**values))
+            changed += 1
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="업로드 중복 파일 병합 + 저장소 등록 + 참조 수 계산")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="변경하지 않고 계획만 출력")
+    args = parser.parse_args()
+
+    create_db_and_tables()
+
+    files = {}
+    for path, file in iter_store_files():
+        files[path] = (file, *file_digest(file))
+
+    # (디렉토리, 해시, 확장자) 가 같으면 한 파일로 병합
+    renames: Dict[str, str] = {}
+    groups = defaultdict(list)
+    for path, (file, digest, _) in files.items():
+        directory = os.path.dirname(path)
+        canonical = os.path.join(directory,
+                                 f"{digest}{file.suffix.lower()}")
+        groups[canonical].append(path)
+        if path != canonical:
+            renames[path] = canonical
+
+    reclaimed = 0
+    for canonical, paths in sorted(groups.items()):
+        if paths == [canonical]:
+            continue
+        print(f"🔗 {canonical}")
+        for path in paths:
+            print(f"     <- {path}")
+        reclaimed += files[paths[0]][2] * (len(paths) - 1)
+    print(f"📊 파일 {len(files)}개 -> {len(groups)}개, "
+          f"{reclaimed / 1024 / 1024:.1f} MB 절약")
+    if args.dry_run:
+        with engine.connect() as connection:
+            print(f"📝 경로를 바꿀 콘텐츠 행 "
+                  f"{rewrite_references(connection, renames)}개")
+            connection.rollback()
+        return
+
+    # 1) 새 이름 생성 (옛 파일은 DB 갱신이 끝날 때까지 유지)
+    for canonical, paths in groups.items():
+        target = UPLOAD_ROOT / canonical
+        if not target.exists():
+            link_upload(files[paths[0]][0], target)
+
+    # 2) 참조 경로 교체 + 등록 + 참조 수 계산
+    now = datetime.utcnow()
+    table = UploadedFile.__table__
+    with engine.begin() as connection:
+        changed = rewrite_references(connection, renames)
+        if renames:
+            connection.execute(delete(table).where(
+                table.c.path.in_(list(renames))))
+        rows = [{
+            "path": canonical, "sha256": files[paths[0]][1],
+            "size": files[paths[0]][2],
+            "content_type": mimetypes.guess_type(canonical)[0],
+            "ref_count": 0, "created_at": now, "updated_at": now,
+        } for canonical, paths in groups.items()]
+        if rows:
+            connection.execute(register_files(connection.dialect.name, rows))
+        recount_references(connection)
+        unused = connection.scalar(
+            select(table.c.id).where(table.c.ref_count == 0).limit(1))
+
+    # 3) 옛 파일 삭제
+    for path in renames:
+        (UPLOAD_ROOT / path).unlink(missing_ok=True)
+    print(f"✅ 콘텐츠 행 {changed}개 경로 갱신, 옛 파일 {len(renames)}개 정리")
+    if unused is not None:
+        print("ℹ️  참조되지 않는 파일이 있습니다 (ref_count = 0)")
+
+
+if __name__ == "__main__":
+    main()
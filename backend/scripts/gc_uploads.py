@@ -0,0 +1,64 @@
+"""참조되지 않는 업로드 파일 정리 (격리 또는 삭제)
+
+cron 등에서 주기적으로 실행합니다. 관리자 API (POST /api/admin/uploads/gc) 도
+같은 작업을 실행합니다. 자세한 규칙은 app/upload_gc.py 참고.
+
+    python scripts/gc_uploads.py --dry-run
+    python scripts/gc_uploads.py                  # 격리 (.upload-quarantine/)
+    python scripts/gc_uploads.py --delete --grace-hours 72
+"""
+import argparse
+import os
+import sys
+from datetime import timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from app.database import create_db_and_tables, engine
+from app.upload_gc import GRACE_PERIOD, QUARANTINE_RETENTION, collect_garbage
+
+
+def _megabytes(size: int) -> str:
+    return f"{size / 1024 / 1024:.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="참조되지 않는 업로드 파일 정리")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="변경하지 않고 정리 대상만 출력")
+    parser.add_argument("--delete", action="store_true",
+                        help="격리하지 않고 바로 삭제")
+    parser.add_argument("--grace-hours", type=float,
+                        default=GRACE_PERIOD.total_seconds() / 3600,
+                        help="이보다 최근에 업로드/변경된 파일은 남김")
+    parser.add_argument("--retention-days", type=float,
+                        default=QUARANTINE_RETENTION.days,
+                        help="이보다 오래된 격리 묶음은 삭제")
+    args = parser.parse_args()
+
+    create_db_and_tables()
+    result = collect_garbage(engine, grace=timedelta(hours=args.grace_hours),
+                             delete_files=args.delete,
+                             retention=timedelta(days=args.retention_days),
+                             dry_run=args.dry_run)
+
+    print(f"📂 파일 {result.scanned_files}개 ({_megabytes(result.scanned_bytes)}), "
+          f"참조 {result.referenced_files}개, 유예 기간 안 {result.recent_files}개, "
+          f"이름 때문에 건너뜀 {result.skipped_files}개")
+    action = "삭제" if args.delete else "격리"
+    for path in result.orphaned:
+        print(f"   🗑️  {path}")
+    prefix = "(dry-run) " if args.dry_run else ""
+    print(f"{prefix}{action} {len(result.orphaned)}개 "
+          f"({_megabytes(result.orphaned_bytes)})")
+    if result.quarantine:
+        print(f"   -> {result.quarantine}")
+    if result.purged_batches:
+        print(f"{prefix}보관 기간이 지난 격리 묶음 {len(result.purged_batches)}개 삭제")
+    print(f"✅ {prefix}회수한 용량 {_megabytes(result.bytes_reclaimed)}")
+
+
+if __name__ == "__main__":
+    main()
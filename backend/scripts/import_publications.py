@@ -0,0 +1,68 @@
+"""BibTeX/RIS 파일에서 출판물 일괄 가져오기
+
+DOI 또는 정규화한 제목이 이미 있는 항목은 건너뛰고, 나머지를 여러 행 INSERT 로
+한 트랜잭션에 기록합니다 (관리자 API ``POST /api/publications/import`` 와 동일).
+
+    python scripts/import_publications.py publications.bib
+    python scripts/import_publications.py a.bib b.ris --dry-run
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from app.database import AsyncSessionLocal, async_engine, \
+    create_db_and_tables
+from app.publication_import import ImportFormatError, ImportResult, \
+    import_publications, parse_file
+
+
+async def _import(result: ImportResult, dry_run: bool) -> ImportResult:
+    try:
+        async with AsyncSessionLocal() as db:
+            return await import_publications(db, result, dry_run=dry_run)
+    finally:
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="BibTeX/RIS 파일에서 출판물 일괄 가져오기")
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--dry-run", action="store_true",
+                        help="기록하지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    create_db_and_tables()
+    result = ImportResult()
+    for path in args.files:
+        try:
+            with path.open(encoding="utf-8-sig", errors="replace") as lines:
+                parse_file(lines, path.name, result)
+        except ImportFormatError as e:
+            print(f"❌ {path}: {e}")
+            sys.exit(1)
+
+    result = asyncio.run(_import(result, args.dry_run))
+
+    for duplicate in result.duplicates:
+        print(f"⏭️  중복 ({duplicate['match']}): {duplicate['title']}")
+    for error in result.errors:
+        print(f"❌ {error['file']}:{error['line']}: {error['error']} "
+              f"({error['title'] or '-'})")
+    action = "추가 예정" if args.dry_run else "추가"
+    print(f"📊 {result.parsed}개 항목 중 {len(result.records)}개 {action}, "
+          f"중복 {len(result.duplicates)}개, 오류 {len(result.errors)}개")
+    if args.dry_run:
+        for record in result.records:
+            print(f"   #{record['number']} {record['year']} "
+                  f"{record['title']} ({record['contribution_type']})")
+
+
+if __name__ == "__main__":
+    main()
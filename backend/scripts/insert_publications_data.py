@@ -8,35 +8,7 @@ sys.path.append(project_root)
 from sqlmodel import Session
 from app.database import engine, create_db_and_tables, test_db_connection
 from app.models import Publication
-
-
-def parse_authors_contribution(authors_str):
-    """저자 문자열에서 기여도 정보를 파싱"""
-    is_first_author = False
-    is_corresponding = False
-    is_equal_contribution = False
-
-    # Joohoon Kim이 first author인지 확인
-    if authors_str.startswith("Joohoon Kim"):
-        is_first_author = True
-    elif "Joohoon Kim*" in authors_str:
-        is_equal_contribution = True
-
-    # Corresponding author 확인 (+표시)
-    if "Junsuk Rho+" in authors_str:
-        is_corresponding = True
-
-    # Contribution type 결정
-    if is_first_author:
-        contribution_type = "first-author"
-    elif is_corresponding:
-        contribution_type = "corresponding"
-    elif is_equal_contribution:
-        contribution_type = "equal-contribution"
-    else:
-        contribution_type = "co-author"
-
-    return is_first_author, is_corresponding, is_equal_contribution, contribution_type
+from app.publication_import import parse_authors_contribution
 
 
 def get_db_session():
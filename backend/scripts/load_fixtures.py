@@ -0,0 +1,279 @@
+"""YAML/JSON 픽스처를 테이블별로 upsert
+
+파일 이름(확장자 제외)이 테이블 이름이고, 내용은 행 목록 또는
+``{"key": [...], "rows": [...]}`` 입니다. key 를 생략하면 기본 키(id)로 맞춥니다.
+key 는 기본 키이거나 unique 제약/인덱스가 있는 컬럼이어야 합니다.
+
+- 기존 행을 key 로 한 번에 조회해 새 행/바뀐 행/그대로인 행을 나눈 뒤,
+  새 행과 바뀐 행만 ``INSERT ... ON CONFLICT DO UPDATE`` 로 묶어서 실행
+- 픽스처에 적은 컬럼만 갱신하고, 바뀐 행은 updated_at 을 현재 시각으로 올림
+  (응답 캐시/필터 인덱스의 변경 지문이 바뀌도록)
+- 전체를 한 트랜잭션으로 처리하므로 다시 실행해도 결과가 같음
+
+    python scripts/load_fixtures.py fixtures
+    python scripts/load_fixtures.py fixtures/award.yaml --dry-run
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import yaml
+from pydantic_core import PydanticUndefined
+from sqlalchemy import Date, DateTime, Table, UniqueConstraint, select, text, \
+    tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from app.database import create_db_and_tables, engine
+from app.models import Publication
+from app.search import deferred_search_index
+from app.upload_store import recount_references, sync_image_metadata
+
+# 한 번에 조회/실행할 행 수
+BATCH_SIZE = 1000
+FIXTURE_SUFFIXES = (".yaml", ".yml", ".json")
+
+INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class FixtureError(ValueError):
+    """픽스처 형식/내용 오류"""
+
+
+@dataclass
+class Fixture:
+    path: Path
+    table: Table
+    model: type
+    key: List[str]
+    rows: List[Dict[str, Any]]
+
+
+@dataclass
+class LoadResult:
+    table: str
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+
+def _models() -> Dict[str, type]:
+    return {mapper.local_table.name: mapper.class_
+            for mapper in SQLModel._sa_registry.mappers}
+
+
+def _unique_keys(table: Table) -> List[set]:
+    keys = [{column.name for column in table.primary_key}]
+    keys += [{column.name for column in constraint.columns}
+             for constraint in table.constraints
+             if isinstance(constraint, UniqueConstraint)]
+    keys += [{column.name for column in index.columns}
+             for index in table.indexes if index.unique]
+    keys += [{column.name} for column in table.columns if column.unique]
+    return keys
+
+
+def _parsers(table: Table) -> Dict[str, Any]:
+    """JSON 에서는 문자열로 오는 날짜 컬럼의 변환 함수"""
+    parsers = {}
+    for column in table.columns:
+        if isinstance(column.type, DateTime):
+            parsers[column.name] = datetime.fromisoformat
+        elif isinstance(column.type, Date):
+            parsers[column.name] = date.fromisoformat
+    return parsers
+
+
+def read_fixture(path: Path) -> Fixture:
+    models_by_table = _models()
+    name = path.stem
+    if name not in models_by_table:
+        raise FixtureError(f"{path}: 알 수 없는 테이블 '{name}'")
+    model = models_by_table[name]
+    table = model.__table__
+
+    with path.open(encoding="utf-8") as f:
+        content = json.load(f) if path.suffix == ".json" else yaml.safe_load(f)
+    if isinstance(content, dict):
+        key, rows = content.get("key"), content.get("rows")
+    else:
+        key, rows = None, content
+    key = [key] if isinstance(key, str) else \
+        key or [column.name for column in table.primary_key]
+    if not isinstance(rows, list):
+        raise FixtureError(f"{path}: 행 목록이 없습니다")
+    if set(key) not in _unique_keys(table):
+        raise FixtureError(
+            f"{path}: key {key} 에 unique 제약이 없어 ON CONFLICT 를 쓸 수 없습니다")
+
+    for number, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            raise FixtureError(f"{path}: {number}번째 행이 매핑이 아닙니다")
+        unknown = set(row) - set(table.c.keys())
+        if unknown:
+            raise FixtureError(
+                f"{path}: {number}번째 행에 없는 컬럼 {sorted(unknown)}")
+        missing = [column for column in key if row.get(column) is None]
+        if missing:
+            raise FixtureError(f"{path}: {number}번째 행에 key {missing} 없음")
+    for name, parse in _parsers(table).items():
+        for row in rows:
+            if isinstance(row.get(name), str):
+                row[name] = parse(row[name])
+    return Fixture(path, table, model, key, rows)
+
+
+def _default(fixture: Fixture, name: str) -> Any:
+    """모델 기본값 (default_factory 포함, 기본값이 없으면 None)"""
+    field = fixture.model.model_fields.get(name)
+    if field is None or (field.default is PydanticUndefined
+                         and field.default_factory is None):
+        return None
+    return field.get_default(call_default_factory=True)
+
+
+def _chunks(items: List, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def load_fixture(connection: Connection, fixture: Fixture,
+                 dry_run: bool = False) -> LoadResult:
+    table, key = fixture.table, fixture.key
+    result = LoadResult(table.name)
+    if not fixture.rows:
+        return result
+
+    # 파일 안의 모든 컬럼을 모든 행에 채움 (행에 없으면 모델 기본값)
+    columns = list(dict.fromkeys(name for row in fixture.rows for name in row))
+    for name in columns:
+        default = _default(fixture, name)
+        for row in fixture.rows:
+            row.setdefault(name, default)
+    # 픽스처에 없는 컬럼은 새 행에만 기본값으로 넣음 (id 는 DB 가 채움)
+    defaults = {name: _default(fixture, name) for name in table.c.keys()
+                if name not in columns and not table.c[name].primary_key}
+    compared = [name for name in columns if name not in key]
+    touch = "updated_at" in table.c and "updated_at" not in columns
+
+    statement = INSERTS[connection.dialect.name](table)
+    update = {name: statement.excluded[name] for name in compared}
+    if touch:
+        update["updated_at"] = statement.excluded["updated_at"]
+    statement = statement.on_conflict_do_update(index_elements=key,
+                                                set_=update) \
+        if update else statement.on_conflict_do_nothing(index_elements=key)
+    key_columns = tuple_(*(table.c[name] for name in key))
+
+    for batch in _chunks(fixture.rows, BATCH_SIZE):
+        keys = [tuple(row[name] for name in key) for row in batch]
+        existing = {
+            tuple(found[:len(key)]): tuple(found[len(key):])
+            for found in connection.execute(
+                select(*(table.c[name] for name in key + compared))
+                .where(key_columns.in_(keys)))
+        }
+        writes = []
+        for row_key, row in zip(keys, batch):
+            if row_key not in existing:
+                result.inserted += 1
+                writes.append({**defaults, **row})
+            elif existing[row_key] != tuple(row[name] for name in compared):
+                result.updated += 1
+                writes.append({**defaults, **row})
+            else:
+                result.unchanged += 1
+        if writes and not dry_run:
+            connection.execute(statement, writes)
+    return result
+
+
+def _sync_sequence(connection: Connection, table: Table) -> None:
+    """id 를 직접 넣은 뒤 PostgreSQL 시퀀스를 max(id) 로 맞춤"""
+    if connection.dialect.name != "postgresql" or "id" not in table.c \
+            or not table.c.id.autoincrement:
+        return
+    connection.execute(
+        text(f"SELECT setval(pg_get_serial_sequence(:table, 'id'), "
+             f"coalesce(max(id), 0) + 1, false) FROM {table.name}"),
+        {"table": table.name})
+
+
+def fixture_paths(paths: Sequence[Path]) -> List[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files += sorted(child for child in path.iterdir()
+                            if child.suffix in FIXTURE_SUFFIXES)
+        else:
+            files.append(path)
+    return files
+
+
+def load_fixtures(paths: Sequence[Path],
+                  dry_run: bool = False) -> List[LoadResult]:
+    """픽스처 파일들을 외래 키 순서대로 한 트랜잭션에서 upsert"""
+    fixtures = [read_fixture(path) for path in fixture_paths(paths)]
+    order = {table: position for position, table in
+             enumerate(SQLModel.metadata.sorted_tables)}
+    fixtures.sort(key=lambda fixture: order[fixture.table])
+
+    results = []
+    with engine.begin() as connection:
+        for fixture in fixtures:
+            # 출판물은 행마다 검색 색인을 갱신하지 않고 끝난 뒤 한 번에 색인
+            if fixture.table is Publication.__table__ and not dry_run:
+                with deferred_search_index(connection):
+                    result = load_fixture(connection, fixture)
+            else:
+                result = load_fixture(connection, fixture, dry_run=dry_run)
+            if (result.inserted or result.updated) and not dry_run:
+                _sync_sequence(connection, fixture.table)
+            results.append(result)
+        # Core upsert 는 ORM flush 를 거치지 않으므로 업로드 참조 수와
+        # 이미지 메타데이터를 다시 계산
+        if not dry_run and any(result.inserted or result.updated
+                               for result in results):
+            recount_references(connection)
+            sync_image_metadata(connection)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YAML/JSON 픽스처 upsert")
+    parser.add_argument("paths", nargs="+", type=Path,
+                        help="픽스처 파일 또는 디렉토리 (<테이블>.yaml/.json)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="기록하지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    create_db_and_tables()
+    started = time.perf_counter()
+    try:
+        results = load_fixtures(args.paths, dry_run=args.dry_run)
+    except FixtureError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    print(f"{'table':24} {'inserted':>9} {'updated':>9} {'unchanged':>9}")
+    for result in results:
+        print(f"{result.table:24} {result.inserted:>9} {result.updated:>9} "
+              f"{result.unchanged:>9}")
+    action = "확인" if args.dry_run else "반영"
+    print(f"📊 {len(results)}개 테이블 {action} ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
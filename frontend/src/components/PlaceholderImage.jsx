@@ -0,0 +1,31 @@
+import React, {useState} from 'react';
+
+// 업로드 때 계산된 크기/대표 색/저화질 미리보기로 이미지 자리를 먼저 채움
+// item: image_path, image_width, image_height, image_color, image_placeholder
+const PlaceholderImage = ({item, alt, className = "", style, ...props}) => {
+  const [loaded, setLoaded] = useState(false);
+
+  const placeholderStyle = loaded ? {} : {
+    backgroundColor: item.image_color || undefined,
+    backgroundImage: item.image_placeholder
+        ? `url("${item.image_placeholder}")` : undefined,
+    backgroundSize: "cover",
+    backgroundPosition: "center",
+  };
+
+  return (
+      <img
+          src={item.image_path}
+          alt={alt}
+          width={item.image_width || undefined}
+          height={item.image_height || undefined}
+          decoding="async"
+          onLoad={() => setLoaded(true)}
+          className={className}
+          style={{...placeholderStyle, ...style}}
+          {...props}
+      />
+  );
+};
+
+export default PlaceholderImage;
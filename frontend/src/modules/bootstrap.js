@@ -0,0 +1,41 @@
+/**
+ * 홈 화면 첫 렌더링에 필요한 데이터를 /api/bootstrap 한 번의 요청으로 가져옵니다.
+ * 여러 섹션이 동시에 호출해도 요청은 한 번만 나가도록 Promise 를 공유합니다.
+ * 공유한 결과는 BOOTSTRAP_TTL 이 지나거나 관리자 저장 후 clearBootstrap() 을
+ * 호출하면 다시 요청합니다.
+ */
+const BOOTSTRAP_TTL = 5 * 60 * 1000;
+
+let bootstrapPromise = null;
+let loadedAt = 0;
+
+export function clearBootstrap() {
+  bootstrapPromise = null;
+}
+
+export function loadBootstrap() {
+  if (bootstrapPromise && Date.now() - loadedAt > BOOTSTRAP_TTL) {
+    clearBootstrap();
+  }
+  if (!bootstrapPromise) {
+    loadedAt = Date.now();
+    const promise = fetch('/api/bootstrap')
+    .then(res => {
+      if (!res.ok) {
+        throw new Error(`bootstrap failed: ${res.status}`);
+      }
+      return res.json();
+    })
+    .catch(error => {
+      // 실패한 경우 다음 호출에서 다시 시도
+      if (bootstrapPromise === promise) {
+        clearBootstrap();
+      }
+      throw error;
+    });
+    bootstrapPromise = promise;
+  }
+  return bootstrapPromise;
+}
+
+export default loadBootstrap;
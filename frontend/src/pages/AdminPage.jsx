@@ -6,6 +6,7 @@ import ResearchAreasTab from "./admin/ResearchAreasTab.jsx";
 import PublicationsTab from "./admin/PublicationsTab.jsx";
 import CoverArtsTab from "./admin/CoverArtsTab.jsx";
 import ResearchHighlightsTab from "./admin/ResearchHighlightsTab.jsx";
+import {clearBootstrap} from '../modules/bootstrap';
 
 function AdminPage() {
   const [representativeWorks, setRepresentativeWorks] = useState([]);
@@ -58,6 +59,12 @@ function AdminPage() {
     }
   };
 
+  // 저장 후: 홈 화면이 이전 데이터를 쓰지 않도록 공유 bootstrap 도 비움
+  const handleUpdate = () => {
+    clearBootstrap();
+    return loadData();
+  };
+
   // 세션 확인
   useEffect(() => {
     fetch("/api/auth/me", {credentials: "include"})
@@ -209,7 +216,7 @@ function AdminPage() {
           {activeTab === 'representative-works' && (
               <RepresentativeWorksTab
                   works={representativeWorks}
-                  onUpdate={loadData}
+                  onUpdate={handleUpdate}
               />
           )}
 
@@ -221,21 +228,21 @@ function AdminPage() {
           {activeTab === 'research' && (
               <ResearchAreasTab
                   areas={researchAreas}
-                  onUpdate={loadData}
+                  onUpdate={handleUpdate}
               />
           )}
 
           {activeTab === 'research-highlights' && (
               <ResearchHighlightsTab
                   items={researchHighlights}
-                  onUpdate={loadData}
+                  onUpdate={handleUpdate}
               />
           )}
 
           {activeTab === 'cover-arts' && (
               <CoverArtsTab
                   items={coverArts}
-                  onUpdate={loadData}
+                  onUpdate={handleUpdate}
               />
           )}
 
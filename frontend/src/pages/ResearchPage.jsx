@@ -1,8 +1,15 @@
 import React, {useEffect, useState} from 'react';
-import ReactMarkdown from 'react-markdown';
-import remarkGfm from 'remark-gfm';
 import {useNavigate, useParams} from 'react-router-dom';
 
+// 서버가 렌더링/정제한 본문의 외부 링크는 새 탭에서 열기
+const openExternalLink = (e) => {
+  const link = e.target.closest('a[href^="http"]');
+  if (link) {
+    e.preventDefault();
+    window.open(link.href, '_blank', 'noopener');
+  }
+};
+
 function ResearchPage() {
   const {slug} = useParams();
   const navigate = useNavigate();
@@ -11,7 +18,7 @@ function ResearchPage() {
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    fetch('/api/research-areas/')
+    fetch('/api/research-areas/?render=html')
     .then(res => res.json())
     .then(data => {
       setResearchAreas(data);
@@ -106,26 +113,14 @@ function ResearchPage() {
                       <div className="w-12 sm:w-16 h-1 bg-blue-600 mx-auto"/>
                     </div>
 
+                    {/* 마크다운은 서버에서 렌더링 (?render=html, 정제된 HTML) */}
                     <div
-                        className="prose prose-base sm:prose-lg md:prose-xl dark:prose-invert max-w-none text-left">
-                      <ReactMarkdown
-                          remarkPlugins={[remarkGfm]}
-                          components={{
-                            img: ({node, ...props}) => (
-                                <img {...props}
-                                     className="mx-auto my-4 sm:my-6 rounded shadow max-h-64 sm:max-h-96"
-                                     loading="lazy"/>
-                            ),
-                            a: ({node, ...props}) => (
-                                <a {...props}
-                                   className="text-blue-600 underline break-words"
-                                   target="_blank" rel="noopener noreferrer"/>
-                            )
-                          }}
-                      >
-                        {activeArea.description || ""}
-                      </ReactMarkdown>
-                    </div>
+                        className="prose prose-base sm:prose-lg md:prose-xl dark:prose-invert max-w-none text-left
+                        [&_img]:mx-auto [&_img]:my-4 sm:[&_img]:my-6 [&_img]:rounded [&_img]:shadow [&_img]:max-h-64 sm:[&_img]:max-h-96
+                        [&_a]:text-blue-600 [&_a]:underline [&_a]:break-words"
+                        onClick={openExternalLink}
+                        dangerouslySetInnerHTML={{__html: activeArea.html || ""}}
+                    />
                   </div>
                 </div>
               </div>
@@ -1,4 +1,5 @@
 import React, {useEffect, useState} from 'react';
+import {clearBootstrap} from '../../modules/bootstrap';
 
 // 논문 수정을 위한 폼 컴포넌트
 const PublicationForm = ({publication, onSave, onCancel}) => {
@@ -183,6 +184,7 @@ const PublicationsTab = () => {
         throw new Error(errorData.detail || 'Failed to save publication');
       }
       setEditingPublication(null);
+      clearBootstrap();
       await fetchPublications(); // 목록 새로고침
     } catch (err) {
       console.error('Save error:', err);
@@ -201,6 +203,7 @@ const PublicationsTab = () => {
         if (!response.ok) {
           throw new Error('Failed to delete publication');
         }
+        clearBootstrap();
         await fetchPublications(); // 목록 새로고침
       } catch (err) {
         console.error('Delete error:', err);
@@ -1,5 +1,6 @@
 import React, {useEffect, useState} from "react";
 import HorizontalGallery from "../../components/HorizontalGallery";
+import PlaceholderImage from "../../components/PlaceholderImage";
 import {useNavigate} from "react-router-dom";
 
 const isExternal = (href = "") =>
@@ -83,8 +84,8 @@ export default function ResearchHighlightsSection() {
                 >
                   {/* 20:13 비율 */}
                   <div style={{aspectRatio: "20 / 13"}}>
-                    <img
-                        src={item.image_path}
+                    <PlaceholderImage
+                        item={item}
                         alt={item.alt_text || item.description
                             || "Research highlight"}
                         className="w-full h-full object-cover block"
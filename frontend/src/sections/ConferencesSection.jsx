@@ -1,16 +1,16 @@
 import React, {useEffect, useState} from 'react';
 import {Link} from 'react-router-dom';
+import {loadBootstrap} from '../modules/bootstrap';
 
 function ConferencesSection() {
   const [conferences, setConferences] = useState([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    fetch('/api/conferences/')
-    .then(res => res.json())
+    loadBootstrap()
     .then(data => {
       // 최신 3개만 가져오기
-      setConferences(data.slice(0, 3));
+      setConferences(data.conferences.slice(0, 3));
       setLoading(false);
     })
     .catch(error => {
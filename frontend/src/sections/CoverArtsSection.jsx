@@ -1,6 +1,8 @@
 import React, {useEffect, useState} from "react";
 import HorizontalGallery from "../components/HorizontalGallery";
+import PlaceholderImage from "../components/PlaceholderImage";
 import {useNavigate} from "react-router-dom";
+import {loadBootstrap} from "../modules/bootstrap";
 
 const normalizeLink = (href = "") => {
   if (!href) {
@@ -53,10 +55,9 @@ export default function CoverArtsSection() {
   const {openLink, keyActivate} = useCardLink();
 
   useEffect(() => {
-    fetch("/api/cover-arts/?active_only=1")
-    .then(r => r.json())
+    loadBootstrap()
     .then(d => {
-      setItems(d || []);
+      setItems(d.cover_arts || []);
       setLoading(false);
     })
     .catch(() => setLoading(false));
@@ -105,8 +106,8 @@ export default function CoverArtsSection() {
                   >
                     {/* 3:4 비율 */}
                     <div style={{aspectRatio: "3 / 4"}}>
-                      <img
-                          src={item.image_path}
+                      <PlaceholderImage
+                          item={item}
                           alt={item.alt_text || item.description
                               || `${item.journal} cover art`}
                           className="w-full h-full object-cover block"
@@ -1,4 +1,6 @@
 import React, {useCallback, useEffect, useState} from 'react';
+import {loadBootstrap} from '../modules/bootstrap';
+import PlaceholderImage from '../components/PlaceholderImage';
 
 function HeroSection() {
   const [representativeWorks, setRepresentativeWorks] = useState([]);
@@ -9,10 +11,9 @@ function HeroSection() {
 
   // API에서 데이터 로드
   useEffect(() => {
-    fetch('/api/representative-works/')
-    .then(res => res.json())
+    loadBootstrap()
     .then(data => {
-      setRepresentativeWorks(data);
+      setRepresentativeWorks(data.representative_works);
       setLoading(false);
     })
     .catch(error => {
@@ -115,8 +116,8 @@ function HeroSection() {
                                     : 'opacity-0 scale-110'
                             }`}
                         >
-                          <img
-                              src={work.image_path}
+                          <PlaceholderImage
+                              item={work}
                               alt={work.title}
                               className="w-full h-full object-cover"
                           />
@@ -1,16 +1,16 @@
 import React, {useEffect, useState} from 'react';
 import {Link} from 'react-router-dom';
+import {loadBootstrap} from '../modules/bootstrap';
 
 function MediaSection() {
   const [mediaItems, setMediaItems] = useState([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    fetch('/api/media/')
-    .then(res => res.json())
+    loadBootstrap()
     .then(data => {
       // 최신 3개만 가져오기
-      setMediaItems(data.slice(0, 3));
+      setMediaItems(data.media.slice(0, 3));
       setLoading(false);
     })
     .catch(error => {
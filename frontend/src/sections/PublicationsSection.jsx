@@ -1,15 +1,15 @@
 import React, {useEffect, useState} from 'react';
 import {Link} from 'react-router-dom';
+import {loadBootstrap} from '../modules/bootstrap';
 
 function PublicationsSection() {
   const [publications, setPublications] = useState([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    fetch('/api/publications/?status=published')
-    .then(res => res.json())
+    loadBootstrap()
     .then(data => {
-      setPublications(data.slice(0, 4)); // 최신 4개
+      setPublications(data.publications.slice(0, 4)); // 최신 4개
       setLoading(false);
     })
     .catch(error => {
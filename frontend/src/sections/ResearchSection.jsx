@@ -1,5 +1,6 @@
 import React, {useEffect, useState} from 'react';
 import {useNavigate} from "react-router-dom"
+import {loadBootstrap} from '../modules/bootstrap';
 
 function ResearchSection() {
   const [researchAreas, setResearchAreas] = useState([]);
@@ -7,10 +8,9 @@ function ResearchSection() {
   const navigate = useNavigate();
 
   useEffect(() => {
-    fetch('/api/research-areas/')
-    .then(res => res.json())
+    loadBootstrap()
     .then(data => {
-      setResearchAreas(data);
+      setResearchAreas(data.research_areas);
       setLoading(false);
     })
     .catch(error => {